@@ -5,6 +5,13 @@ from functools import lru_cache
 class Settings(BaseSettings):
     # Anthropic
     anthropic_api_key: str = ""
+    # Anthropic 커넥션 풀 (앱 전체 공유 AsyncAnthropic 클라이언트)
+    anthropic_max_connections: int = 50
+    anthropic_max_keepalive_connections: int = 20
+    anthropic_keepalive_expiry: float = 30.0
+    anthropic_timeout: float = 600.0
+    anthropic_connect_timeout: float = 10.0
+    anthropic_max_retries: int = 2
 
     # YouTube
     youtube_api_key: str = ""
@@ -12,6 +19,12 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str = ""
     supabase_key: str = ""
+    # Supabase(PostgREST) 비동기 커넥션 풀
+    supabase_max_connections: int = 20
+    supabase_max_keepalive_connections: int = 10
+    supabase_keepalive_expiry: float = 30.0
+    supabase_timeout: float = 30.0
+    supabase_connect_timeout: float = 5.0
 
     # Backend
     backend_url: str = "http://localhost:8000"
@@ -21,6 +34,70 @@ class Settings(BaseSettings):
 
     # Tavily (출처 검색용)
     tavily_api_key: str = ""
+    # 출처 검증 동시 검색 수 / 항목별 타임아웃(초)
+    tavily_max_concurrency: int = 8
+    tavily_item_timeout: float = 20.0
+    # 쿼리 캐스케이드: 동시에 보낼 상위 쿼리 수(1이면 순차 검색) / 공유 스레드 풀 크기
+    tavily_cascade_width: int = 3
+    tavily_cascade_max_workers: int = 16
+    # Tavily 검색 결과 디스크 캐시 (성공 7일 / 실패 6시간)
+    search_cache_enabled: bool = True
+    search_cache_path: str = "cache/tavily_search.sqlite3"
+    search_cache_ttl: int = 7 * 24 * 3600
+    search_cache_negative_ttl: int = 6 * 3600
+    # 출처 재검증 백오프 (1시간부터 2배씩, 최대 7일 / 최대 시도 횟수)
+    source_verify_backoff_base: int = 3600
+    source_verify_backoff_max: int = 7 * 24 * 3600
+    source_verify_max_attempts: int = 8
+
+    # 1단계 분석 - 추정 토큰 수가 기준을 넘는 자막은 구간으로 나눠 병렬 분석 후 종합
+    stage1_single_pass_tokens: int = 12000
+    stage1_chunk_tokens: int = 6000
+    stage1_map_concurrency: int = 8
+    # 1단계 분석 전 자막 전처리 (로컬) - 추임새/반복 제거, 추출 요약 목표 토큰 수(0이면 사용 안 함)
+    transcript_precompress_enabled: bool = True
+    transcript_extractive_target_tokens: int = 0
+
+    # LLM 응답 디스크 캐시 (모델 + 템플릿 버전 + 프롬프트 + max_tokens 해시, 용량 초과 시 LRU 삭제)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = "cache/llm_responses.sqlite3"
+    llm_cache_max_bytes: int = 256 * 1024 * 1024
+
+    # 분석 결과 메모리 캐시 (LRU + TTL)
+    analysis_cache_max_entries: int = 1000
+    analysis_cache_max_bytes: int = 64 * 1024 * 1024
+    analysis_cache_ttl: int = 3600
+
+    # 자막 디스크 캐시 - 자막 목록 TTL(초), 언어 우선순위(쉼표 구분, 같은 언어는 수동 자막 우선)
+    transcript_cache_enabled: bool = True
+    transcript_cache_path: str = "cache/transcripts.sqlite3"
+    transcript_listing_ttl: int = 24 * 3600
+    transcript_language_preferences: str = "ko,en"
+
+    # 자막 요청 프록시 풀 - 프록시 URL(쉼표 구분), 프록시별 동시 요청 상한,
+    # 차단 시 격리 시간(초, 연속 실패마다 2배), 프록시 대기 시간(초), 요청당 시도 횟수
+    transcript_proxy_urls: str = ""
+    transcript_proxy_max_concurrency: int = 4
+    transcript_proxy_backoff_base: float = 30.0
+    transcript_proxy_backoff_max: float = 1800.0
+    transcript_proxy_acquire_timeout: float = 30.0
+    transcript_proxy_attempts: int = 3
+
+    # 히스토리 총 개수 캐시 갱신 주기(초)
+    history_count_ttl: int = 60
+
+    # 중복 분석 행 일회성 정리(python -m app.services.compaction) - 배치당 처리할 영상 수
+    analysis_compaction_batch_size: int = 100
+
+    # 워커 간 공유 캐시(L2) - SQLite 파일, 무효화 로그 확인 주기(초) / 보관 기간(초)
+    shared_cache_enabled: bool = True
+    shared_cache_path: str = "cache/shared_cache.sqlite3"
+    shared_cache_sync_interval: float = 1.0
+    shared_cache_log_retention: int = 24 * 3600
+
+    # 동시 요청 병합 - 워커 간 파일 락 디렉터리 / 최대 대기 시간(초)
+    single_flight_lock_dir: str = "cache/locks"
+    single_flight_wait_timeout: float = 900.0
 
     class Config:
         env_file = ".env"
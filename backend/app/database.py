@@ -1,101 +1,457 @@
-from supabase import create_client, Client
-from typing import Optional
+import asyncio
+import base64
+import copy
+import json
+import time
+import httpx
+from datetime import datetime, timezone
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
+from typing import Optional, Sequence, Tuple
 from .config import get_settings
+from .services.cache import (
+    cache_analysis_row, get_cached_analysis_row, get_cached_latest_row,
+    invalidate_analysis_row, clear_cache
+)
+from .services.single_flight import single_flight
+from .services.transcript_store import StoredTranscript, SEGMENT_COLUMNS
 
-_supabase_client: Optional[Client] = None
+# ===== analyses 컬럼 그룹 (조회 시 필요한 컬럼만 선택) =====
 
+# 응답에 항상 필요한 기본 컬럼
+CORE_COLUMNS = (
+    "id", "video_id", "video_title", "video_url", "channel_name", "thumbnail_url", "created_at",
+)
 
-def get_supabase() -> Client:
-    global _supabase_client
+# 1단계 분석 결과 컬럼
+STAGE1_COLUMNS = CORE_COLUMNS + (
+    "view_count", "like_count", "comment_count", "subscriber_count", "view_sub_ratio", "published_at",
+    "video_structure", "structure_summary", "summary", "key_message", "key_points", "quotes", "people",
+    "investment_strategy", "source_tracking", "suitability_analysis", "perspective",
+)
 
-    if _supabase_client is None:
-        settings = get_settings()
-        if not settings.supabase_url or not settings.supabase_key:
-            raise ValueError("Supabase URL and Key must be set in environment variables")
+# 용량이 큰 컬럼 (필요할 때만 조회)
+HEAVY_COLUMNS = ("critical_analysis", "additional_analysis", "transcript")
 
-        _supabase_client = create_client(
-            settings.supabase_url,
-            settings.supabase_key
-        )
+# 기본 조회 컬럼 (분석 결과 전체, 자막 원문 제외)
+RESULT_COLUMNS = STAGE1_COLUMNS + ("critical_analysis", "additional_analysis")
+
+# 행 캐시에 저장하지 않는 컬럼
+UNCACHED_COLUMNS = ("transcript",)
+
+
+def project_row(row: dict, columns: Sequence[str]) -> dict:
+    """행에서 지정한 컬럼만 추출"""
+    return {column: row[column] for column in columns if column in row}
+
+
+def cacheable_row(row: dict) -> dict:
+    """행 캐시에 저장할 형태 (자막 원문 등 제외)"""
+    return {k: v for k, v in row.items() if k not in UNCACHED_COLUMNS}
+
+
+def covers_columns(row: Optional[dict], columns: Sequence[str]) -> bool:
+    """캐시된 행이 요청 컬럼을 모두 포함하는지 확인"""
+    return row is not None and all(column in row for column in columns)
+
+
+_supabase_client: Optional[AsyncClient] = None
+_supabase_http_client: Optional[httpx.AsyncClient] = None
+_supabase_lock = asyncio.Lock()
+
+
+async def get_supabase() -> AsyncClient:
+    """공유 비동기 Supabase 클라이언트 반환 (PostgREST 요청은 공유 httpx 커넥션 풀 사용)"""
+    global _supabase_client, _supabase_http_client
+
+    if _supabase_client is not None:
+        return _supabase_client
+
+    async with _supabase_lock:
+        if _supabase_client is None:
+            settings = get_settings()
+            if not settings.supabase_url or not settings.supabase_key:
+                raise ValueError("Supabase URL and Key must be set in environment variables")
+
+            _supabase_http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.supabase_max_connections,
+                    max_keepalive_connections=settings.supabase_max_keepalive_connections,
+                    keepalive_expiry=settings.supabase_keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    settings.supabase_timeout,
+                    connect=settings.supabase_connect_timeout,
+                ),
+                follow_redirects=True,
+            )
+            _supabase_client = await acreate_client(
+                settings.supabase_url,
+                settings.supabase_key,
+                options=AsyncClientOptions(httpx_client=_supabase_http_client),
+            )
 
     return _supabase_client
 
 
+async def close_supabase() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    global _supabase_client, _supabase_http_client
+
+    if _supabase_http_client is not None:
+        await _supabase_http_client.aclose()
+    _supabase_http_client = None
+    _supabase_client = None
+
+
 async def save_analysis(analysis_data: dict) -> dict:
-    """분석 결과를 Supabase에 저장"""
-    supabase = get_supabase()
+    """
+    분석 결과를 Supabase에 저장
 
-    result = supabase.table("analyses").insert(analysis_data).execute()
+    video_id 기준 upsert - 같은 영상을 다시 분석하거나 동시에 저장해도 한 행만 유지
+    (기존 행이 있으면 id는 유지하고 전달한 컬럼만 갱신)
+    """
+    supabase = await get_supabase()
+
+    result = await supabase.table("analyses")\
+        .upsert(analysis_data, on_conflict="video_id")\
+        .execute()
 
     if result.data:
+        cache_analysis_row(cacheable_row(result.data[0]), latest=True)
+        # 추가인지 갱신인지 알 수 없으므로 총 개수는 다음 조회 때 다시 셈
+        expire_history_count()
         return result.data[0]
     raise Exception("Failed to save analysis")
 
 
-async def get_analysis_by_id(analysis_id: str) -> Optional[dict]:
-    """ID로 분석 결과 조회"""
-    supabase = get_supabase()
+async def get_analysis_by_id(analysis_id: str, columns: Sequence[str] = RESULT_COLUMNS) -> Optional[dict]:
+    """
+    ID로 분석 결과 조회 (메모리 캐시 우선, 동시 조회는 하나의 DB 요청으로 병합)
 
-    result = supabase.table("analyses").select("*").eq("id", analysis_id).execute()
+    Args:
+        analysis_id: 분석 ID
+        columns: 조회할 컬럼 (기본: 자막 원문을 제외한 분석 결과 전체)
+    """
+    cached = await get_cached_analysis_row(analysis_id)
+    if covers_columns(cached, columns):
+        return project_row(cached, columns)
 
-    if result.data:
-        return result.data[0]
-    return None
+    select_clause = ",".join(columns)
 
+    async def load(waited: bool) -> Optional[dict]:
+        supabase = await get_supabase()
 
-async def get_analysis_by_video_id(video_id: str) -> Optional[dict]:
-    """video_id로 최신 분석 결과 조회 (캐시용)"""
-    supabase = get_supabase()
+        result = await supabase.table("analyses").select(select_clause).eq("id", analysis_id).execute()
 
-    result = supabase.table("analyses")\
-        .select("*")\
-        .eq("video_id", video_id)\
-        .order("created_at", desc=True)\
-        .limit(1)\
-        .execute()
+        if result.data:
+            # 기본 컬럼 이상을 조회한 경우에만 행 캐시에 저장
+            if covers_columns(result.data[0], RESULT_COLUMNS):
+                cache_analysis_row(cacheable_row(result.data[0]))
+            return result.data[0]
+        return None
 
-    if result.data:
-        return result.data[0]
-    return None
+    row = await single_flight(f"db:analysis:{analysis_id}:{select_clause}", load, cross_worker=False)
+    # 병합된 요청끼리 같은 dict를 공유하지 않도록 복사본 반환
+    return copy.deepcopy(row)
 
 
-async def get_history(limit: int = 20, offset: int = 0) -> list:
-    """분석 히스토리 조회"""
-    supabase = get_supabase()
+async def get_analysis_by_video_id(video_id: str, columns: Sequence[str] = RESULT_COLUMNS) -> Optional[dict]:
+    """
+    video_id로 최신 분석 결과 조회 (캐시용)
 
-    result = supabase.table("analyses")\
-        .select("id, video_id, video_title, video_url, channel_name, thumbnail_url, created_at")\
-        .order("created_at", desc=True)\
-        .range(offset, offset + limit - 1)\
-        .execute()
+    Args:
+        video_id: 유튜브 영상 ID
+        columns: 조회할 컬럼 (기본: 자막 원문을 제외한 분석 결과 전체)
+    """
+    cached = await get_cached_latest_row(video_id)
+    if covers_columns(cached, columns):
+        return project_row(cached, columns)
+
+    select_clause = ",".join(columns)
+
+    async def load(waited: bool) -> Optional[dict]:
+        supabase = await get_supabase()
+
+        result = await supabase.table("analyses")\
+            .select(select_clause)\
+            .eq("video_id", video_id)\
+            .order("created_at", desc=True)\
+            .limit(1)\
+            .execute()
+
+        if result.data:
+            if covers_columns(result.data[0], RESULT_COLUMNS):
+                cache_analysis_row(cacheable_row(result.data[0]), latest=True)
+            return result.data[0]
+        return None
 
-    return result.data or []
+    row = await single_flight(f"db:video:{video_id}:{select_clause}", load, cross_worker=False)
+    return copy.deepcopy(row)
 
 
 async def delete_analysis(analysis_id: str) -> bool:
     """분석 결과 삭제"""
-    supabase = get_supabase()
+    supabase = await get_supabase()
 
-    result = supabase.table("analyses").delete().eq("id", analysis_id).execute()
+    result = await supabase.table("analyses").delete().eq("id", analysis_id).execute()
+
+    await invalidate_analysis_row(analysis_id)
+    for row in result.data or []:
+        clear_cache(row.get("video_id"))
+    adjust_history_count(-len(result.data or []))
 
     return len(result.data) > 0 if result.data else False
 
 
 async def update_analysis(analysis_id: str, update_data: dict) -> Optional[dict]:
     """분석 결과 업데이트"""
-    supabase = get_supabase()
+    supabase = await get_supabase()
 
-    result = supabase.table("analyses").update(update_data).eq("id", analysis_id).execute()
+    result = await supabase.table("analyses").update(update_data).eq("id", analysis_id).execute()
 
+    await invalidate_analysis_row(analysis_id)
     if result.data:
+        cache_analysis_row(cacheable_row(result.data[0]))
         return result.data[0]
     return None
 
 
-async def get_history_count() -> int:
-    """히스토리 총 개수 조회"""
-    supabase = get_supabase()
+async def patch_analysis_json(
+    analysis_id: str,
+    column: str,
+    patches: list,
+    perspective: Optional[str] = None
+) -> bool:
+    """
+    분석 결과 JSONB 컬럼 부분 수정 (patch_analysis_json RPC)
+
+    문서 전체를 다시 쓰지 않고 바뀐 경로의 값만 jsonb_set으로 적용한다.
+
+    Args:
+        column: source_tracking / critical_analysis / additional_analysis
+        patches: [{"path": ["hidden_premises", "0", "source_url"], "value": ...}, ...]
+        perspective: 지정하면 현재 관점이 같을 때만 수정 (관점별 저장 결과도 함께 수정)
+
+    Returns:
+        수정 여부 (행이 없거나 관점이 바뀌었으면 False)
+    """
+    supabase = await get_supabase()
+
+    result = await supabase.rpc("patch_analysis_json", {
+        "p_analysis_id": analysis_id,
+        "p_column": column,
+        "p_patches": patches,
+        "p_perspective": perspective,
+    }).execute()
+
+    await invalidate_analysis_row(analysis_id)
+    return bool(result.data)
+
+
+# ===== 전체 자막 (transcripts, zstd 압축) =====
+
+async def save_transcript(transcript_row: dict) -> None:
+    """압축된 전체 자막 저장 (transcript_store.encode_transcript 결과, video_id 기준 upsert)"""
+    supabase = await get_supabase()
+
+    await supabase.table("transcripts")\
+        .upsert(transcript_row, on_conflict="video_id")\
+        .execute()
+
+
+async def get_stored_transcript(video_id: str, with_segments: bool = False) -> Optional[StoredTranscript]:
+    """
+    저장된 전체 자막 조회
+
+    Args:
+        with_segments: 구간 시간 정보까지 조회 (기본: 텍스트만)
+    """
+    supabase = await get_supabase()
+
+    columns = ["video_id", "language_code", "is_generated", "segment_count", "text_blob"]
+    if with_segments:
+        columns.extend(SEGMENT_COLUMNS)
+
+    result = await supabase.table("transcripts")\
+        .select(",".join(columns))\
+        .eq("video_id", video_id)\
+        .limit(1)\
+        .execute()
+
+    return StoredTranscript.from_row(result.data[0]) if result.data else None
+
+
+# ===== 관점별 분석 결과 (analysis_perspectives) =====
+
+async def get_perspective_result(analysis_id: str, perspective: str) -> Optional[dict]:
+    """analysis_id + 관점의 저장된 2단계/3단계 결과 조회"""
+    supabase = await get_supabase()
+
+    result = await supabase.table("analysis_perspectives")\
+        .select("perspective, critical_analysis, additional_analysis, updated_at")\
+        .eq("analysis_id", analysis_id)\
+        .eq("perspective", perspective)\
+        .limit(1)\
+        .execute()
+
+    return result.data[0] if result.data else None
+
+
+async def save_perspective_result(analysis_id: str, perspective: str, data: dict) -> Optional[dict]:
+    """
+    analysis_id + 관점의 결과 저장 (없으면 생성, 있으면 전달한 컬럼만 갱신)
+
+    Args:
+        data: critical_analysis / additional_analysis 중 저장할 컬럼
+    """
+    supabase = await get_supabase()
+
+    payload = {
+        "analysis_id": analysis_id,
+        "perspective": perspective,
+        **data,
+        "updated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    result = await supabase.table("analysis_perspectives")\
+        .upsert(payload, on_conflict="analysis_id,perspective")\
+        .execute()
+
+    return result.data[0] if result.data else None
+
+
+# ===== 히스토리 커서 페이지네이션 =====
+
+# 히스토리 총 개수 캐시 (워커별, history_count_ttl 경과 시 백그라운드 갱신)
+_history_count = {"total": None, "estimated": False, "fetched_at": 0.0}
+_history_count_task: Optional[asyncio.Task] = None
+
+
+def encode_history_cursor(item: dict) -> str:
+    """페이지 마지막 항목 → 불투명 커서 토큰"""
+    raw = json.dumps([item["created_at"], item["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_history_cursor(cursor: str) -> Tuple[str, str]:
+    """커서 토큰 → (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, analysis_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+    return created_at, analysis_id
+
+
+def store_history_count(count: dict) -> None:
+    """RPC에서 받은 총 개수 캐시"""
+    _history_count["total"] = int(count.get("total") or 0)
+    _history_count["estimated"] = bool(count.get("estimated"))
+    _history_count["fetched_at"] = time.monotonic()
+
+
+def adjust_history_count(delta: int) -> None:
+    """저장/삭제 시 캐시된 총 개수 보정 (다음 갱신 전까지 근사치)"""
+    if _history_count["total"] is not None and delta:
+        _history_count["total"] = max(0, _history_count["total"] + delta)
+
+
+def expire_history_count() -> None:
+    """캐시된 총 개수를 만료 처리 (다음 히스토리 조회 시 백그라운드 갱신)"""
+    _history_count["fetched_at"] = 0.0
+
+
+def is_history_count_stale() -> bool:
+    settings = get_settings()
+    return time.monotonic() - _history_count["fetched_at"] >= settings.history_count_ttl
+
+
+async def refresh_history_count() -> None:
+    """총 개수 갱신 (get_history_total RPC)"""
+    supabase = await get_supabase()
+    result = await supabase.rpc("get_history_total", {}).execute()
+    if result.data:
+        store_history_count(result.data)
+
+
+def schedule_history_count_refresh() -> None:
+    """총 개수 백그라운드 갱신 등록 (진행 중이면 무시)"""
+    global _history_count_task
+
+    if _history_count_task is not None and not _history_count_task.done():
+        return
+
+    async def run():
+        try:
+            await refresh_history_count()
+        except Exception as e:
+            print(f"[History] 총 개수 갱신 오류: {e}", flush=True)
+
+    _history_count_task = asyncio.create_task(run())
+
+
+async def get_history_page(limit: int = 20, cursor: Optional[str] = None, offset: int = 0) -> dict:
+    """
+    히스토리 페이지 조회 ((created_at, id) 커서 기반)
+
+    총 개수가 캐시에 없으면 같은 RPC 요청에 포함해서 받고,
+    캐시가 오래되었으면 캐시된 값을 바로 반환하면서 백그라운드로 갱신한다.
+
+    Args:
+        limit: 페이지 크기
+        cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+        offset: cursor가 없을 때만 사용 (기존 offset 방식 호환)
+
+    Returns:
+        {"items", "next_cursor", "total", "total_estimated"}
+    """
+    params = {
+        # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+        "p_limit": limit + 1,
+        "p_with_count": _history_count["total"] is None,
+    }
+    if cursor:
+        params["p_cursor_created_at"], params["p_cursor_id"] = decode_history_cursor(cursor)
+    else:
+        params["p_offset"] = offset
+
+    supabase = await get_supabase()
+    result = await supabase.rpc("get_history_page", params).execute()
+
+    data = result.data or {}
+    if data.get("count"):
+        store_history_count(data["count"])
+    elif is_history_count_stale():
+        schedule_history_count_refresh()
+
+    items = data.get("items") or []
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    return {
+        "items": items,
+        "next_cursor": encode_history_cursor(items[-1]) if has_more else None,
+        "total": _history_count["total"] or 0,
+        "total_estimated": _history_count["estimated"],
+    }
+
+
+# ===== 중복 분석 행 정리 =====
+
+async def compact_duplicate_analyses(batch_size: int = 100) -> dict:
+    """
+    video_id 중복 행 정리 (compact_duplicate_analyses RPC, 한 번에 batch_size개 영상)
+
+    Returns:
+        {"removed": 삭제된 행 수, "video_ids": 정리된 video_id 목록}
+    """
+    supabase = await get_supabase()
+
+    result = await supabase.rpc("compact_duplicate_analyses", {"p_batch_size": batch_size}).execute()
+    data = result.data or {}
 
-    result = supabase.table("analyses").select("id", count="exact").execute()
+    # 삭제된 행이 캐시에 남지 않도록 영상 단위로 캐시 삭제
+    for video_id in data.get("video_ids") or []:
+        clear_cache(video_id)
+    adjust_history_count(-int(data.get("removed") or 0))
 
-    return result.count or 0
+    return data
@@ -1,14 +1,30 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from .config import get_settings
+from .database import close_supabase
 from .routers import youtube, history, auth, analyzer
+from .services.llm_client import close_anthropic_client
+from .services.llm_cache import set_llm_cache_bypass
+from .services.source_repair import cancel_source_repairs
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 시 백그라운드 작업 취소 + 공유 커넥션 풀 정리
+    await cancel_source_repairs()
+    await close_anthropic_client()
+    await close_supabase()
+
+
 app = FastAPI(
     title="YouTube Analyzer API",
     description="유튜브 영상 자막을 분석하여 콘텐츠 소재를 추출하는 API",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -25,6 +41,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# 요청 단위 LLM 응답 캐시 우회 (헤더 X-LLM-Cache: bypass 또는 쿼리 llm_cache=bypass)
+@app.middleware("http")
+async def llm_cache_bypass(request: Request, call_next):
+    bypass = (
+        request.headers.get("x-llm-cache", "").lower() == "bypass"
+        or request.query_params.get("llm_cache", "").lower() == "bypass"
+    )
+    set_llm_cache_bypass(bypass)
+    return await call_next(request)
+
+
 # 라우터 등록
 app.include_router(youtube.router)
 app.include_router(history.router)
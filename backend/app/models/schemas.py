@@ -323,6 +323,17 @@ class AnalyzeResponse(BaseModel):
     data: Optional[AnalysisResult] = None
     error: Optional[str] = None
     cached: bool = False  # DB 캐시에서 가져온 경우 True
+    source_repair_pending: bool = False  # 출처 URL 백그라운드 보정 진행 중이면 True
+
+
+# 분석 결과 세부 섹션 응답 (비판적 분석 / 추가 분석 / 자막 원문)
+class AnalysisSectionResponse(BaseModel):
+    success: bool
+    analysis_id: Optional[str] = None
+    perspective: Optional[str] = None
+    data: Optional[Any] = None
+    error: Optional[str] = None
+    source_repair_pending: bool = False
 
 
 # 히스토리 아이템 스키마
@@ -341,6 +352,8 @@ class HistoryListResponse(BaseModel):
     success: bool
     data: List[HistoryItem] = Field(default_factory=list)
     total: int = 0
+    total_estimated: bool = False
+    next_cursor: Optional[str] = None
     error: Optional[str] = None
 
 
@@ -1,6 +1,12 @@
 from fastapi import APIRouter
 from ..services.transcript import get_transcript, extract_video_id
 from ..services.claude import analyze_transcript
+from ..services.search_cache import get_search_cache_stats
+from ..services.transcript_cache import get_transcript_cache_stats
+from ..services.cache import get_cache_stats
+from ..services.proxy_pool import get_proxy_pool_stats
+from ..services.llm_client import get_llm_usage_stats
+from ..services.llm_cache import get_llm_cache_stats
 
 router = APIRouter(prefix="/api", tags=["analyzer"])
 
@@ -52,3 +58,25 @@ async def get_video_transcript(video_id: str):
         "transcript": transcript,
         "length": len(transcript)
     }
+
+
+@router.get("/cache/stats")
+async def cache_stats():
+    """캐시 통계 조회 (테스트/디버깅용)"""
+    return {
+        "success": True,
+        "analysis": await get_cache_stats(),
+        "tavily_search": get_search_cache_stats(),
+        "transcripts": get_transcript_cache_stats(),
+        "llm_usage": get_llm_usage_stats(),
+        "llm_responses": get_llm_cache_stats(),
+    }
+
+
+@router.get("/proxy/stats")
+async def proxy_stats():
+    """자막 프록시 풀 통계 조회 (테스트/디버깅용)"""
+    return {
+        "success": True,
+        "proxies": get_proxy_pool_stats(),
+    }
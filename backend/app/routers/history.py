@@ -1,6 +1,7 @@
+from typing import Optional
 from fastapi import APIRouter, Query
 from ..models.schemas import HistoryListResponse, HistoryItem
-from ..database import get_history, delete_analysis, get_history_count
+from ..database import get_history_page, delete_analysis
 
 router = APIRouter(prefix="/api", tags=["history"])
 
@@ -8,13 +9,14 @@ router = APIRouter(prefix="/api", tags=["history"])
 @router.get("/history", response_model=HistoryListResponse)
 async def list_history(
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0)
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_cursor"),
+    offset: int = Query(default=0, ge=0, description="cursor가 없을 때만 사용 (기존 방식 호환)")
 ):
-    """분석 히스토리 목록 조회"""
+    """분석 히스토리 목록 조회 (커서 기반 페이지네이션)"""
     try:
-        # 히스토리 조회
-        history_data = await get_history(limit=limit, offset=offset)
-        total = await get_history_count()
+        # 히스토리 페이지 + 총 개수 (한 번의 RPC)
+        page = await get_history_page(limit=limit, cursor=cursor, offset=offset)
+        history_data = page["items"]
 
         # HistoryItem 리스트로 변환
         items = [
@@ -33,7 +35,9 @@ async def list_history(
         return HistoryListResponse(
             success=True,
             data=items,
-            total=total
+            total=page["total"],
+            total_estimated=page["total_estimated"],
+            next_cursor=page["next_cursor"]
         )
 
     except Exception as e:
@@ -1,17 +1,25 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
 from ..models.schemas import (
-    AnalyzeRequest, AnalyzeResponse, AnalysisResult,
+    AnalyzeRequest, AnalyzeResponse, AnalysisResult, AnalysisSectionResponse,
     PerspectivesResponse, PerspectiveInfo, CriticalAnalysis,
     CriticalAnalyzeRequest, SuitabilityAnalysis, Quote,
     AdditionalAnalyzeRequest
 )
 from ..services.transcript import extract_video_id, get_transcript
 from ..services.youtube_api import get_video_info
-from ..services.claude import analyze_transcript, analyze_critical_v2, verify_sources, verify_critical_sources, verify_additional_sources
+from ..services.claude import analyze_transcript, analyze_critical_v2, verify_sources, verify_critical_sources
 from ..services.perspectives import get_all_perspectives, get_perspective
 from ..services.additional_analysis import analyze_additional
 from ..services.cache import get_cached_analysis, set_cached_analysis
-from ..database import save_analysis, get_analysis_by_id, update_analysis, get_analysis_by_video_id
+from ..services.single_flight import single_flight
+from ..services.source_repair import sections_needing_repair, schedule_source_repair, is_repair_pending
+from ..database import (
+    save_analysis, get_analysis_by_id, update_analysis, get_analysis_by_video_id,
+    get_perspective_result, save_perspective_result, get_stored_transcript,
+    CORE_COLUMNS, STAGE1_COLUMNS
+)
 
 router = APIRouter(prefix="/api", tags=["youtube"])
 
@@ -52,6 +60,69 @@ def normalize_suitability(suitability_raw):
     }
 
 
+def build_analysis_result(row: dict) -> AnalysisResult:
+    """DB 행을 AnalysisResult로 변환"""
+    return AnalysisResult(
+        id=row.get('id'),
+        video_id=row.get('video_id'),
+        video_title=row.get('video_title'),
+        video_url=row.get('video_url'),
+        channel_name=row.get('channel_name'),
+        thumbnail_url=row.get('thumbnail_url'),
+        # 영상 성과 데이터
+        view_count=row.get('view_count'),
+        like_count=row.get('like_count'),
+        comment_count=row.get('comment_count'),
+        subscriber_count=row.get('subscriber_count'),
+        view_sub_ratio=row.get('view_sub_ratio'),
+        published_at=row.get('published_at'),
+        # 영상 구조 분석
+        video_structure=row.get('video_structure', []),
+        structure_summary=row.get('structure_summary'),
+        summary=row.get('summary', ''),
+        key_message=row.get('key_message', ''),
+        key_points=row.get('key_points', []),
+        quotes=row.get('quotes', []),
+        people=row.get('people', []),
+        investment_strategy=row.get('investment_strategy', ''),
+        source_tracking=row.get('source_tracking', []),
+        suitability_analysis=normalize_suitability(row.get('suitability_analysis')),
+        perspective=row.get('perspective'),
+        critical_analysis=row.get('critical_analysis'),
+        additional_analysis=row.get('additional_analysis'),
+        created_at=row.get('created_at'),
+    )
+
+
+async def fetch_video_intake(video_id: str):
+    """
+    1단계 입력 수집 - 영상 메타 정보와 자막을 동시에 가져옴
+    한쪽이 실패하면 다른 쪽 요청은 바로 취소
+
+    Returns:
+        (video_info, transcript, error)
+    """
+    info_task = asyncio.create_task(get_video_info(video_id))
+    transcript_task = asyncio.create_task(get_transcript(video_id))
+    pending = {info_task, transcript_task}
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if transcript_task in done:
+                _, error = transcript_task.result()
+                if error:
+                    return None, None, error
+            if info_task in done and not info_task.result():
+                return None, None, "영상 정보를 가져올 수 없습니다."
+
+        transcript, _ = transcript_task.result()
+        return info_task.result(), transcript, None
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 @router.get("/perspectives", response_model=PerspectivesResponse)
 async def get_perspectives():
     """분석 관점 목록 조회"""
@@ -74,21 +145,31 @@ async def analyze_video(request: AnalyzeRequest):
     YouTube 영상 분석 API (1단계: 영상 분석 + 소재 적합성)
 
     1. URL에서 video_id 추출
-    2. YouTube API로 영상 정보 가져오기
-    3. 자막 추출
+    2. YouTube API로 영상 정보 가져오기 ┐ 동시 실행
+    3. 자막 추출                       ┘
     4. Claude로 분석 (영상 분석 + 소재 적합성)
     5. DB 저장
     6. 결과 반환
+
+    같은 영상에 대한 동시 요청은 하나의 분석으로 병합 (single-flight)
     """
-    try:
-        # 1. video_id 추출
-        video_id = extract_video_id(request.url)
-        if not video_id:
-            return AnalyzeResponse(
-                success=False,
-                error="유효하지 않은 YouTube URL입니다."
-            )
+    # 1. video_id 추출
+    video_id = extract_video_id(request.url)
+    if not video_id:
+        return AnalyzeResponse(
+            success=False,
+            error="유효하지 않은 YouTube URL입니다."
+        )
+
+    return await single_flight(
+        f"analyze:{video_id}",
+        lambda waited: run_video_analysis(request, video_id)
+    )
 
+
+async def run_video_analysis(request: AnalyzeRequest, video_id: str) -> AnalyzeResponse:
+    """1단계 분석 실행 (다른 워커가 먼저 저장했으면 DB 캐시 확인에서 반환됨)"""
+    try:
         # 1-1. DB 캐시 확인 - 이미 분석된 영상이면 바로 반환
         existing = await get_analysis_by_video_id(video_id)
         if existing and existing.get('summary'):
@@ -124,16 +205,8 @@ async def analyze_video(request: AnalyzeRequest):
             )
             return AnalyzeResponse(success=True, data=result, cached=True)
 
-        # 2. 영상 정보 가져오기
-        video_info = await get_video_info(video_id)
-        if not video_info:
-            return AnalyzeResponse(
-                success=False,
-                error="영상 정보를 가져올 수 없습니다."
-            )
-
-        # 3. 자막 추출
-        transcript, error = await get_transcript(video_id)
+        # 2~3. 영상 정보 + 자막 동시 추출
+        video_info, transcript, error = await fetch_video_intake(video_id)
         if error:
             return AnalyzeResponse(
                 success=False,
@@ -178,7 +251,7 @@ async def analyze_video(request: AnalyzeRequest):
             "video_url": request.url,
             "channel_name": video_info['channel_name'],
             "thumbnail_url": video_info['thumbnail_url'],
-            "transcript": transcript[:10000] if transcript else None,
+            # 전체 자막은 transcripts 테이블에 압축 저장 (get_transcript)
             # 영상 성과 데이터
             "view_count": video_info.get('view_count'),
             "like_count": video_info.get('like_count'),
@@ -244,11 +317,52 @@ async def analyze_video(request: AnalyzeRequest):
         )
 
 
+# /result 조회 시 include로 선택할 수 있는 섹션 (기본: 모두 포함)
+RESULT_SECTIONS = ("critical_analysis", "additional_analysis")
+
+
+def parse_column_list(value: Optional[str], allowed: tuple, default: tuple) -> List[str]:
+    """쉼표로 구분된 컬럼 목록 파싱 (허용되지 않은 이름이면 ValueError)"""
+    if value is None:
+        return list(default)
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in allowed]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)}")
+    return names
+
+
+def schedule_repair_if_needed(analysis_id: str, row: dict) -> None:
+    """조회한 컬럼 중 출처 URL 보정이 필요한 섹션이 있으면 백그라운드 작업 등록"""
+    repair_sections = sections_needing_repair(row)
+    if repair_sections:
+        print(f"[GET] 출처 URL 보정 필요: {sorted(repair_sections)} → 백그라운드 작업 등록", flush=True)
+        schedule_source_repair(analysis_id)
+
+
 @router.get("/result/{analysis_id}", response_model=AnalyzeResponse)
-async def get_result(analysis_id: str):
-    """분석 결과 조회"""
+async def get_result(
+    analysis_id: str,
+    fields: Optional[str] = Query(default=None, description="조회할 1단계 필드 (쉼표 구분, 기본: 전체)"),
+    include: Optional[str] = Query(default=None, description="포함할 섹션: critical_analysis, additional_analysis (기본: 전체)")
+):
+    """
+    분석 결과 조회
+
+    fields/include로 필요한 컬럼만 조회할 수 있음 (선택하지 않은 필드는 기본값으로 응답)
+    용량이 큰 섹션은 /result/{id}/critical, /result/{id}/additional 로 따로 조회 가능
+    """
+    try:
+        columns = list(CORE_COLUMNS)
+        for column in parse_column_list(fields, STAGE1_COLUMNS, STAGE1_COLUMNS) + \
+                parse_column_list(include, RESULT_SECTIONS, RESULT_SECTIONS):
+            if column not in columns:
+                columns.append(column)
+    except ValueError as e:
+        return AnalyzeResponse(success=False, error=str(e))
+
     try:
-        result = await get_analysis_by_id(analysis_id)
+        result = await get_analysis_by_id(analysis_id, columns=columns)
 
         if not result:
             return AnalyzeResponse(
@@ -256,147 +370,103 @@ async def get_result(analysis_id: str):
                 error="분석 결과를 찾을 수 없습니다."
             )
 
-        # 기존 데이터에 URL이 없으면 Tavily로 검증 후 업데이트
+        # 기존 데이터에 URL이 없으면 백그라운드에서 Tavily로 검증 후 업데이트
+        # (조회 응답은 저장된 데이터로 즉시 반환)
         print(f"[GET] 분석 결과 조회: {analysis_id}", flush=True)
-        update_data = {}
-
-        # 1. source_tracking URL 검증
-        st = result.get('source_tracking', [])
-        if st:
-            st_needs_update = False
-            for s in st:
-                if isinstance(s, dict):
-                    url = s.get('source_url')
-                    if not url or (isinstance(url, str) and ('google.com/search' in url or url.lower() in ['null', 'none', ''])):
-                        st_needs_update = True
-                        break
-            if st_needs_update:
-                print(f"[GET] source_tracking URL 없음, Tavily로 검증 시작...")
-                updated_result = await verify_sources(result)
-                result['source_tracking'] = updated_result.get('source_tracking', [])
-                update_data['source_tracking'] = result['source_tracking']
-
-        # 2. critical_analysis URL 검증
-        ca = result.get('critical_analysis')
-        if ca:
-            ca_needs_update = False
-            # hidden_premises 중 하나라도 source_url이 없거나 Google URL이면 업데이트 필요
-            if 'hidden_premises' in ca:
-                for hp in ca['hidden_premises']:
-                    if isinstance(hp, dict):
-                        url = hp.get('source_url')
-                        if not url or (isinstance(url, str) and ('google.com/search' in url or url.lower() in ['null', 'none', ''])):
-                            ca_needs_update = True
-                            break
-
-            print(f"[GET] ca_needs_update: {ca_needs_update}", flush=True)
-            if ca_needs_update:
-                print(f"[GET] critical_analysis URL 없음, Tavily로 검증 시작...", flush=True)
-                updated_ca = await verify_critical_sources(ca)
-                result['critical_analysis'] = updated_ca
-                update_data['critical_analysis'] = updated_ca
-                print(f"[GET] Tavily 검증 완료", flush=True)
-
-        # 3. additional_analysis URL 검증 (interview_clips, evidence_sources, bonus_tip)
-        aa = result.get('additional_analysis')
-        if aa:
-            aa_needs_update = False
-
-            # 해외 인물 목록 (이 인물들은 영어로 검색해야 올바른 결과 나옴)
-            international_figures = ["워렌 버핏", "워런 버핏", "찰리 멍거", "일론 머스크", "제프 베조스",
-                                    "빌 게이츠", "스티브 잡스", "레이 달리오", "피터 린치", "조지 소로스"]
-
-            # video_sources 내 interview_clips 확인
-            video_sources = aa.get('video_sources', {})
-            if video_sources:
-                for clip in video_sources.get('interview_clips', []):
-                    if isinstance(clip, dict):
-                        link = clip.get('link')
-                        person = clip.get('person', '')
-
-                        # URL이 없거나 잘못된 형식인 경우
-                        if not link or (isinstance(link, str) and ('google.com/search' in link or link.lower() in ['null', 'none', '', '-'] or link.startswith('검색:'))):
-                            aa_needs_update = True
-                            break
-
-                        # 해외 인물인데 URL에 영어 이름이 없는 경우 (잘못된 한국어 콘텐츠일 가능성)
-                        if person in international_figures and isinstance(link, str):
-                            # 영어 이름 매핑
-                            eng_names = {"워렌 버핏": "buffett", "워런 버핏": "buffett", "찰리 멍거": "munger",
-                                        "일론 머스크": "musk", "제프 베조스": "bezos", "빌 게이츠": "gates",
-                                        "스티브 잡스": "jobs", "레이 달리오": "dalio", "피터 린치": "lynch",
-                                        "조지 소로스": "soros"}
-                            eng_name = eng_names.get(person, "")
-                            # URL에 영어 이름이 없으면 재검색 (잘못된 한국 콘텐츠일 가능성)
-                            if eng_name and eng_name not in link.lower():
-                                aa_needs_update = True
-                                print(f"[GET] 해외 인물 {person}의 URL이 영문명({eng_name}) 미포함, 재검색 필요", flush=True)
-                                break
-
-                if not aa_needs_update:
-                    for ev in video_sources.get('evidence_sources', []):
-                        if isinstance(ev, dict):
-                            link = ev.get('link')
-                            if not link or (isinstance(link, str) and ('google.com/search' in link or link.lower() in ['null', 'none', '', '-'] or link.startswith('검색:'))):
-                                aa_needs_update = True
-                                break
-
-            # bonus_tip 확인
-            if not aa_needs_update:
-                bonus_tip = aa.get('bonus_tip', {})
-                if isinstance(bonus_tip, dict):
-                    source_url = bonus_tip.get('source_url')
-                    if bonus_tip.get('source') and (not source_url or (isinstance(source_url, str) and ('google.com/search' in source_url or source_url.lower() in ['null', 'none', '', '-']))):
-                        aa_needs_update = True
-
-            print(f"[GET] aa_needs_update: {aa_needs_update}", flush=True)
-            if aa_needs_update:
-                print(f"[GET] additional_analysis URL 없음, Tavily로 검증 시작...", flush=True)
-                updated_aa = await verify_additional_sources(aa)
-                result['additional_analysis'] = updated_aa
-                update_data['additional_analysis'] = updated_aa
-                print(f"[GET] additional_analysis Tavily 검증 완료", flush=True)
-
-        # DB 업데이트 (변경사항이 있을 때만)
-        if update_data:
-            await update_analysis(analysis_id, update_data)
-            print(f"[GET] 기존 데이터 URL 업데이트 완료: {list(update_data.keys())}", flush=True)
+        schedule_repair_if_needed(analysis_id, result)
 
-        analysis_result = AnalysisResult(
-            id=result.get('id'),
-            video_id=result.get('video_id'),
-            video_title=result.get('video_title'),
-            video_url=result.get('video_url'),
-            channel_name=result.get('channel_name'),
-            thumbnail_url=result.get('thumbnail_url'),
-            # 영상 성과 데이터
-            view_count=result.get('view_count'),
-            like_count=result.get('like_count'),
-            comment_count=result.get('comment_count'),
-            subscriber_count=result.get('subscriber_count'),
-            view_sub_ratio=result.get('view_sub_ratio'),
-            published_at=result.get('published_at'),
-            # 영상 구조 분석
-            video_structure=result.get('video_structure', []),
-            structure_summary=result.get('structure_summary'),
-            summary=result.get('summary', ''),
-            key_message=result.get('key_message', ''),
-            key_points=result.get('key_points', []),
-            quotes=result.get('quotes', []),
-            people=result.get('people', []),
-            investment_strategy=result.get('investment_strategy', ''),
-            source_tracking=result.get('source_tracking', []),
-            suitability_analysis=result.get('suitability_analysis'),
+        return AnalyzeResponse(
+            success=True,
+            data=build_analysis_result(result),
+            source_repair_pending=is_repair_pending(analysis_id)
+        )
+
+    except Exception as e:
+        return AnalyzeResponse(
+            success=False,
+            error=f"조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+async def get_result_section(analysis_id: str, column: str) -> AnalysisSectionResponse:
+    """분석 결과의 섹션 하나만 조회"""
+    try:
+        result = await get_analysis_by_id(analysis_id, columns=("id", "video_id", "perspective", column))
+
+        if not result:
+            return AnalysisSectionResponse(
+                success=False,
+                error="분석 결과를 찾을 수 없습니다."
+            )
+
+        schedule_repair_if_needed(analysis_id, result)
+
+        return AnalysisSectionResponse(
+            success=True,
+            analysis_id=analysis_id,
             perspective=result.get('perspective'),
-            critical_analysis=result.get('critical_analysis'),
-            additional_analysis=result.get('additional_analysis'),
-            created_at=result.get('created_at'),
+            data=result.get(column),
+            source_repair_pending=is_repair_pending(analysis_id)
         )
 
-        return AnalyzeResponse(success=True, data=analysis_result)
+    except Exception as e:
+        return AnalysisSectionResponse(
+            success=False,
+            error=f"조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/result/{analysis_id}/critical", response_model=AnalysisSectionResponse)
+async def get_result_critical(analysis_id: str):
+    """비판적 분석 결과(2단계)만 조회"""
+    return await get_result_section(analysis_id, "critical_analysis")
+
+
+@router.get("/result/{analysis_id}/additional", response_model=AnalysisSectionResponse)
+async def get_result_additional(analysis_id: str):
+    """추가 분석 결과(3단계)만 조회"""
+    return await get_result_section(analysis_id, "additional_analysis")
+
+
+@router.get("/result/{analysis_id}/transcript", response_model=AnalysisSectionResponse)
+async def get_result_transcript(analysis_id: str, segments: bool = Query(default=False, description="구간별 시작 시각/길이 포함")):
+    """
+    저장된 자막 원문만 조회
+    transcripts 테이블의 전체 자막 우선, 없으면 analyses 행의 자막(이전 저장 방식) 사용
+    """
+    try:
+        row = await get_analysis_by_id(analysis_id, columns=("id", "video_id", "perspective"))
+        if not row:
+            return AnalysisSectionResponse(
+                success=False,
+                error="분석 결과를 찾을 수 없습니다."
+            )
+
+        stored = await get_stored_transcript(row['video_id'], with_segments=segments)
+        if stored is None:
+            return await get_result_section(analysis_id, "transcript")
+
+        data = stored.text
+        if segments:
+            data = {
+                "text": stored.text,
+                "language_code": stored.language_code,
+                "is_generated": stored.is_generated,
+                "segments": [
+                    {"text": s.text, "start": s.start, "duration": s.duration}
+                    for s in stored.segments
+                ],
+            }
+
+        return AnalysisSectionResponse(
+            success=True,
+            analysis_id=analysis_id,
+            perspective=row.get('perspective'),
+            data=data
+        )
 
     except Exception as e:
-        return AnalyzeResponse(
+        return AnalysisSectionResponse(
             success=False,
             error=f"조회 중 오류가 발생했습니다: {str(e)}"
         )
@@ -412,7 +482,17 @@ async def analyze_critical_endpoint(request: CriticalAnalyzeRequest):
     3. Claude로 비판적 분석
     4. DB 업데이트
     5. 결과 반환
+
+    같은 analysis_id + 관점의 동시 요청은 하나의 분석으로 병합 (single-flight)
     """
+    return await single_flight(
+        f"critical:{request.analysis_id}:{request.perspective}",
+        lambda waited: run_critical_analysis(request, waited)
+    )
+
+
+async def run_critical_analysis(request: CriticalAnalyzeRequest, waited: bool) -> AnalyzeResponse:
+    """2단계 비판적 분석 실행"""
     try:
         # 1. DB에서 1단계 분석 결과 조회
         existing = await get_analysis_by_id(request.analysis_id)
@@ -422,6 +502,10 @@ async def analyze_critical_endpoint(request: CriticalAnalyzeRequest):
                 error="분석 결과를 찾을 수 없습니다."
             )
 
+        # 1-1. 다른 워커에서 같은 관점 분석이 방금 끝났으면 저장된 결과 반환
+        if waited and existing.get('perspective') == request.perspective and existing.get('critical_analysis'):
+            return AnalyzeResponse(success=True, data=build_analysis_result(existing), cached=True)
+
         # 2. 소재 적합성 체크
         suitability = existing.get('suitability_analysis', {})
         if suitability and suitability.get('judgment') == '부적합':
@@ -430,27 +514,40 @@ async def analyze_critical_endpoint(request: CriticalAnalyzeRequest):
                 error=f"이 영상은 비판적 분석에 적합하지 않습니다. 사유: {suitability.get('unsuitable_reason', '소재 부적합')}"
             )
 
-        # 3. Claude로 비판적 분석 (1단계 결과 기반)
-        critical_result, error = await analyze_critical_v2(
-            perspective_id=request.perspective,
-            summary=existing.get('summary', ''),
-            key_message=existing.get('key_message', ''),
-            key_points=existing.get('key_points', []),
-            strategy=existing.get('investment_strategy', ''),
-            quotes=existing.get('quotes', []),
-            people=existing.get('people', []),
-            source_tracking=existing.get('source_tracking', []),
-            suitability_analysis=suitability
-        )
-
-        if error:
-            return AnalyzeResponse(
-                success=False,
-                error=error
+        # 3. 같은 관점의 결과가 있으면 재사용 (캐시 → 관점별 저장 결과), 없으면 Claude로 분석 (1단계 결과 기반)
+        critical_result = await get_cached_analysis(existing['video_id'], f"stage2:{request.perspective}")
+        additional_result = await get_cached_analysis(existing['video_id'], f"stage3:{request.perspective}")
+        if critical_result is None or additional_result is None:
+            stored = await get_perspective_result(request.analysis_id, request.perspective) or {}
+            critical_result = critical_result or stored.get('critical_analysis')
+            additional_result = additional_result or stored.get('additional_analysis')
+
+        is_new_result = critical_result is None
+        if not is_new_result:
+            print(f"[Cache] {request.perspective} 관점 기존 결과 사용", flush=True)
+        else:
+            # 새로 분석한 비판적 분석에는 이전 추가 분석 결과가 맞지 않음
+            additional_result = None
+            critical_result, error = await analyze_critical_v2(
+                perspective_id=request.perspective,
+                summary=existing.get('summary', ''),
+                key_message=existing.get('key_message', ''),
+                key_points=existing.get('key_points', []),
+                strategy=existing.get('investment_strategy', ''),
+                quotes=existing.get('quotes', []),
+                people=existing.get('people', []),
+                source_tracking=existing.get('source_tracking', []),
+                suitability_analysis=suitability
             )
 
-        # 3-1. 비판적 분석 출처 검증 (Tavily API로 실제 URL 찾기)
-        critical_result = await verify_critical_sources(critical_result)
+            if error:
+                return AnalyzeResponse(
+                    success=False,
+                    error=error
+                )
+
+            # 3-1. 비판적 분석 출처 검증 (Tavily API로 실제 URL 찾기)
+            critical_result = await verify_critical_sources(critical_result)
 
         # DEBUG: 저장 직전 데이터 확인
         print(f"[DEBUG] verify_critical_sources 후 critical_result keys: {critical_result.keys() if critical_result else 'None'}")
@@ -468,13 +565,24 @@ async def analyze_critical_endpoint(request: CriticalAnalyzeRequest):
                 error=critical_result.get('message', '비판적 분석을 수행할 수 없습니다.')
             )
 
-        # 4. DB 업데이트
+        # 4. DB 업데이트 (현재 관점 결과 + 관점별 저장 결과)
+        # 추가 분석은 선택한 관점의 결과로 교체 (없으면 비움)
         update_data = {
             "perspective": request.perspective,
-            "critical_analysis": critical_result
+            "critical_analysis": critical_result,
+            "additional_analysis": additional_result
         }
         print(f"[DEBUG] Supabase에 저장할 critical_analysis 데이터 크기: {len(str(critical_result))} chars")
-        updated = await update_analysis(request.analysis_id, update_data)
+        if is_new_result:
+            updated, _ = await asyncio.gather(
+                update_analysis(request.analysis_id, update_data),
+                save_perspective_result(request.analysis_id, request.perspective, {
+                    "critical_analysis": critical_result,
+                    "additional_analysis": None
+                })
+            )
+        else:
+            updated = await update_analysis(request.analysis_id, update_data)
 
         if not updated:
             return AnalyzeResponse(
@@ -482,6 +590,10 @@ async def analyze_critical_endpoint(request: CriticalAnalyzeRequest):
                 error="분석 결과 업데이트에 실패했습니다."
             )
 
+        set_cached_analysis(updated['video_id'], f"stage2:{request.perspective}", critical_result)
+        if additional_result is not None:
+            set_cached_analysis(updated['video_id'], f"stage3:{request.perspective}", additional_result)
+
         # DEBUG: Supabase에서 반환된 데이터 확인
         print(f"[DEBUG] Supabase에서 반환된 critical_analysis keys: {updated.get('critical_analysis', {}).keys() if updated.get('critical_analysis') else 'None'}")
         returned_ca = updated.get('critical_analysis', {})
@@ -540,7 +652,17 @@ async def analyze_additional_endpoint(request: AdditionalAnalyzeRequest):
     3. Claude로 추가 분석
     4. DB 업데이트
     5. 결과 반환
+
+    같은 analysis_id의 동시 요청은 하나의 분석으로 병합 (single-flight)
     """
+    return await single_flight(
+        f"additional:{request.analysis_id}",
+        lambda waited: run_additional_analysis(request, waited)
+    )
+
+
+async def run_additional_analysis(request: AdditionalAnalyzeRequest, waited: bool) -> AnalyzeResponse:
+    """3단계 추가 분석 실행"""
     try:
         # 1. DB에서 기존 분석 결과 조회
         existing = await get_analysis_by_id(request.analysis_id)
@@ -550,6 +672,10 @@ async def analyze_additional_endpoint(request: AdditionalAnalyzeRequest):
                 error="분석 결과를 찾을 수 없습니다."
             )
 
+        # 1-1. 다른 워커에서 추가 분석이 방금 끝났으면 저장된 결과 반환
+        if waited and existing.get('additional_analysis'):
+            return AnalyzeResponse(success=True, data=build_analysis_result(existing), cached=True)
+
         # 2. 비판적 분석 완료 여부 체크
         critical_analysis = existing.get('critical_analysis')
         if not critical_analysis:
@@ -558,35 +684,53 @@ async def analyze_additional_endpoint(request: AdditionalAnalyzeRequest):
                 error="비판적 분석을 먼저 진행해주세요."
             )
 
-        # 3. Claude로 추가 분석 (1단계 + 2단계 결과 기반)
-        additional_result, error = await analyze_additional(
-            summary=existing.get('summary', ''),
-            key_message=existing.get('key_message', ''),
-            key_points=existing.get('key_points', []),
-            strategy=existing.get('investment_strategy', ''),
-            quotes=existing.get('quotes', []),
-            people=existing.get('people', []),
-            source_tracking=existing.get('source_tracking', []),
-            suitability_analysis=existing.get('suitability_analysis', {}),
-            hidden_premises=critical_analysis.get('hidden_premises', []),
-            realistic_contradictions=critical_analysis.get('realistic_contradictions', []),
-            source_based_contradictions=critical_analysis.get('source_based_contradictions', []),
-            hooking_points=critical_analysis.get('hooking_points', []),
-            content_direction=critical_analysis.get('content_direction', []),
-            automation_insight=critical_analysis.get('automation_insight')
-        )
-
-        if error:
-            return AnalyzeResponse(
-                success=False,
-                error=error
+        # 3. 현재 관점의 추가 분석 결과가 있으면 재사용 (캐시 → 관점별 저장 결과), 없으면 Claude로 추가 분석 (1단계 + 2단계 결과 기반)
+        perspective = existing.get('perspective')
+        additional_result = await get_cached_analysis(existing['video_id'], f"stage3:{perspective}") if perspective else None
+        if additional_result is None and perspective:
+            stored = await get_perspective_result(request.analysis_id, perspective) or {}
+            additional_result = stored.get('additional_analysis')
+
+        if additional_result is not None:
+            print(f"[Cache] {perspective} 관점 기존 추가 분석 결과 사용", flush=True)
+        else:
+            additional_result, error = await analyze_additional(
+                summary=existing.get('summary', ''),
+                key_message=existing.get('key_message', ''),
+                key_points=existing.get('key_points', []),
+                strategy=existing.get('investment_strategy', ''),
+                quotes=existing.get('quotes', []),
+                people=existing.get('people', []),
+                source_tracking=existing.get('source_tracking', []),
+                suitability_analysis=existing.get('suitability_analysis', {}),
+                hidden_premises=critical_analysis.get('hidden_premises', []),
+                realistic_contradictions=critical_analysis.get('realistic_contradictions', []),
+                source_based_contradictions=critical_analysis.get('source_based_contradictions', []),
+                hooking_points=critical_analysis.get('hooking_points', []),
+                content_direction=critical_analysis.get('content_direction', []),
+                automation_insight=critical_analysis.get('automation_insight')
             )
 
+            if error:
+                return AnalyzeResponse(
+                    success=False,
+                    error=error
+                )
+
         # 4. DB 업데이트
         update_data = {
             "additional_analysis": additional_result
         }
-        updated = await update_analysis(request.analysis_id, update_data)
+        if perspective:
+            updated, _ = await asyncio.gather(
+                update_analysis(request.analysis_id, update_data),
+                save_perspective_result(request.analysis_id, perspective, {
+                    "critical_analysis": critical_analysis,
+                    "additional_analysis": additional_result
+                })
+            )
+        else:
+            updated = await update_analysis(request.analysis_id, update_data)
 
         if not updated:
             return AnalyzeResponse(
@@ -594,6 +738,9 @@ async def analyze_additional_endpoint(request: AdditionalAnalyzeRequest):
                 error="추가 분석 결과 저장에 실패했습니다."
             )
 
+        if perspective:
+            set_cached_analysis(updated['video_id'], f"stage3:{perspective}", additional_result)
+
         # 5. 결과 반환
         analysis_result = AnalysisResult(
             id=updated.get('id'),
@@ -2,35 +2,16 @@ import anthropic
 import json
 from typing import Optional, Dict, List, Any
 from ..config import get_settings
+from .llm_client import create_message
+from .json_utils import parse_json_response
+from .prompt_parts import PromptParts
 
 settings = get_settings()
 
 # 추가 분석 프롬프트
+# 고정 지시문(프롬프트 캐시 대상)을 앞에, 1·2단계 결과(ADDITIONAL_ANALYSIS_INPUT)를 뒤에 둠
 ADDITIONAL_ANALYSIS_PROMPT = """너는 투자 유튜브 콘텐츠 전문 기획자야.
 
-[입력 데이터 - 1단계 영상 분석 결과]
-- 영상 요약: {summary}
-- 핵심 메시지: {key_message}
-- 키포인트: {key_points}
-- 거장의 전략: {strategy}
-- 인용할 대사: {quotes}
-- 등장 인물: {people}
-- 출처 추적: {source_tracking}
-- 소재 적합성 판단: {suitability_analysis}
-
-[입력 데이터 - 2단계 비판적 분석 결과]
-- 숨겨진 전제: {hidden_premises}
-- 현실적 모순: {realistic_contradictions}
-- 출처 기반 모순 분석: {source_based_contradictions}
-- 후킹 포인트: {hooking_points}
-- 콘텐츠 방향: {content_direction}
-
-[입력 데이터 - 2단계 자동화 관점 인사이트]
-- 영상 유형: {automation_video_type}
-- 문제-해결책 테이블: {automation_table}
-- 핵심 인사이트: {automation_core_insight}
-- 삶의 영역 확장: {automation_life_expansion}
-
 [채널 철학 - 고정값]
 - 핵심 메시지: 거장의 전략은 틀리지 않았다. 문제는 실행이다.
 - 톤: 비판적이지만 논리적, 감정적 비난 X
@@ -40,7 +21,7 @@ ADDITIONAL_ANALYSIS_PROMPT = """너는 투자 유튜브 콘텐츠 전문 기획
 - 멤버십 언급: 공감 파트에서 자연스럽게 ("더 자세한 방법은 멤버십에")
 - 마무리: 비판적 사고 + 자신에게 유리한 전략 개선 = 투자 본질/원칙
 
-위 데이터를 기반으로 추가 분석을 진행해.
+맨 아래 [입력 데이터]를 기반으로 추가 분석을 진행해.
 
 ---
 
@@ -271,19 +252,28 @@ ADDITIONAL_ANALYSIS_PROMPT = """너는 투자 유튜브 콘텐츠 전문 기획
     - 2단계 core_insight를 활용하되 완전히 공개하지 않음
 """
 
+ADDITIONAL_ANALYSIS_INPUT = """[입력 데이터 - 1단계 영상 분석 결과]
+- 영상 요약: {summary}
+- 핵심 메시지: {key_message}
+- 키포인트: {key_points}
+- 거장의 전략: {strategy}
+- 인용할 대사: {quotes}
+- 등장 인물: {people}
+- 출처 추적: {source_tracking}
+- 소재 적합성 판단: {suitability_analysis}
 
-def parse_json_response(response_text: str) -> Dict:
-    """Claude 응답에서 JSON 파싱"""
-    if "```json" in response_text:
-        json_start = response_text.find("```json") + 7
-        json_end = response_text.find("```", json_start)
-        response_text = response_text[json_start:json_end].strip()
-    elif "```" in response_text:
-        json_start = response_text.find("```") + 3
-        json_end = response_text.find("```", json_start)
-        response_text = response_text[json_start:json_end].strip()
+[입력 데이터 - 2단계 비판적 분석 결과]
+- 숨겨진 전제: {hidden_premises}
+- 현실적 모순: {realistic_contradictions}
+- 출처 기반 모순 분석: {source_based_contradictions}
+- 후킹 포인트: {hooking_points}
+- 콘텐츠 방향: {content_direction}
 
-    return json.loads(response_text)
+[입력 데이터 - 2단계 자동화 관점 인사이트]
+- 영상 유형: {automation_video_type}
+- 문제-해결책 테이블: {automation_table}
+- 핵심 인사이트: {automation_core_insight}
+- 삶의 영역 확장: {automation_life_expansion}"""
 
 
 def format_list_for_prompt(items: List[Any]) -> str:
@@ -326,8 +316,6 @@ async def analyze_additional(
         Tuple[Optional[Dict], Optional[str]]: (분석 결과, 에러 메시지)
     """
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
         # 자동화 인사이트 데이터 포맷팅
         automation_video_type = "없음"
         automation_table = "없음"
@@ -344,8 +332,8 @@ async def analyze_additional(
             if life_exp:
                 automation_life_expansion = json.dumps(life_exp, ensure_ascii=False)
 
-        # 프롬프트 생성
-        prompt = ADDITIONAL_ANALYSIS_PROMPT.format(
+        # 1·2단계 결과 입력
+        prompt_input = ADDITIONAL_ANALYSIS_INPUT.format(
             summary=summary,
             key_message=key_message,
             key_points=format_list_for_prompt(key_points),
@@ -365,15 +353,12 @@ async def analyze_additional(
             automation_life_expansion=automation_life_expansion
         )
 
-        message = client.messages.create(
+        message = await create_message(
+            PromptParts(static=ADDITIONAL_ANALYSIS_PROMPT.format(), dynamic=prompt_input),
             model="claude-sonnet-4-20250514",
             max_tokens=8192,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            label="stage3_additional",
+            validate=parse_json_response
         )
 
         response_text = message.content[0].text
@@ -1,13 +1,312 @@
 """
 분석 결과 캐싱 서비스
 - 메모리 캐시로 동일 영상 재분석 방지
-- 서버 재시작 시 캐시 초기화됨
+- LRU + TTL 정책, 항목별 바이트 크기 추정과 메모리 상한으로 크기 제한
+- video_id 보조 인덱스로 영상 단위 삭제
+- 분석 행(analyses) 캐시 + 관점별 2단계/3단계 결과 캐시
+- 2단 구성: L1(워커별 메모리) + L2(워커 간 공유 SQLite 파일, 재시작 후에도 유지)
+  쓰기는 L2까지 기록(write-through), L1 미스 시 L2에서 읽어 L1에 채움
+  변경/삭제는 L2 무효화 로그에 기록하고, 각 워커가 주기적으로 읽어 자신의 L1에서 제거
+  L2(SQLite) 작업은 전용 스레드에서 실행 → 이벤트 루프를 막지 않음
 """
 
-from typing import Optional, Dict
+import asyncio
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Set, Any, Callable, Tuple
+from ..config import get_settings
+from .shared_cache import SQLiteSharedCache
 
-# 메모리 캐시
-analysis_cache: Dict[str, Dict] = {}
+
+def estimate_size(value: Any) -> int:
+    """캐시 항목 바이트 크기 추정 (JSON 직렬화 기준)"""
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(value).encode("utf-8"))
+
+
+class LRUTTLCache:
+    """항목 수/메모리 상한과 TTL이 있는 LRU 캐시"""
+
+    def __init__(self, max_entries: int, max_bytes: int, default_ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # key → (value, size, expires_at, video_id)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # video_id → {key, ...}
+        self._video_index: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry[2] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, video_id: str, value: Any, ttl: Optional[float] = None) -> None:
+        size = estimate_size(value)
+        # 상한보다 큰 항목은 저장하지 않음
+        if size > self.max_bytes:
+            return
+
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size, expires_at, video_id)
+            self._video_index.setdefault(video_id, set()).add(key)
+            self.bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self.bytes > self.max_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def delete_video(self, video_id: str) -> None:
+        with self._lock:
+            for key in list(self._video_index.get(video_id, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._video_index.clear()
+            self.bytes = 0
+
+    def video_ids(self) -> list:
+        with self._lock:
+            return list(self._video_index.keys())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        """항목 삭제 (락 보유 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= entry[1]
+
+        video_id = entry[3]
+        keys = self._video_index.get(video_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._video_index[video_id]
+
+
+_settings = get_settings()
+
+# L1: 워커별 메모리 캐시
+analysis_cache = LRUTTLCache(
+    max_entries=_settings.analysis_cache_max_entries,
+    max_bytes=_settings.analysis_cache_max_bytes,
+    default_ttl=_settings.analysis_cache_ttl,
+)
+
+# L2: 워커 간 공유 캐시 (첫 사용 시 연결)
+_shared_cache: Optional[SQLiteSharedCache] = None
+_shared_disabled = not _settings.shared_cache_enabled
+_shared_lock = threading.Lock()
+_shared_stats = {"hits": 0, "misses": 0, "writes": 0, "invalidations_applied": 0, "errors": 0}
+
+# L2 전용 스레드 (연결/조회/쓰기/무효화 로그 확인을 이벤트 루프 밖에서 순서대로 실행)
+# 쓰기와 무효화는 요청을 기다리게 하지 않고 큐에 넣기만 함 → 같은 워커의 이후 L2 조회는 항상 그 뒤에 실행
+_shared_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shared-cache")
+
+# 무효화 로그 처리 상태 (마지막으로 반영한 seq, 이 워커가 기록한 seq, 마지막 확인 시각)
+_last_seq = 0
+_own_seqs: Set[int] = set()
+_last_sync = 0.0
+
+# 만료 항목/오래된 무효화 로그 정리 주기 (쓰기 횟수 기준)
+PURGE_EVERY_WRITES = 500
+
+
+def get_shared_cache() -> Optional[SQLiteSharedCache]:
+    """L2 캐시 조회 (비활성화되었거나 연결 실패 시 None → L1만 사용, L2 스레드에서 호출)"""
+    global _shared_cache, _shared_disabled, _last_seq
+
+    if _shared_cache is not None or _shared_disabled:
+        return _shared_cache
+
+    with _shared_lock:
+        if _shared_cache is None and not _shared_disabled:
+            try:
+                shared = SQLiteSharedCache(_settings.shared_cache_path)
+                # 이 워커 시작 이전의 무효화 로그는 반영할 필요 없음 (L1이 비어 있음)
+                _last_seq = shared.last_seq()
+                _shared_cache = shared
+            except sqlite3.Error as e:
+                print(f"[Cache] 공유 캐시 연결 실패, 메모리 캐시만 사용: {e}", flush=True)
+                _shared_disabled = True
+    return _shared_cache
+
+
+async def _run_shared(func: Callable, *args) -> Any:
+    """L2 작업을 L2 스레드에서 실행하고 결과 대기"""
+    return await asyncio.get_running_loop().run_in_executor(_shared_executor, func, *args)
+
+
+def _submit_shared(func: Callable, *args) -> None:
+    """L2 쓰기 작업을 L2 스레드 큐에 넣고 바로 반환 (비활성화 시 무시)"""
+    if not _shared_disabled:
+        _shared_executor.submit(func, *args)
+
+
+def _shared_error(action: str, e: Exception) -> None:
+    _shared_stats["errors"] += 1
+    print(f"[Cache] 공유 캐시 {action} 오류: {e}", flush=True)
+
+
+def _apply_invalidation(kind: str, target: Optional[str]) -> None:
+    """무효화 로그 항목을 L1에 반영"""
+    if kind == "key":
+        analysis_cache.delete(target)
+    elif kind == "video":
+        analysis_cache.delete_video(target)
+    else:
+        analysis_cache.clear()
+
+
+def _read_invalidations() -> None:
+    """다른 워커가 기록한 무효화 로그를 L1에 반영 (L2 스레드)"""
+    global _last_seq
+
+    shared = get_shared_cache()
+    if shared is None:
+        return
+
+    try:
+        entries = shared.invalidations_since(_last_seq)
+    except sqlite3.Error as e:
+        _shared_error("무효화 로그 조회", e)
+        return
+
+    for seq, kind, target in entries:
+        _last_seq = max(_last_seq, seq)
+        if seq in _own_seqs:
+            _own_seqs.discard(seq)
+            continue
+        _apply_invalidation(kind, target)
+        _shared_stats["invalidations_applied"] += 1
+
+
+async def sync_invalidations(force: bool = False) -> None:
+    """다른 워커가 기록한 무효화 로그를 L1에 반영 (shared_cache_sync_interval 주기)"""
+    global _last_sync
+
+    if _shared_disabled:
+        return
+
+    now = time.monotonic()
+    if not force and now - _last_sync < _settings.shared_cache_sync_interval:
+        return
+    _last_sync = now
+
+    await _run_shared(_read_invalidations)
+
+
+def _write_invalidation(kind: str, target: Optional[str]) -> None:
+    """L2에서 삭제하고 무효화 로그 기록 (L2 스레드)"""
+    shared = get_shared_cache()
+    if shared is None:
+        return
+    try:
+        _own_seqs.add(shared.invalidate(kind, target))
+    except sqlite3.Error as e:
+        _shared_error("무효화", e)
+
+
+def _publish_invalidation(kind: str, target: Optional[str] = None) -> None:
+    """L2에서 삭제하고 다른 워커에 무효화 전파 (L2 스레드에서 비동기로 기록)"""
+    _submit_shared(_write_invalidation, kind, target)
+
+
+def _read_shared(key: str) -> Optional[Tuple[Any, str, float]]:
+    """L2 조회 (L2 스레드)"""
+    shared = get_shared_cache()
+    if shared is None:
+        return None
+
+    try:
+        found = shared.get(key)
+    except sqlite3.Error as e:
+        _shared_error("조회", e)
+        return None
+
+    if found is None:
+        _shared_stats["misses"] += 1
+        return None
+    _shared_stats["hits"] += 1
+    return found
+
+
+def _write_shared(key: str, video_id: str, value: Any, ttl: float) -> None:
+    """L2 기록 + 주기적 정리 (L2 스레드)"""
+    shared = get_shared_cache()
+    if shared is None:
+        return
+
+    try:
+        # 값과 무효화 로그를 함께 기록 → 다른 워커는 L1에서 이전 값을 지우고 L2의 새 값을 읽음
+        _own_seqs.add(shared.set(key, video_id, value, ttl))
+        _shared_stats["writes"] += 1
+        if _shared_stats["writes"] % PURGE_EVERY_WRITES == 0:
+            shared.purge(_settings.shared_cache_log_retention)
+    except sqlite3.Error as e:
+        _shared_error("저장", e)
+
+
+async def _cache_get(key: str) -> Optional[Any]:
+    """L1 → L2 순서로 조회 (L2 적중 시 남은 TTL로 L1에 채움)"""
+    await sync_invalidations()
+
+    value = analysis_cache.get(key)
+    if value is not None or _shared_disabled:
+        return value
+
+    found = await _run_shared(_read_shared, key)
+    if found is None:
+        return None
+
+    value, video_id, remaining = found
+    analysis_cache.set(key, video_id, value, remaining)
+    return value
+
+
+def _cache_set(key: str, video_id: str, value: Any, ttl: Optional[float] = None) -> None:
+    """L1 저장 + L2 기록(write-through, L2 스레드에서 비동기로 기록), 다른 워커의 L1에 남은 이전 값은 무효화"""
+    analysis_cache.set(key, video_id, value, ttl)
+    _submit_shared(_write_shared, key, video_id, value, ttl if ttl is not None else analysis_cache.default_ttl)
 
 
 def get_cache_key(video_id: str, analysis_type: str) -> str:
@@ -15,7 +314,7 @@ def get_cache_key(video_id: str, analysis_type: str) -> str:
     return f"{video_id}:{analysis_type}"
 
 
-def get_cached_analysis(video_id: str, analysis_type: str) -> Optional[Dict]:
+async def get_cached_analysis(video_id: str, analysis_type: str) -> Optional[Dict]:
     """
     캐시된 분석 결과 조회
 
@@ -24,13 +323,12 @@ def get_cached_analysis(video_id: str, analysis_type: str) -> Optional[Dict]:
         analysis_type: 분석 유형 (stage1, stage2, stage3)
 
     Returns:
-        캐시된 결과 또는 None
+        캐시된 결과 또는 None (없거나 만료된 경우)
     """
-    key = get_cache_key(video_id, analysis_type)
-    return analysis_cache.get(key)
+    return await _cache_get(get_cache_key(video_id, analysis_type))
 
 
-def set_cached_analysis(video_id: str, analysis_type: str, result: Dict) -> None:
+def set_cached_analysis(video_id: str, analysis_type: str, result: Dict, ttl: Optional[float] = None) -> None:
     """
     분석 결과 캐시에 저장
 
@@ -38,31 +336,109 @@ def set_cached_analysis(video_id: str, analysis_type: str, result: Dict) -> None
         video_id: 유튜브 영상 ID
         analysis_type: 분석 유형 (stage1, stage2, stage3)
         result: 분석 결과
+        ttl: 만료 시간(초), None이면 기본값 사용
     """
-    key = get_cache_key(video_id, analysis_type)
-    analysis_cache[key] = result
+    _cache_set(get_cache_key(video_id, analysis_type), video_id, result, ttl)
 
 
 def clear_cache(video_id: str = None) -> None:
     """
-    캐시 삭제
+    캐시 삭제 (모든 워커에 전파)
 
     Args:
         video_id: 특정 영상만 삭제 (None이면 전체 삭제)
     """
-    global analysis_cache
-
     if video_id:
-        keys_to_delete = [k for k in analysis_cache if k.startswith(video_id)]
-        for k in keys_to_delete:
-            del analysis_cache[k]
+        analysis_cache.delete_video(video_id)
+        _publish_invalidation("video", video_id)
     else:
         analysis_cache.clear()
+        _publish_invalidation("all")
+
+
+def get_analysis_id_key(analysis_id: str) -> str:
+    """analysis_id → video_id 인덱스 캐시 키 (ID 기반 조회용, 워커 간 공유)"""
+    return f"analysis_id:{analysis_id}"
+
+
+def cache_analysis_row(row: Dict, latest: bool = False) -> None:
+    """
+    분석 행 캐시 저장
+    (관점별 2/3단계 결과는 분석 직후 stage2:{관점} / stage3:{관점} 키로 별도 저장)
+
+    Args:
+        row: analyses 테이블 행
+        latest: 해당 영상의 최신 행이면 True (video_id 조회 캐시에 사용)
+    """
+    analysis_id = row.get("id")
+    video_id = row.get("video_id")
+    if not analysis_id or not video_id:
+        return
+
+    set_cached_analysis(video_id, f"row:{analysis_id}", copy.deepcopy(row))
+    _cache_set(get_analysis_id_key(analysis_id), video_id, video_id)
+    if latest:
+        set_cached_analysis(video_id, "stage1", analysis_id)
 
 
-def get_cache_stats() -> Dict:
-    """캐시 통계 조회"""
-    return {
+async def get_cached_analysis_row(analysis_id: str) -> Optional[Dict]:
+    """analysis_id로 캐시된 분석 행 조회 (호출 측 수정이 캐시에 반영되지 않도록 복사본 반환)"""
+    video_id = await _cache_get(get_analysis_id_key(analysis_id))
+    if not video_id:
+        return None
+    row = await get_cached_analysis(video_id, f"row:{analysis_id}")
+    return copy.deepcopy(row) if row is not None else None
+
+
+async def get_cached_latest_row(video_id: str) -> Optional[Dict]:
+    """video_id의 최신 분석 행 조회"""
+    analysis_id = await get_cached_analysis(video_id, "stage1")
+    return await get_cached_analysis_row(analysis_id) if analysis_id else None
+
+
+async def invalidate_analysis_row(analysis_id: str) -> None:
+    """분석 행 캐시 무효화 (관점별 2/3단계 결과는 유지, 모든 워커에 전파)"""
+    video_id = await _cache_get(get_analysis_id_key(analysis_id))
+    if video_id:
+        key = get_cache_key(video_id, f"row:{analysis_id}")
+        analysis_cache.delete(key)
+        _publish_invalidation("key", key)
+
+
+def _shared_entry_count() -> Optional[int]:
+    """L2 항목 수 (L2 스레드)"""
+    shared = get_shared_cache()
+    if shared is None:
+        return None
+    try:
+        return shared.count()
+    except sqlite3.Error as e:
+        _shared_error("통계 조회", e)
+        return None
+
+
+async def get_cache_stats() -> Dict:
+    """캐시 통계 조회 (L1은 현재 워커 기준)"""
+    lookups = analysis_cache.hits + analysis_cache.misses
+    stats = {
         "total_entries": len(analysis_cache),
-        "video_ids": list(set(k.split(":")[0] for k in analysis_cache.keys()))
+        "video_ids": analysis_cache.video_ids(),
+        "hits": analysis_cache.hits,
+        "misses": analysis_cache.misses,
+        "hit_ratio": round(analysis_cache.hits / lookups, 4) if lookups else 0.0,
+        "evictions": analysis_cache.evictions,
+        "expirations": analysis_cache.expirations,
+        "bytes": analysis_cache.bytes,
+        "max_bytes": analysis_cache.max_bytes,
+        "max_entries": analysis_cache.max_entries,
     }
+
+    entries = None if _shared_disabled else await _run_shared(_shared_entry_count)
+    shared_stats = {"enabled": _shared_cache is not None, **_shared_stats}
+    if _shared_cache is not None:
+        shared_lookups = _shared_stats["hits"] + _shared_stats["misses"]
+        shared_stats["hit_ratio"] = round(_shared_stats["hits"] / shared_lookups, 4) if shared_lookups else 0.0
+        if entries is not None:
+            shared_stats["entries"] = entries
+    stats["shared"] = shared_stats
+    return stats
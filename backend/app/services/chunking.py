@@ -0,0 +1,100 @@
+"""
+자막 토큰 예산 분할
+- 토크나이저 없이 문자 종류별로 토큰 수를 추정 (한글은 글자당 약 1토큰, 그 외는 약 4자당 1토큰)
+- 문장 경계(. ? ! 등)에서 나누고, 한 문장이 예산을 넘으면 단어 경계에서 나눔
+- 자막 전처리/발췌가 함께 쓰는 단어 토크나이저 (내용어 추출, 추임새 판별)
+"""
+
+import re
+from typing import List
+
+# 문장 경계: 종결 부호 뒤 공백, 줄바꿈
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.?!。？！])\s+|\n+')
+
+HANGUL = re.compile(r'[가-힣ㄱ-ㆎ]')
+
+# 한글 외 문자의 토큰당 평균 글자 수
+CHARS_PER_TOKEN = 4
+
+# 단독으로 쓰인 추임새 (문장부호 제외 후 비교)
+FILLER_WORDS = {"어", "음", "아", "으", "엄", "흠", "에", "어어", "음음", "um", "uh", "uhm", "erm"}
+
+PUNCTUATION = re.compile(r'[^\w가-힣]+')
+CONTENT_WORD = re.compile(r'[가-힣]+|[A-Za-z0-9]+')
+JOSA_SUFFIX = re.compile(r'(으로|에서|에게|까지|부터|하고|이나|이라는|라는|은|는|이|가|을|를|에|의|도|로|와|과|만)$')
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트 토큰 수 추정"""
+    hangul = len(HANGUL.findall(text))
+    others = len(text) - hangul
+    return hangul + (others + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 단위 분리 (빈 문장 제외)"""
+    return [s.strip() for s in SENTENCE_BOUNDARY.split(text) if s and s.strip()]
+
+
+def split_words(sentence: str, max_tokens: int) -> List[str]:
+    """예산을 넘는 긴 문장을 단어 경계에서 나눔 (구두점 없는 자동 자막용)"""
+    pieces, current, current_tokens = [], [], 0
+    for word in sentence.split():
+        tokens = estimate_tokens(word) + 1
+        if current and current_tokens + tokens > max_tokens:
+            pieces.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(word)
+        current_tokens += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int) -> List[str]:
+    """
+    텍스트를 토큰 예산 이하의 구간으로 분할 (문장 순서 유지)
+
+    Args:
+        text: 전체 자막 텍스트
+        max_tokens: 구간당 최대 토큰 수(추정치)
+
+    Returns:
+        구간 텍스트 리스트
+    """
+    chunks, current, current_tokens = [], [], 0
+
+    for sentence in split_sentences(text):
+        tokens = estimate_tokens(sentence) + 1
+        pieces = [sentence] if tokens <= max_tokens else split_words(sentence, max_tokens)
+
+        for piece in pieces:
+            piece_tokens = estimate_tokens(piece) + 1
+            if current and current_tokens + piece_tokens > max_tokens:
+                chunks.append(" ".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def word_key(word: str) -> str:
+    """비교용 단어 키 (문장부호 제거, 소문자)"""
+    return PUNCTUATION.sub("", word).lower()
+
+
+def content_words(text: str) -> List[str]:
+    """
+    검색/유사도용 내용어 목록
+    한글 단어는 흔한 조사를 떼고, 한 글자 단어와 추임새는 제외
+    """
+    words = []
+    for word in CONTENT_WORD.findall(text.lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 2:
+            word = JOSA_SUFFIX.sub("", word)
+        if len(word) >= 2 and word not in FILLER_WORDS:
+            words.append(word)
+    return words
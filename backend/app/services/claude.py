@@ -1,7 +1,16 @@
 import anthropic
+import asyncio
 import json
-from typing import Optional, Dict, List
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Callable
 from ..config import get_settings
+from .llm_client import create_message
+from .json_utils import parse_json_response
+from .prompt_parts import PromptParts
+from .chunking import chunk_text, estimate_tokens
+from .excerpts import select_excerpts
+from .transcript import prepare_transcript_for_llm
+from .source_verification import needs_verification, interview_clip_needs_search, is_retry_due, record_attempt
 from .perspectives import (
     get_critical_analysis_prompt,
     get_perspective,
@@ -15,17 +24,8 @@ settings = get_settings()
 MODEL_FAST = "claude-3-haiku-20240307"  # 1단계: 빠른 필터링
 MODEL_QUALITY = "claude-sonnet-4-20250514"  # 2~3단계: 상세 분석
 
-# 1단계: 영상 분석 + 소재 적합성 판단 + 영상 구조 분석 프롬프트
-ANALYSIS_PROMPT_WITH_SUITABILITY = """너는 투자 유튜브 콘텐츠 기획자야.
-
-아래 영상 자막을 분석해서 세 가지를 출력해줘.
-
-[영상 자막]
-{transcript}
-
----
-
-[출력 형식 - 반드시 JSON 형식으로 응답]
+# 1단계 출력 형식 (단일 분석 / 구간 결과 종합 공통)
+ANALYSIS_OUTPUT_FORMAT = """[출력 형식 - 반드시 JSON 형식으로 응답]
 {{
     "video_analysis": {{
         "summary": "영상 요약 (3~5문장으로 핵심 내용 정리)",
@@ -129,45 +129,103 @@ ANALYSIS_PROMPT_WITH_SUITABILITY = """너는 투자 유튜브 콘텐츠 기획
    - structure_summary는 "후킹(질문) → 권위 → 주장 → 근거 → CTA" 형식으로 요약
 """
 
+# 1단계: 영상 분석 + 소재 적합성 판단 + 영상 구조 분석 프롬프트
+# 고정 지시문(프롬프트 캐시 대상)을 앞에, 자막을 뒤에 둠
+ANALYSIS_PROMPT_WITH_SUITABILITY = """너는 투자 유튜브 콘텐츠 기획자야.
+
+맨 아래 [영상 자막]을 분석해서 세 가지를 출력해줘.
+
+---
+
+""" + ANALYSIS_OUTPUT_FORMAT
+
+ANALYSIS_TRANSCRIPT_INPUT = """[영상 자막]
+{transcript}"""
+
+# 1단계 (긴 자막, map): 구간별 부분 분석 프롬프트 (짧아서 프롬프트 캐시 대상 아님)
+CHUNK_ANALYSIS_PROMPT = """너는 투자 유튜브 콘텐츠 기획자야.
+
+맨 아래 [자막 구간]은 긴 영상 자막을 여러 구간으로 나눈 것 중 하나야.
+이 구간에 나온 내용만 정리해줘. 나중에 다른 구간 결과와 합쳐서 영상 전체를 분석할 거야.
+
+---
+
+[출력 형식 - 반드시 JSON 형식으로 응답]
+{{
+    "summary": "이 구간 요약 (2~3문장)",
+    "key_points": ["이 구간의 주요 내용"],
+    "quotes": [
+        {{"text": "콘텐츠에 활용 가능한 명언/발언 원문", "speaker": "발언자"}}
+    ],
+    "people": [
+        {{"name": "인물명", "role": "한 줄 설명"}}
+    ],
+    "investment_strategy": "이 구간에서 말하는 투자법/철학 (없으면 null)",
+    "source_tracking": [
+        {{
+            "quote": "인용된 문장",
+            "source_title": "원본 출처 (책 제목, 인터뷰명 등)",
+            "source_type": "책|인터뷰 영상|기사|주주서한|논문|보고서|출처 확인 필요",
+            "source_url": "실제 접근 가능한 URL 또는 null",
+            "search_keywords": ["검색 키워드1", "검색 키워드2"]
+        }}
+    ],
+    "structure_items": [
+        {{
+            "element": "후킹|권위 인정|핵심 주장|근거 제시|반박/모순 제기|해결 암시|꿀팁|CTA",
+            "type": "후킹일 때만 질문형|충격형|공감형|권위형, 그 외 null",
+            "description": "실제 사용된 문장이나 방식"
+        }}
+    ]
+}}
+
+주의사항:
+1. 반드시 유효한 JSON 형식으로만 응답하세요.
+2. 한국어로 분석해주세요.
+3. quotes는 자막에서 실제로 나온 문장을 그대로 사용하세요.
+4. 해당 내용이 없는 항목은 빈 배열로 응답하세요.
+"""
+
+CHUNK_TRANSCRIPT_INPUT = """[자막 구간 {index}/{total}]
+{transcript}"""
+
+# 1단계 (긴 자막, reduce): 구간별 부분 분석 결과 종합 프롬프트
+REDUCE_ANALYSIS_PROMPT = """너는 투자 유튜브 콘텐츠 기획자야.
+
+맨 아래 [구간별 분석 결과]는 긴 영상 자막을 여러 구간으로 나눠 분석한 부분 결과야 (구간 순서대로).
+이 결과들을 종합해서 영상 전체에 대한 세 가지를 출력해줘.
+(중복된 내용은 합치고, video_structure는 영상 전체 흐름 순서로 order를 다시 매겨줘)
 
-def parse_json_response(response_text: str) -> Dict:
-    """Claude 응답에서 JSON 파싱"""
-    if "```json" in response_text:
-        json_start = response_text.find("```json") + 7
-        json_end = response_text.find("```", json_start)
-        response_text = response_text[json_start:json_end].strip()
-    elif "```" in response_text:
-        json_start = response_text.find("```") + 3
-        json_end = response_text.find("```", json_start)
-        response_text = response_text[json_start:json_end].strip()
+---
+
+""" + ANALYSIS_OUTPUT_FORMAT
 
-    return json.loads(response_text)
+REDUCE_PARTIALS_INPUT = """[구간별 분석 결과 - 전체 {total}개 구간]
+{partials}"""
 
 
 async def analyze_transcript(transcript: str) -> tuple[Optional[Dict], Optional[str]]:
     """
     Claude API로 자막 분석 (영상 분석 + 소재 적합성 판단)
+    분석 전에 로컬 전처리(추임새/반복 제거, 선택적 추출 요약)로 입력 토큰을 줄이고, 긴 자막은 토큰 예산 단위 구간으로 나눠 병렬 분석(map) 후 종합(reduce)
 
     Returns:
         Tuple[Optional[Dict], Optional[str]]: (분석 결과, 에러 메시지)
     """
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
-        # 자막이 너무 길면 잘라내기 (Haiku 최적화)
-        max_length = 50000
-        if len(transcript) > max_length:
-            transcript = transcript[:max_length] + "... (자막 일부 생략)"
-
-        message = client.messages.create(
+        transcript = await prepare_transcript_for_llm(transcript)
+        if estimate_tokens(transcript) > settings.stage1_single_pass_tokens:
+            return await analyze_transcript_chunked(transcript)
+
+        message = await create_message(
+            PromptParts(
+                static=ANALYSIS_PROMPT_WITH_SUITABILITY.format(),
+                dynamic=ANALYSIS_TRANSCRIPT_INPUT.format(transcript=transcript)
+            ),
             model=MODEL_FAST,  # Haiku - 빠른 1단계 분석
             max_tokens=4096,
-            messages=[
-                {
-                    "role": "user",
-                    "content": ANALYSIS_PROMPT_WITH_SUITABILITY.format(transcript=transcript)
-                }
-            ]
+            label="stage1",
+            validate=parse_json_response
         )
 
         # 응답 텍스트 추출
@@ -187,6 +245,72 @@ async def analyze_transcript(transcript: str) -> tuple[Optional[Dict], Optional[
         return None, f"분석 중 오류 발생: {str(e)}"
 
 
+async def analyze_transcript_chunked(transcript: str) -> tuple[Optional[Dict], Optional[str]]:
+    """
+    긴 자막 1단계 분석 (map-reduce)
+    - map: 구간별 부분 분석을 동시에 실행 (동시 실행 수는 settings.stage1_map_concurrency로 제한)
+    - reduce: 부분 결과를 모아 영상 전체 분석 결과 형식으로 종합
+    일부 구간 분석이 실패해도 성공한 구간으로 종합 (모두 실패하면 에러)
+
+    Returns:
+        Tuple[Optional[Dict], Optional[str]]: (분석 결과, 에러 메시지)
+    """
+    chunks = chunk_text(transcript, settings.stage1_chunk_tokens)
+    total = len(chunks)
+    semaphore = asyncio.Semaphore(settings.stage1_map_concurrency)
+
+    async def analyze_chunk(index: int, chunk: str) -> Optional[Dict]:
+        async with semaphore:
+            try:
+                # 고정 지시문이 짧아서(Haiku 최소 캐시 길이 미만) 프롬프트 캐시 없이 하나의 문자열로 전송
+                message = await create_message(
+                    PromptParts(
+                        static=CHUNK_ANALYSIS_PROMPT.format(),
+                        dynamic=CHUNK_TRANSCRIPT_INPUT.format(index=index, total=total, transcript=chunk)
+                    ).render(),
+                    model=MODEL_FAST,
+                    max_tokens=2048,
+                    label="stage1_map",
+                    validate=parse_json_response
+                )
+                return parse_json_response(message.content[0].text)
+            except (anthropic.AuthenticationError, anthropic.RateLimitError):
+                raise
+            except Exception as e:
+                print(f"[Stage1] 구간 {index}/{total} 분석 오류: {e}", flush=True)
+                return None
+
+    print(f"[Stage1] 긴 자막 {total}개 구간 병렬 분석", flush=True)
+    results = await asyncio.gather(*(analyze_chunk(i, chunk) for i, chunk in enumerate(chunks, start=1)))
+
+    partials = [
+        {"part": index, **result}
+        for index, result in enumerate(results, start=1)
+        if result is not None
+    ]
+    if not partials:
+        return None, "구간 분석이 모두 실패했습니다."
+
+    message = await create_message(
+        PromptParts(
+            static=REDUCE_ANALYSIS_PROMPT.format(),
+            dynamic=REDUCE_PARTIALS_INPUT.format(
+                total=total,
+                partials=json.dumps(partials, ensure_ascii=False, indent=1)
+            )
+        ),
+        model=MODEL_FAST,
+        max_tokens=4096,
+        label="stage1_reduce",
+        validate=parse_json_response
+    )
+
+    try:
+        return parse_json_response(message.content[0].text), None
+    except json.JSONDecodeError as e:
+        return None, f"분석 결과 파싱 오류: {str(e)}"
+
+
 async def analyze_critical_v2(
     perspective_id: str,
     summary: str,
@@ -226,8 +350,6 @@ async def analyze_critical_v2(
                     "reason": suitability_analysis.get('unsuitable_reason', '소재 부적합')
                 }, None
 
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
-
         # Tavily로 보완 사례 검색 (자동매매 관점일 때만)
         improvement_search_results = []
         if perspective_id == "auto_trading":
@@ -254,7 +376,7 @@ async def analyze_critical_v2(
 
             print(f"[Improvement Search] Total results: {len(improvement_search_results)}")
 
-        # 1단계 결과 기반 프롬프트 생성 (보완 사례 검색 결과 포함)
+        # 1단계 결과 기반 프롬프트 생성 (관점별 고정 지시문 + 1단계 결과/보완 사례 검색 결과)
         prompt = get_critical_analysis_prompt(
             perspective_id=perspective_id,
             summary=summary,
@@ -268,15 +390,12 @@ async def analyze_critical_v2(
             improvement_search_results=improvement_search_results
         )
 
-        message = client.messages.create(
+        message = await create_message(
+            prompt,
             model=MODEL_QUALITY,  # Sonnet - 고품질 2단계 분석
             max_tokens=8192,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            label="stage2_critical",
+            validate=parse_json_response
         )
 
         response_text = message.content[0].text
@@ -353,24 +472,18 @@ async def analyze_contradictions(
         return [], None
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
         perspective = get_perspective(perspective_id)
 
-        prompt = get_contradiction_analysis_prompt(
-            perspective.name,
-            transcript[:5000],  # 모순 분석은 요약된 버전 사용
-            critical_points
-        )
+        # 비판 포인트와 관련된 구간만 발췌 (BM25 점수 계산은 워커 스레드에서)
+        excerpt = await asyncio.to_thread(select_excerpts, transcript, critical_points)
+        prompt = get_contradiction_analysis_prompt(perspective.name, excerpt, critical_points)
 
-        message = client.messages.create(
+        message = await create_message(
+            prompt,
             model=MODEL_QUALITY,  # Sonnet - 고품질 3단계 분석
             max_tokens=8192,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ]
+            label="stage3_contradictions",
+            validate=parse_json_response
         )
 
         response_text = message.content[0].text
@@ -390,6 +503,65 @@ async def analyze_contradictions(
         return None, f"모순 분석 중 오류 발생: {str(e)}"
 
 
+@dataclass
+class SourceLookup:
+    """출처 검색 작업 1건 (검색 결과를 target dict에 반영)"""
+    label: str
+    target: Dict
+    url_field: str
+    search: Callable[..., Dict]
+    args: tuple
+    verified_field: Optional[str] = "verified"
+    query_field: Optional[str] = None
+
+
+async def run_source_lookups(lookups: List[SourceLookup]) -> List[Optional[Dict]]:
+    """
+    출처 검색 작업들을 동시에 실행하고 결과를 각 항목에 반영
+
+    - 동시 실행 수는 settings.tavily_max_concurrency로 제한
+      (실제 Tavily HTTP 요청 수는 tavily_search에서 요청 단위 슬롯으로 제한 - 캐스케이드/타임아웃 후 남은 요청 포함)
+    - 항목별 타임아웃(settings.tavily_item_timeout) 초과/오류 시 해당 항목은 변경하지 않음
+    - 성공/실패와 관계없이 항목별 검증 시도를 기록 (재검증 백오프용)
+
+    Returns:
+        lookups 순서와 같은 검색 결과 리스트 (실패한 항목은 None)
+    """
+    if not lookups:
+        return []
+
+    semaphore = asyncio.Semaphore(settings.tavily_max_concurrency)
+
+    async def run_one(lookup: SourceLookup) -> Optional[Dict]:
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(lookup.search, *lookup.args),
+                    timeout=settings.tavily_item_timeout
+                )
+            except asyncio.TimeoutError:
+                print(f"[Tavily] {lookup.label} 검색 타임아웃 ({settings.tavily_item_timeout}s)", flush=True)
+            except Exception as e:
+                print(f"[Tavily] {lookup.label} 검색 오류: {e}", flush=True)
+            return None
+
+    print(f"[Tavily] 출처 검색 {len(lookups)}건 동시 실행", flush=True)
+    results = await asyncio.gather(*(run_one(lookup) for lookup in lookups))
+
+    for lookup, result in zip(lookups, results):
+        record_attempt(lookup.target, lookup.url_field, bool(result and result.get("found")))
+        if result is None:
+            continue
+        lookup.target[lookup.url_field] = result.get("url")
+        if lookup.verified_field:
+            lookup.target[lookup.verified_field] = result.get("found", False)
+        if lookup.query_field:
+            lookup.target[lookup.query_field] = result.get("search_query", lookup.args[0])
+        print(f"[Tavily] {lookup.label} 결과: found={result.get('found')}, url={result.get('url')}", flush=True)
+
+    return results
+
+
 async def verify_sources(analysis_result: Dict) -> Dict:
     """
     Claude가 언급한 출처들을 Tavily로 검증하고 실제 URL 추가
@@ -404,6 +576,8 @@ async def verify_sources(analysis_result: Dict) -> Dict:
 
     print("[Tavily] verify_sources 호출됨")
 
+    lookups: List[SourceLookup] = []
+
     # 1. 출처 추적 (source_tracking) 검증
     if "video_analysis" in analysis_result and "source_tracking" in analysis_result["video_analysis"]:
         sources = analysis_result["video_analysis"]["source_tracking"]
@@ -415,19 +589,20 @@ async def verify_sources(analysis_result: Dict) -> Dict:
             quote = source.get("quote", "")
             existing_url = source.get("source_url")
 
-            print(f"[Tavily] [{i+1}] 출처: {source_title}, 유형: {source_type}, 기존URL: {existing_url}")
-
-            # URL이 없거나 null인 경우 검색
-            if source_title and (not existing_url or existing_url == "null" or existing_url is None):
-                print(f"[Tavily] [{i+1}] Tavily 검색 시작: {source_title}")
-                result = search_source_by_type(source_title, source_type, quote)
-                print(f"[Tavily] [{i+1}] 검색 결과: found={result.get('found')}, url={result.get('url')}")
-
-                source["source_url"] = result.get("url")
-                source["verified"] = result.get("found", False)
-                source["search_query"] = result.get("search_query", source_title)
+            # URL이 없거나 폴백 URL인 경우 검색 (백오프 기간 중이면 스킵)
+            if source_title and needs_verification(source, "source_url"):
+                lookups.append(SourceLookup(
+                    label=f"source_tracking[{i}]",
+                    target=source,
+                    url_field="source_url",
+                    search=search_source_by_type,
+                    args=(source_title, source_type, quote),
+                    query_field="search_query",
+                ))
             else:
-                print(f"[Tavily] [{i+1}] 이미 URL 있음, 스킵")
+                print(f"[Tavily] [{i+1}] URL 있음 또는 재검증 대기 중, 스킵 (기존URL: {existing_url})")
+
+    await run_source_lookups(lookups)
 
     # 2. 소재 적합성의 출처들은 별도 처리 불필요 (텍스트만 있음)
 
@@ -448,72 +623,59 @@ async def verify_critical_sources(critical_result: Dict) -> Dict:
 
     print("[Tavily] verify_critical_sources 호출됨")
 
-    def needs_url_search(url_value):
-        """URL 검색이 필요한지 확인 (null, 빈값, 'null' 문자열 등)"""
-        if not url_value:
-            return True
-        if isinstance(url_value, str):
-            url_lower = url_value.lower().strip()
-            if url_lower in ['null', 'none', '', '-']:
-                return True
-            # Google 검색 URL도 재검색 대상
-            if 'google.com/search' in url_lower:
-                return True
-        return False
+    lookups: List[SourceLookup] = []
 
     # 1. 숨겨진 전제 (hidden_premises) 출처 검증
     if "hidden_premises" in critical_result:
         print(f"[Tavily] hidden_premises 개수: {len(critical_result['hidden_premises'])}")
         for i, premise in enumerate(critical_result["hidden_premises"]):
-            if isinstance(premise, dict) and premise.get("source"):
-                current_url = premise.get("source_url")
-                print(f"[Tavily] hidden_premise[{i}] 현재 source_url: {current_url}")
-                if needs_url_search(current_url):
-                    print(f"[Tavily] hidden_premise[{i}] 검색: {premise.get('source')}")
-                    result = search_source_by_type(premise["source"], "기타", premise.get("premise", ""))
-                    premise["source_url"] = result.get("url")
-                    premise["verified"] = result.get("found", False)
-                    print(f"[Tavily] hidden_premise[{i}] 결과: found={result.get('found')}, url={result.get('url')}")
+            if isinstance(premise, dict) and premise.get("source") and needs_verification(premise, "source_url"):
+                lookups.append(SourceLookup(
+                    label=f"hidden_premise[{i}]",
+                    target=premise,
+                    url_field="source_url",
+                    search=search_source_by_type,
+                    args=(premise["source"], "기타", premise.get("premise", "")),
+                ))
 
     # 2. 현실적 모순 (realistic_contradictions) 출처 검증
     if "realistic_contradictions" in critical_result:
         print(f"[Tavily] realistic_contradictions 개수: {len(critical_result['realistic_contradictions'])}")
         for i, contradiction in enumerate(critical_result["realistic_contradictions"]):
-            if isinstance(contradiction, dict) and contradiction.get("source"):
-                current_url = contradiction.get("source_url")
-                print(f"[Tavily] contradiction[{i}] 현재 source_url: {current_url}")
-                if needs_url_search(current_url):
-                    print(f"[Tavily] contradiction[{i}] 검색: {contradiction.get('source')}")
-                    result = search_source_by_type(contradiction["source"], "기타", contradiction.get("strategy", ""))
-                    contradiction["source_url"] = result.get("url")
-                    contradiction["verified"] = result.get("found", False)
-                    print(f"[Tavily] contradiction[{i}] 결과: found={result.get('found')}, url={result.get('url')}")
+            if isinstance(contradiction, dict) and contradiction.get("source") and needs_verification(contradiction, "source_url"):
+                lookups.append(SourceLookup(
+                    label=f"contradiction[{i}]",
+                    target=contradiction,
+                    url_field="source_url",
+                    search=search_source_by_type,
+                    args=(contradiction["source"], "기타", contradiction.get("strategy", "")),
+                ))
 
     # 3. 출처 기반 모순 분석 (source_based_contradictions) 출처 검증
     if "source_based_contradictions" in critical_result:
         print(f"[Tavily] source_based_contradictions 개수: {len(critical_result['source_based_contradictions'])}")
         for i, item in enumerate(critical_result["source_based_contradictions"]):
-            if isinstance(item, dict):
-                # 원본 출처
-                if item.get("original_source") and needs_url_search(item.get("original_source_url")):
-                    print(f"[Tavily] sbc[{i}] original 검색: {item.get('original_source')}")
-                    result = search_source_by_type(item["original_source"], "기타", item.get("original_claim", ""))
-                    item["original_source_url"] = result.get("url")
-                    print(f"[Tavily] sbc[{i}] original 결과: {result.get('url')}")
-
-                # 반례 출처
-                if item.get("counterexample_source") and needs_url_search(item.get("counterexample_source_url")):
-                    print(f"[Tavily] sbc[{i}] counter 검색: {item.get('counterexample_source')}")
-                    result = search_source_by_type(item["counterexample_source"], "기타", item.get("counterexample", ""))
-                    item["counterexample_source_url"] = result.get("url")
-                    print(f"[Tavily] sbc[{i}] counter 결과: {result.get('url')}")
-
-                # 숨겨진 조건 출처
-                if item.get("hidden_condition_source") and needs_url_search(item.get("hidden_condition_source_url")):
-                    print(f"[Tavily] sbc[{i}] hidden 검색: {item.get('hidden_condition_source')}")
-                    result = search_source_by_type(item["hidden_condition_source"], "기타", item.get("hidden_condition", ""))
-                    item["hidden_condition_source_url"] = result.get("url")
-                    print(f"[Tavily] sbc[{i}] hidden 결과: {result.get('url')}")
+            if not isinstance(item, dict):
+                continue
+            # 원본 출처 / 반례 출처 / 숨겨진 조건 출처
+            for prefix, context_field in [
+                ("original", "original_claim"),
+                ("counterexample", "counterexample"),
+                ("hidden_condition", "hidden_condition"),
+            ]:
+                source_field = f"{prefix}_source"
+                url_field = f"{prefix}_source_url"
+                if item.get(source_field) and needs_verification(item, url_field):
+                    lookups.append(SourceLookup(
+                        label=f"sbc[{i}].{prefix}",
+                        target=item,
+                        url_field=url_field,
+                        search=search_source_by_type,
+                        args=(item[source_field], "기타", item.get(context_field, "")),
+                        verified_field=None,
+                    ))
+
+    await run_source_lookups(lookups)
 
     print(f"[Tavily] verify_critical_sources 완료")
     return critical_result
@@ -531,22 +693,10 @@ async def verify_additional_sources(additional_result: Dict) -> Dict:
     """
     from .tavily_search import search_interview_clip, search_evidence_source, search_book_source
 
-    def needs_url_search(url_value):
-        """URL 검색이 필요한지 확인"""
-        if not url_value:
-            return True
-        if isinstance(url_value, str):
-            url_lower = url_value.lower().strip()
-            if url_lower in ['null', 'none', '', '-']:
-                return True
-            if url_lower.startswith('검색:'):
-                return True
-            if 'google.com/search' in url_lower:
-                return True
-        return False
-
     print("[Tavily] verify_additional_sources 호출됨", flush=True)
 
+    lookups: List[SourceLookup] = []
+
     # 1. video_sources.interview_clips 검증 (YouTube 우선)
     video_sources = additional_result.get("video_sources", {})
     if video_sources:
@@ -554,41 +704,43 @@ async def verify_additional_sources(additional_result: Dict) -> Dict:
         if interview_clips:
             print(f"[Tavily] interview_clips 개수: {len(interview_clips)}", flush=True)
             for i, clip in enumerate(interview_clips):
-                if isinstance(clip, dict) and needs_url_search(clip.get("link")):
-                    person = clip.get("person", "")
-                    video_title = clip.get("video_title", "")
-                    quote = clip.get("quote", "")
-                    print(f"[Tavily] interview_clip[{i}] 검색: {person} - {video_title}", flush=True)
-                    result = search_interview_clip(person, video_title, quote)
-                    clip["link"] = result.get("url")
-                    clip["verified"] = result.get("found", False)
-                    print(f"[Tavily] interview_clip[{i}] 결과: {result.get('url')}", flush=True)
+                if isinstance(clip, dict) and interview_clip_needs_search(clip) and is_retry_due(clip, "link"):
+                    lookups.append(SourceLookup(
+                        label=f"interview_clip[{i}]",
+                        target=clip,
+                        url_field="link",
+                        search=search_interview_clip,
+                        args=(clip.get("person", ""), clip.get("video_title", ""), clip.get("quote", "")),
+                    ))
 
         # 2. video_sources.evidence_sources 검증
         evidence_sources = video_sources.get("evidence_sources", [])
         if evidence_sources:
             print(f"[Tavily] evidence_sources 개수: {len(evidence_sources)}", flush=True)
             for i, ev in enumerate(evidence_sources):
-                if isinstance(ev, dict) and needs_url_search(ev.get("link")):
-                    evidence = ev.get("evidence", "")
-                    source_type = ev.get("source_type", "")
-                    print(f"[Tavily] evidence[{i}] 검색: {evidence} ({source_type})", flush=True)
-                    result = search_evidence_source(evidence, source_type)
-                    ev["link"] = result.get("url")
-                    ev["verified"] = result.get("found", False)
-                    print(f"[Tavily] evidence[{i}] 결과: {result.get('url')}", flush=True)
+                if isinstance(ev, dict) and needs_verification(ev, "link"):
+                    lookups.append(SourceLookup(
+                        label=f"evidence[{i}]",
+                        target=ev,
+                        url_field="link",
+                        search=search_evidence_source,
+                        args=(ev.get("evidence", ""), ev.get("source_type", "")),
+                    ))
 
     # 3. bonus_tip.source_url 검증
     bonus_tip = additional_result.get("bonus_tip", {})
     if bonus_tip and isinstance(bonus_tip, dict):
-        if needs_url_search(bonus_tip.get("source_url")):
-            source = bonus_tip.get("source", "")
-            if source:
-                print(f"[Tavily] bonus_tip 검색: {source}", flush=True)
-                result = search_book_source(source)  # 교보문고 우선
-                bonus_tip["source_url"] = result.get("url")
-                bonus_tip["verified"] = result.get("found", False)
-                print(f"[Tavily] bonus_tip 결과: {result.get('url')}", flush=True)
+        source = bonus_tip.get("source", "")
+        if source and needs_verification(bonus_tip, "source_url"):
+            lookups.append(SourceLookup(
+                label="bonus_tip",
+                target=bonus_tip,
+                url_field="source_url",
+                search=search_book_source,  # 교보문고 우선
+                args=(source,),
+            ))
+
+    await run_source_lookups(lookups)
 
     print("[Tavily] verify_additional_sources 완료", flush=True)
     return additional_result
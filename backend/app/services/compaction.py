@@ -0,0 +1,47 @@
+"""
+중복 분석 행 일회성 정리
+- video_id 유니크 인덱스를 만들기 전에 한 번 실행 (인덱스 생성 후에는 upsert로 중복이 생기지 않음)
+- 한 번에 analysis_compaction_batch_size개 영상씩 정리, 배치마다 RPC 1회 = 트랜잭션 1개로 커밋
+- 실행: backend 폴더에서 python -m app.services.compaction
+- 순서: supabase_migration_video_id_unique.sql → 이 스크립트 → supabase_migration_video_id_unique_index.sql
+"""
+
+import asyncio
+from ..config import get_settings
+
+
+async def compact_all_duplicates() -> int:
+    """
+    중복 행이 없어질 때까지 배치 단위로 정리
+
+    Returns:
+        삭제된 행 수
+    """
+    from ..database import compact_duplicate_analyses
+
+    settings = get_settings()
+    total_removed = 0
+
+    while True:
+        result = await compact_duplicate_analyses(settings.analysis_compaction_batch_size)
+        removed = int(result.get("removed") or 0)
+        if removed == 0:
+            break
+        total_removed += removed
+        print(f"[Compaction] 중복 행 {removed}개 정리 (영상 {len(result.get('video_ids') or [])}개)", flush=True)
+
+    return total_removed
+
+
+async def main() -> None:
+    from ..database import close_supabase
+
+    try:
+        removed = await compact_all_duplicates()
+        print(f"[Compaction] 중복 행 정리 완료: 총 {removed}개 삭제", flush=True)
+    finally:
+        await close_supabase()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""
+자막 관련 구간 발췌
+- 자막을 짧은 단위(문장, 구두점이 없으면 단어 묶음)로 나눠 BM25 색인
+- 질의(핵심 내용, 인용문, 비판 포인트 등)마다 점수를 정규화해서 합산 → 질의별로 고르게 반영
+- 점수가 높은 단위를 앞뒤 문맥과 함께 글자 수 예산 안에서 선택, 원래 순서로 반환
+- 일치하는 단어가 없으면 기존처럼 앞부분 사용
+"""
+
+import math
+from collections import Counter
+from typing import List, Tuple
+from .chunking import estimate_tokens, split_sentences, split_words, content_words
+
+# 발췌 단위 최대 토큰 수
+EXCERPT_UNIT_TOKENS = 40
+
+# 선택한 단위 앞뒤로 함께 넣을 문맥 단위 수
+CONTEXT_UNITS = 1
+
+# 떨어진 발췌 구간 사이 구분자
+EXCERPT_SEPARATOR = "\n...\n"
+
+# BM25 파라미터
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def split_units(text: str) -> List[str]:
+    units = []
+    for sentence in split_sentences(text):
+        if estimate_tokens(sentence) > EXCERPT_UNIT_TOKENS:
+            units.extend(split_words(sentence, EXCERPT_UNIT_TOKENS))
+        else:
+            units.append(sentence)
+    return units
+
+
+class BM25Index:
+    """단위 목록 BM25 색인"""
+
+    def __init__(self, documents: List[List[str]]):
+        self.term_counts = [Counter(doc) for doc in documents]
+        self.lengths = [len(doc) for doc in documents]
+        self.average_length = (sum(self.lengths) / len(documents)) if documents else 0.0
+
+        df = Counter()
+        for counts in self.term_counts:
+            df.update(counts.keys())
+        n = len(documents)
+        self.idf = {term: math.log(1 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()}
+
+    def scores(self, query: List[str]) -> List[float]:
+        terms = [t for t in set(query) if t in self.idf]
+        results = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.average_length or 1))
+            score = 0.0
+            for term in terms:
+                tf = counts.get(term, 0)
+                if tf:
+                    score += self.idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+
+def merge_windows(indexes: List[int], count: int) -> List[Tuple[int, int]]:
+    """선택한 단위 + 앞뒤 문맥 → 겹치는 구간을 합친 [start, end) 목록"""
+    windows = []
+    for i in sorted(indexes):
+        start, end = max(0, i - CONTEXT_UNITS), min(count, i + CONTEXT_UNITS + 1)
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def select_excerpts(transcript: str, queries: List[str], max_chars: int = 5000) -> str:
+    """
+    질의와 관련도가 높은 자막 구간을 글자 수 예산 안에서 발췌
+
+    Args:
+        transcript: 전체 자막 텍스트
+        queries: 질의 문장 목록 (핵심 내용, 인용문, 비판 포인트 등)
+        max_chars: 발췌 결과 최대 글자 수
+
+    Returns:
+        원래 순서로 이은 발췌 텍스트 (떨어진 구간은 "..."로 구분)
+    """
+    if len(transcript) <= max_chars:
+        return transcript
+
+    units = split_units(transcript)
+    index = BM25Index([content_words(u) for u in units])
+
+    # 질의별 최고 점수로 정규화해서 합산
+    totals = [0.0] * len(units)
+    for query in queries:
+        scores = index.scores(content_words(query))
+        best = max(scores, default=0.0)
+        if best > 0:
+            for i, score in enumerate(scores):
+                totals[i] += score / best
+
+    ranked = [i for i in sorted(range(len(units)), key=lambda i: totals[i], reverse=True) if totals[i] > 0]
+    if not ranked:
+        return transcript[:max_chars]
+
+    # 점수 순으로 추가하면서 문맥 포함 길이가 예산을 넘지 않는 단위만 선택
+    selected: List[int] = []
+    for i in ranked:
+        windows = merge_windows(selected + [i], len(units))
+        length = sum(len(" ".join(units[s:e])) for s, e in windows) + len(EXCERPT_SEPARATOR) * (len(windows) - 1)
+        if length <= max_chars:
+            selected.append(i)
+
+    if not selected:
+        return transcript[:max_chars]
+
+    return EXCERPT_SEPARATOR.join(" ".join(units[s:e]) for s, e in merge_windows(selected, len(units)))
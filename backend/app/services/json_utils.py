@@ -0,0 +1,22 @@
+"""
+LLM 응답 JSON 파싱
+- 코드 블록(```json ... ```)으로 감싼 응답도 처리
+- 여러 분석 모듈이 함께 쓰도록 의존성 없이 분리
+"""
+
+import json
+from typing import Dict
+
+
+def parse_json_response(response_text: str) -> Dict:
+    """Claude 응답에서 JSON 파싱"""
+    if "```json" in response_text:
+        json_start = response_text.find("```json") + 7
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+    elif "```" in response_text:
+        json_start = response_text.find("```") + 3
+        json_end = response_text.find("```", json_start)
+        response_text = response_text[json_start:json_end].strip()
+
+    return json.loads(response_text)
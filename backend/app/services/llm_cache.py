@@ -0,0 +1,191 @@
+"""
+LLM 응답 디스크 캐시 (content-addressed)
+- SQLite 파일에 저장 (서버 재시작 후에도 유지, 워커 간 공유)
+- 키: 모델 + 단계(label) + 프롬프트 템플릿 버전 + 렌더링된 프롬프트 + max_tokens 해시
+  → 같은 1단계 결과로 같은 관점 2단계를 다시 실행하거나 같은 영상을 다시 분석하면 API 호출 없이 재사용
+- 정상 종료(end_turn)된 응답만 저장 (max_tokens로 잘린 응답은 저장하지 않음)
+- 전체 크기가 llm_cache_max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+- 요청 단위 우회: 헤더 "X-LLM-Cache: bypass" 또는 쿼리 "llm_cache=bypass"
+  (캐시를 읽지 않고 새로 호출한 결과로 덮어씀)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+from ..config import get_settings
+
+_connection: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# 프롬프트 템플릿 버전 기본값 (캐시 키에 포함)
+# 프롬프트 텍스트가 바뀌면 키도 바뀌므로, 응답 해석 방식만 바뀐 모듈에서 create_message(template_version=...)로 올림
+PROMPT_TEMPLATE_VERSION = "1"
+
+# 현재 요청에서 캐시 우회 여부 (미들웨어에서 설정)
+_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+# 캐시 통계 (프로세스 단위)
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "bypassed": 0,
+    "writes": 0,
+    "evictions": 0,
+}
+
+# 크기 확인 주기 (쓰기 N회마다)
+EVICT_CHECK_EVERY_WRITES = 20
+
+# 크기 초과 시 이 비율까지 줄임
+EVICT_TARGET_RATIO = 0.9
+
+
+def set_llm_cache_bypass(value: bool) -> None:
+    """현재 요청(컨텍스트)의 캐시 우회 여부 설정"""
+    _bypass.set(value)
+
+
+def is_llm_cache_bypassed() -> bool:
+    return _bypass.get()
+
+
+def get_llm_cache_key(model: str, label: str, template_version: str, prompt: str, max_tokens: int) -> str:
+    """모델 + 단계 + 템플릿 버전 + 프롬프트 + max_tokens로 캐시 키 생성"""
+    raw = json.dumps(
+        [model, label, template_version, prompt, max_tokens],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_connection() -> sqlite3.Connection:
+    """SQLite 연결 (최초 호출 시 테이블 생성)"""
+    global _connection
+
+    if _connection is None:
+        settings = get_settings()
+        directory = os.path.dirname(settings.llm_cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        _connection = sqlite3.connect(settings.llm_cache_path, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                key TEXT PRIMARY KEY,
+                label TEXT NOT NULL,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        _connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses (last_access)"
+        )
+        _connection.commit()
+
+    return _connection
+
+
+def get_cached_response(key: str) -> Optional[str]:
+    """
+    캐시된 응답 조회 (적중 시 마지막 사용 시각 갱신)
+
+    Returns:
+        응답 JSON 문자열 (미존재 시 None)
+    """
+    try:
+        with _lock:
+            conn = get_connection()
+            row = conn.execute("SELECT response FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                _stats["misses"] += 1
+                return None
+
+            _stats["hits"] += 1
+            conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return row[0]
+    except sqlite3.Error as e:
+        print(f"[LLMCache] 조회 오류: {e}")
+        return None
+
+
+def evict_if_needed(conn: sqlite3.Connection) -> None:
+    """전체 크기가 상한을 넘으면 오래 사용하지 않은 항목부터 삭제 (_lock 안에서 호출)"""
+    settings = get_settings()
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+    if total <= settings.llm_cache_max_bytes:
+        return
+
+    target = settings.llm_cache_max_bytes * EVICT_TARGET_RATIO
+    evicted = []
+    for key, size in conn.execute("SELECT key, size FROM llm_responses ORDER BY last_access"):
+        if total <= target:
+            break
+        evicted.append((key,))
+        total -= size
+
+    conn.executemany("DELETE FROM llm_responses WHERE key = ?", evicted)
+    _stats["evictions"] += len(evicted)
+    print(f"[LLMCache] 용량 초과로 {len(evicted)}개 항목 삭제", flush=True)
+
+
+def set_cached_response(key: str, label: str, model: str, response: str) -> None:
+    """응답 캐시 저장"""
+    now = time.time()
+    try:
+        with _lock:
+            conn = get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, label, model, response, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, label, model, response, len(response.encode("utf-8")), now, now)
+            )
+            _stats["writes"] += 1
+            if _stats["writes"] % EVICT_CHECK_EVERY_WRITES == 0:
+                evict_if_needed(conn)
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[LLMCache] 저장 오류: {e}")
+
+
+def record_bypass() -> None:
+    with _lock:
+        _stats["bypassed"] += 1
+
+
+def clear_llm_cache() -> None:
+    """LLM 응답 캐시 전체 삭제"""
+    with _lock:
+        conn = get_connection()
+        conn.execute("DELETE FROM llm_responses")
+        conn.commit()
+
+
+def get_llm_cache_stats() -> Dict:
+    """LLM 응답 캐시 통계 조회"""
+    with _lock:
+        stats = dict(_stats)
+        try:
+            entries, size = get_connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+            stats["entries"] = entries
+            stats["bytes"] = size
+        except sqlite3.Error:
+            stats["entries"] = None
+            stats["bytes"] = None
+
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    return stats
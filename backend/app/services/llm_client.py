@@ -0,0 +1,164 @@
+"""
+Anthropic 비동기 클라이언트 관리 모듈
+- 앱 전체에서 하나의 AsyncAnthropic 클라이언트를 공유
+- httpx 커넥션 풀(keep-alive)로 분석 단계별 요청 재사용
+- 풀 크기/타임아웃은 환경변수(Settings)로 설정
+- 프롬프트 캐시: 고정 지시문(앞부분)에 cache_control을 붙이고 자막/단계 결과(뒷부분)만 매번 새로 전송
+  (단계별 입력/캐시 읽기/캐시 쓰기 토큰 수를 기록)
+- LLM 응답 캐시: 같은 입력의 응답은 디스크 캐시에서 재사용 (llm_cache)
+"""
+
+from typing import Any, Callable, Dict, Optional, Union
+import anthropic
+import httpx
+from ..config import get_settings
+from .llm_cache import (
+    PROMPT_TEMPLATE_VERSION, get_llm_cache_key, get_cached_response, set_cached_response, is_llm_cache_bypassed, record_bypass
+)
+from .single_flight import single_flight
+from .prompt_parts import PromptParts
+
+_anthropic_client: Optional[anthropic.AsyncAnthropic] = None
+
+
+def get_anthropic_client() -> anthropic.AsyncAnthropic:
+    """공유 AsyncAnthropic 클라이언트 반환 (최초 호출 시 생성)"""
+    global _anthropic_client
+
+    if _anthropic_client is None:
+        settings = get_settings()
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=settings.anthropic_max_connections,
+                max_keepalive_connections=settings.anthropic_max_keepalive_connections,
+                keepalive_expiry=settings.anthropic_keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                settings.anthropic_timeout,
+                connect=settings.anthropic_connect_timeout,
+            ),
+        )
+        _anthropic_client = anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=http_client,
+            max_retries=settings.anthropic_max_retries,
+        )
+
+    return _anthropic_client
+
+
+async def close_anthropic_client() -> None:
+    """앱 종료 시 커넥션 풀 정리"""
+    global _anthropic_client
+
+    if _anthropic_client is not None:
+        await _anthropic_client.close()
+        _anthropic_client = None
+
+
+# 단계(label)별 토큰 사용량 (프로세스 단위)
+_usage_stats: Dict[str, Dict[str, int]] = {}
+
+
+def record_usage(label: str, usage) -> None:
+    """응답 usage 기록 (input_tokens는 캐시에서 읽은 토큰을 제외한 값)"""
+    if usage is None:
+        return
+
+    stats = _usage_stats.setdefault(label, {
+        "calls": 0,
+        "input_tokens": 0,
+        "cache_read_input_tokens": 0,
+        "cache_creation_input_tokens": 0,
+        "output_tokens": 0,
+    })
+    stats["calls"] += 1
+    for key in ("input_tokens", "cache_read_input_tokens", "cache_creation_input_tokens", "output_tokens"):
+        stats[key] += getattr(usage, key, 0) or 0
+
+
+def get_llm_usage_stats() -> Dict:
+    """단계별 토큰 사용량 + 프롬프트 캐시 적중 비율"""
+    result = {}
+    for label, stats in _usage_stats.items():
+        stats = dict(stats)
+        prompt_tokens = stats["input_tokens"] + stats["cache_read_input_tokens"] + stats["cache_creation_input_tokens"]
+        stats["cache_read_ratio"] = round(stats["cache_read_input_tokens"] / prompt_tokens, 4) if prompt_tokens else 0.0
+        result[label] = stats
+    return result
+
+
+def is_valid_response(message, validate: Optional[Callable[[str], Any]], label: str) -> bool:
+    """캐시 저장 전 응답 검증 (검증 함수가 없으면 통과)"""
+    if validate is None:
+        return True
+    try:
+        validate(message.content[0].text)
+        return True
+    except Exception as e:
+        print(f"[LLMCache] {label} 응답 검증 실패, 캐시에 저장하지 않음: {e}", flush=True)
+        return False
+
+
+async def create_message(
+    prompt: Union[PromptParts, str],
+    model: str,
+    max_tokens: int,
+    label: str,
+    client: Optional[anthropic.AsyncAnthropic] = None,
+    template_version: str = PROMPT_TEMPLATE_VERSION,
+    use_cache: bool = True,
+    validate: Optional[Callable[[str], Any]] = None,
+):
+    """
+    Claude 메시지 생성 (사용자 메시지 1개)
+    같은 입력의 응답은 LLM 응답 캐시(llm_cache)에서 재사용하고, 동시에 들어온 같은 호출은 하나로 병합
+
+    Args:
+        prompt: PromptParts면 고정 앞부분을 프롬프트 캐시 대상으로 표시, 문자열이면 그대로 전송
+        label: 사용량 기록/캐시 키용 단계 이름
+        client: 사용할 클라이언트 (기본: 공유 클라이언트)
+        template_version: 프롬프트 템플릿 버전 (기본: PROMPT_TEMPLATE_VERSION, 응답 해석 방식이 바뀐 단계만 지정)
+        use_cache: False면 응답 캐시를 사용하지 않음
+        validate: 응답 텍스트 검증 함수 (예: parse_json_response). 예외 없이 통과한 응답만 캐시에 저장
+                  → 파싱할 수 없는 응답은 저장하지 않아서 재시도하면 새로 호출
+    """
+    client = client or get_anthropic_client()
+    content = prompt.to_content() if isinstance(prompt, PromptParts) else prompt
+
+    async def call_api():
+        message = await client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ]
+        )
+        record_usage(label, getattr(message, "usage", None))
+        return message
+
+    settings = get_settings()
+    if not (settings.llm_cache_enabled and use_cache):
+        return await call_api()
+
+    rendered = prompt.render() if isinstance(prompt, PromptParts) else prompt
+    key = get_llm_cache_key(model, label, template_version, rendered, max_tokens)
+
+    if is_llm_cache_bypassed():
+        record_bypass()
+    else:
+        cached = get_cached_response(key)
+        if cached is not None:
+            print(f"[LLMCache] {label} 응답 캐시 사용", flush=True)
+            return anthropic.types.Message.model_validate_json(cached)
+
+    async def call_and_store(_waited: bool):
+        message = await call_api()
+        if getattr(message, "stop_reason", None) == "end_turn" and is_valid_response(message, validate, label):
+            set_cached_response(key, label, model, message.model_dump_json())
+        return message
+
+    return await single_flight(f"llm:{key}", call_and_store, cross_worker=False)
@@ -5,6 +5,7 @@
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+from .prompt_parts import PromptParts
 
 
 @dataclass
@@ -95,22 +96,13 @@ AUTO_TRADING_SCOPE = """
 """
 
 # 비판적 분석 프롬프트 (1단계 결과 기반)
+# 관점별 고정 지시문(프롬프트 캐시 대상)을 앞에, 1단계 결과(CRITICAL_ANALYSIS_INPUT)를 뒤에 둠
 CRITICAL_ANALYSIS_PROMPT = """너는 투자 철학 비평가야. 감정적 비난이 아닌 논리적 근거로 분석해.
 
-[입력 데이터 - 1단계 영상 분석 결과]
-- 영상 요약: {summary}
-- 핵심 메시지: {key_message}
-- 키포인트: {key_points}
-- 거장의 전략: {strategy}
-- 인용할 대사: {quotes}
-- 등장 인물: {people}
-- 출처 추적: {source_tracking}
-- 소재 적합성 판단: {suitability_analysis}
-
 [분석 관점]
 {perspective_name}: {perspective_focus}
 
-위 1단계 분석 결과를 기반으로 비판적 분석을 진행해.
+맨 아래 [입력 데이터]의 1단계 분석 결과를 기반으로 비판적 분석을 진행해.
 
 ---
 
@@ -346,6 +338,32 @@ CRITICAL_ANALYSIS_PROMPT = """너는 투자 철학 비평가야. 감정적 비
 """
 
 
+CRITICAL_ANALYSIS_INPUT = """[입력 데이터 - 1단계 영상 분석 결과]
+- 영상 요약: {summary}
+- 핵심 메시지: {key_message}
+- 키포인트: {key_points}
+- 거장의 전략: {strategy}
+- 인용할 대사: {quotes}
+- 등장 인물: {people}
+- 출처 추적: {source_tracking}
+- 소재 적합성 판단: {suitability_analysis}"""
+
+
+def get_critical_analysis_prefix(perspective_id: str) -> str:
+    """관점별 비판적 분석 고정 지시문 (같은 관점이면 항상 같은 텍스트 → 프롬프트 캐시 적중)"""
+    perspective = get_perspective(perspective_id)
+    prefix = CRITICAL_ANALYSIS_PROMPT.format(
+        perspective_name=perspective.name,
+        perspective_focus=perspective.focus_area
+    )
+
+    # 자동매매 관점일 경우 구현 가능 범위 추가
+    if perspective_id == "auto_trading":
+        prefix = AUTO_TRADING_SCOPE + "\n\n" + prefix
+
+    return prefix
+
+
 def get_critical_analysis_prompt(
     perspective_id: str,
     summary: str,
@@ -357,10 +375,8 @@ def get_critical_analysis_prompt(
     source_tracking: List[Dict],
     suitability_analysis: Dict,
     improvement_search_results: List[Dict] = None
-) -> str:
-    """1단계 결과 기반 비판적 분석 프롬프트 생성"""
-    perspective = get_perspective(perspective_id)
-
+) -> PromptParts:
+    """1단계 결과 기반 비판적 분석 프롬프트 생성 (관점별 고정 지시문 + 1단계 결과)"""
     # 데이터 포맷팅
     key_points_str = '\n'.join([f'  - {p}' for p in key_points]) if key_points else '없음'
 
@@ -387,8 +403,8 @@ def get_critical_analysis_prompt(
   - 판단: {suitability_analysis.get('judgment', '없음')}
 """ if suitability_analysis else '없음'
 
-    # 기본 프롬프트 생성
-    prompt = CRITICAL_ANALYSIS_PROMPT.format(
+    # 1단계 결과 입력
+    prompt = CRITICAL_ANALYSIS_INPUT.format(
         summary=summary or '없음',
         key_message=key_message or '없음',
         key_points=key_points_str,
@@ -396,15 +412,9 @@ def get_critical_analysis_prompt(
         quotes=quotes_str,
         people=people_str,
         source_tracking=source_str,
-        suitability_analysis=suitability_str,
-        perspective_name=perspective.name,
-        perspective_focus=perspective.focus_area
+        suitability_analysis=suitability_str
     )
 
-    # 자동매매 관점일 경우 구현 가능 범위 추가
-    if perspective_id == "auto_trading":
-        prompt = AUTO_TRADING_SCOPE + "\n\n" + prompt
-
     # Tavily 보완 사례 검색 결과 추가
     if improvement_search_results and len(improvement_search_results) > 0:
         improvement_context = "\n\n[참고: Tavily 웹 검색으로 찾은 보완 사례 자료]\n"
@@ -417,7 +427,7 @@ def get_critical_analysis_prompt(
         improvement_context += "\n위 검색 결과를 참고하여 improvement_cases와 differentiation_points를 구체적으로 작성하세요."
         prompt += improvement_context
 
-    return prompt
+    return PromptParts(static=get_critical_analysis_prefix(perspective_id), dynamic=prompt)
 
 
 def get_integrated_analysis_prompt(transcript: str) -> str:
@@ -0,0 +1,25 @@
+"""
+프롬프트 구성 단위
+- 고정 앞부분(지시문/출력 형식)과 매번 바뀌는 뒷부분(자막/단계 결과)을 나눠서 관리
+- 프롬프트 템플릿 모듈이 LLM 클라이언트 없이 가져다 쓸 수 있도록 의존성 없이 분리
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class PromptParts:
+    """고정 앞부분(지시문/출력 형식, 프롬프트 캐시 대상) + 매번 바뀌는 뒷부분(자막/단계 결과)"""
+    static: str
+    dynamic: str
+
+    def to_content(self) -> List[Dict]:
+        return [
+            {"type": "text", "text": self.static, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": self.dynamic},
+        ]
+
+    def render(self) -> str:
+        """캐시 구분 없는 전체 프롬프트 텍스트"""
+        return self.static + "\n\n" + self.dynamic
@@ -0,0 +1,242 @@
+"""
+자막 요청용 프록시 풀
+- 프록시별 지연 시간(EWMA)/성공·실패 통계
+- 가중치 기반 선택: 성공률이 높고 빠른 프록시를 더 자주 사용
+- YouTube 차단/연결 실패 시 지수 백오프로 격리(quarantine), 성공하면 해제
+- 프록시별 동시 요청 수 상한 → 전체 처리량은 프록시 수에 비례
+- 프록시 목록: transcript_proxy_urls(쉼표 구분) + USE_PROXY=true면 Webshare 프록시
+"""
+
+import asyncio
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+import requests
+from youtube_transcript_api import YouTubeTranscriptApi, RequestBlocked, YouTubeRequestFailed
+from youtube_transcript_api.proxies import GenericProxyConfig, WebshareProxyConfig
+from ..config import get_settings
+
+# 지연 시간 EWMA 가중치 (최근 요청 비중)
+LATENCY_ALPHA = 0.3
+
+# 통계가 없을 때 가정하는 지연 시간(초)
+DEFAULT_LATENCY = 1.0
+
+
+class ProxyPoolExhausted(Exception):
+    """대기 시간 안에 사용할 수 있는 프록시가 없음"""
+
+
+def is_route_error(error: Exception) -> bool:
+    """프록시(경로) 문제인지 판별 (자막 없음 등 영상 자체 문제는 제외)"""
+    return isinstance(error, (
+        RequestBlocked,
+        YouTubeRequestFailed,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+    ))
+
+
+class ProxyState:
+    """프록시 하나의 상태와 통계"""
+
+    def __init__(self, name: str, api: YouTubeTranscriptApi):
+        self.name = name
+        self.api = api
+        self.in_flight = 0
+        self.successes = 0
+        self.failures = 0
+        self.blocked = 0
+        self.consecutive_failures = 0
+        self.latency = DEFAULT_LATENCY
+        self.quarantined_until = 0.0
+
+    def is_quarantined(self, now: float) -> bool:
+        return self.quarantined_until > now
+
+    def weight(self) -> float:
+        """선택 가중치 (라플라스 보정 성공률 / 지연 시간)"""
+        success_rate = (self.successes + 1) / (self.successes + self.failures + 2)
+        return success_rate / max(self.latency, 0.05)
+
+    def to_dict(self, now: float) -> Dict:
+        return {
+            "name": self.name,
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "failures": self.failures,
+            "blocked": self.blocked,
+            "latency": round(self.latency, 3),
+            "quarantined_for": max(0, round(self.quarantined_until - now, 1)),
+        }
+
+
+class ProxyLease:
+    """프록시 사용 기간 동안의 결과 기록"""
+
+    def __init__(self, pool: "ProxyPool", proxy: ProxyState):
+        self.pool = pool
+        self.proxy = proxy
+        self.api = proxy.api
+        self.route_failed = False
+
+    def record_success(self, latency: float) -> None:
+        self.pool.record_success(self.proxy, latency)
+
+    def record_failure(self, blocked: bool) -> None:
+        self.route_failed = True
+        self.pool.record_failure(self.proxy, blocked)
+
+
+class ProxyPool:
+    """가중치 기반 프록시 선택 + 격리 + 프록시별 동시 요청 상한"""
+
+    def __init__(self, proxies: List[ProxyState], max_concurrency: int,
+                 backoff_base: float, backoff_max: float, acquire_timeout: float):
+        self.proxies = proxies
+        self.max_concurrency = max_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.acquire_timeout = acquire_timeout
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _available(self, now: float) -> List[ProxyState]:
+        return [
+            p for p in self.proxies
+            if not p.is_quarantined(now) and p.in_flight < self.max_concurrency
+        ]
+
+    def _next_wakeup(self, now: float) -> float:
+        """격리 해제까지 남은 가장 짧은 시간 (최대 1초 간격으로 다시 확인)"""
+        waits = [p.quarantined_until - now for p in self.proxies if p.is_quarantined(now)]
+        return min([1.0] + [w for w in waits if w > 0])
+
+    async def acquire(self) -> ProxyState:
+        """사용 가능한 프록시 중 가중치 비례로 선택 (없으면 대기)"""
+        condition = self._get_condition()
+        deadline = time.monotonic() + self.acquire_timeout
+
+        async with condition:
+            while True:
+                now = time.monotonic()
+                available = self._available(now)
+                if available:
+                    proxy = random.choices(available, weights=[p.weight() for p in available])[0]
+                    proxy.in_flight += 1
+                    return proxy
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise ProxyPoolExhausted("사용 가능한 프록시가 없습니다.")
+                try:
+                    await asyncio.wait_for(condition.wait(), timeout=min(remaining, self._next_wakeup(now)))
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, proxy: ProxyState) -> None:
+        condition = self._get_condition()
+        async with condition:
+            proxy.in_flight -= 1
+            condition.notify()
+
+    @asynccontextmanager
+    async def lease(self):
+        """프록시 하나를 빌려서 사용 (종료 시 반납)"""
+        proxy = await self.acquire()
+        try:
+            yield ProxyLease(self, proxy)
+        finally:
+            await self.release(proxy)
+
+    def record_success(self, proxy: ProxyState, latency: float) -> None:
+        proxy.successes += 1
+        proxy.consecutive_failures = 0
+        proxy.latency = LATENCY_ALPHA * latency + (1 - LATENCY_ALPHA) * proxy.latency
+
+    def record_failure(self, proxy: ProxyState, blocked: bool) -> None:
+        """차단/연결 실패 기록 → 연속 실패 횟수에 따라 격리"""
+        proxy.failures += 1
+        proxy.consecutive_failures += 1
+        if blocked:
+            proxy.blocked += 1
+
+        quarantine = min(self.backoff_base * (2 ** (proxy.consecutive_failures - 1)), self.backoff_max)
+        proxy.quarantined_until = time.monotonic() + quarantine
+        print(f"[ProxyPool] {proxy.name} 격리 {quarantine:.0f}초 (연속 실패 {proxy.consecutive_failures}회)", flush=True)
+
+    def stats(self) -> Dict:
+        now = time.monotonic()
+        return {
+            "proxies": [p.to_dict(now) for p in self.proxies],
+            "available": len(self._available(now)),
+            "max_concurrency": self.max_concurrency,
+        }
+
+
+def mask_proxy_url(url: str) -> str:
+    """통계 표시용 프록시 이름 (인증 정보 제거)"""
+    return url.rsplit("@", 1)[-1]
+
+
+def build_proxies() -> List[ProxyState]:
+    """설정에서 프록시 목록 구성"""
+    settings = get_settings()
+    proxies = []
+
+    for url in settings.transcript_proxy_urls.split(","):
+        url = url.strip()
+        if url:
+            api = YouTubeTranscriptApi(proxy_config=GenericProxyConfig(http_url=url, https_url=url))
+            proxies.append(ProxyState(mask_proxy_url(url), api))
+
+    if os.getenv("USE_PROXY", "false").lower() == "true":
+        proxy_username = os.getenv("WEBSHARE_USERNAME")
+        proxy_password = os.getenv("WEBSHARE_PASSWORD")
+        if proxy_username and proxy_password:
+            api = YouTubeTranscriptApi(
+                proxy_config=WebshareProxyConfig(
+                    proxy_username=proxy_username,
+                    proxy_password=proxy_password,
+                )
+            )
+            proxies.append(ProxyState("webshare", api))
+
+    return proxies
+
+
+_proxy_pool: Optional[ProxyPool] = None
+_proxy_pool_built = False
+
+
+def get_proxy_pool() -> Optional[ProxyPool]:
+    """프록시 풀 반환 (프록시가 설정되지 않았으면 None → 직접 연결)"""
+    global _proxy_pool, _proxy_pool_built
+
+    if not _proxy_pool_built:
+        settings = get_settings()
+        proxies = build_proxies()
+        if proxies:
+            _proxy_pool = ProxyPool(
+                proxies,
+                max_concurrency=settings.transcript_proxy_max_concurrency,
+                backoff_base=settings.transcript_proxy_backoff_base,
+                backoff_max=settings.transcript_proxy_backoff_max,
+                acquire_timeout=settings.transcript_proxy_acquire_timeout,
+            )
+        _proxy_pool_built = True
+
+    return _proxy_pool
+
+
+def get_proxy_pool_stats() -> Dict:
+    pool = get_proxy_pool()
+    if pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **pool.stats()}
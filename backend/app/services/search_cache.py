@@ -0,0 +1,154 @@
+"""
+Tavily 검색 결과 디스크 캐시
+- SQLite 파일에 쿼리별 검색 결과 저장 (서버 재시작 후에도 유지)
+- 키: 정규화된 쿼리 + 검색 파라미터
+- 검색 성공은 긴 TTL, 검색 실패(결과 없음)는 짧은 TTL (negative caching)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Dict
+from ..config import get_settings
+
+_connection: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# 캐시 통계 (프로세스 단위)
+_stats = {
+    "hits": 0,
+    "negative_hits": 0,
+    "misses": 0,
+    "writes": 0,
+}
+
+# 만료된 항목 정리 주기 (쓰기 N회마다)
+PURGE_EVERY_WRITES = 500
+
+
+def normalize_query(query: str) -> str:
+    """쿼리 정규화 (공백 정리 + 소문자)"""
+    return " ".join(query.split()).lower()
+
+
+def get_search_cache_key(query: str, params: Dict) -> str:
+    """정규화된 쿼리 + 검색 파라미터로 캐시 키 생성"""
+    raw = json.dumps(
+        {"query": normalize_query(query), "params": params},
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_connection() -> sqlite3.Connection:
+    """SQLite 연결 (최초 호출 시 테이블 생성)"""
+    global _connection
+
+    if _connection is None:
+        settings = get_settings()
+        directory = os.path.dirname(settings.search_cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        _connection = sqlite3.connect(settings.search_cache_path, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                found INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        _connection.commit()
+
+    return _connection
+
+
+def get_cached_search(query: str, params: Dict) -> Optional[Dict]:
+    """
+    캐시된 검색 결과 조회
+
+    Returns:
+        캐시된 검색 결과 (만료/미존재 시 None)
+    """
+    settings = get_settings()
+    if not settings.search_cache_enabled:
+        return None
+
+    key = get_search_cache_key(query, params)
+    try:
+        with _lock:
+            row = get_connection().execute(
+                "SELECT found, result, expires_at FROM search_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or row[2] < time.time():
+                _stats["misses"] += 1
+                return None
+
+            if row[0]:
+                _stats["hits"] += 1
+            else:
+                _stats["negative_hits"] += 1
+        return json.loads(row[1])
+    except sqlite3.Error as e:
+        print(f"[SearchCache] 조회 오류: {e}")
+        return None
+
+
+def set_cached_search(query: str, params: Dict, result: Dict) -> None:
+    """검색 결과 캐시 저장 (found 여부에 따라 TTL 결정)"""
+    settings = get_settings()
+    if not settings.search_cache_enabled:
+        return
+
+    found = bool(result.get("found"))
+    ttl = settings.search_cache_ttl if found else settings.search_cache_negative_ttl
+    key = get_search_cache_key(query, params)
+
+    try:
+        with _lock:
+            conn = get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, query, found, result, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, query, int(found), json.dumps(result, ensure_ascii=False), time.time() + ttl)
+            )
+            _stats["writes"] += 1
+            if _stats["writes"] % PURGE_EVERY_WRITES == 0:
+                conn.execute("DELETE FROM search_cache WHERE expires_at < ?", (time.time(),))
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[SearchCache] 저장 오류: {e}")
+
+
+def clear_search_cache() -> None:
+    """검색 캐시 전체 삭제"""
+    with _lock:
+        conn = get_connection()
+        conn.execute("DELETE FROM search_cache")
+        conn.commit()
+
+
+def get_search_cache_stats() -> Dict:
+    """검색 캐시 통계 조회"""
+    with _lock:
+        lookups = _stats["hits"] + _stats["negative_hits"] + _stats["misses"]
+        stats = dict(_stats)
+        try:
+            stats["entries"] = get_connection().execute(
+                "SELECT COUNT(*) FROM search_cache WHERE expires_at >= ?", (time.time(),)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            stats["entries"] = None
+
+    stats["hit_ratio"] = round((stats["hits"] + stats["negative_hits"]) / lookups, 4) if lookups else 0.0
+    return stats
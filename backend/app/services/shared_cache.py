@@ -0,0 +1,133 @@
+"""
+워커 간 공유 캐시 (L2)
+- 같은 호스트의 gunicorn 워커들이 함께 쓰는 SQLite 파일 캐시
+- 서버 재시작 후에도 유지
+- 무효화 로그(invalidations)로 다른 워커의 L1(메모리) 캐시 무효화 전파
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+
+class SQLiteSharedCache:
+    """SQLite 기반 L2 캐시 + 무효화 로그"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_entries (
+                key TEXT PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_video_id ON cache_entries(video_id)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache_invalidations (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                target TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Any, str, float]]:
+        """
+        Returns:
+            (값, video_id, 남은 TTL 초) 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, video_id, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        remaining = row[2] - time.time()
+        if remaining <= 0:
+            return None
+        return json.loads(row[0]), row[1], remaining
+
+    def set(self, key: str, video_id: str, value: Any, ttl: float) -> int:
+        """
+        항목 저장 + 같은 키의 무효화 로그 기록 (다른 워커 L1의 이전 값 제거용)
+
+        Returns:
+            기록된 무효화 로그 seq
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, video_id, value, expires_at) VALUES (?, ?, ?, ?)",
+                (key, video_id, json.dumps(value, ensure_ascii=False, default=str), time.time() + ttl)
+            )
+            cursor = self._conn.execute(
+                "INSERT INTO cache_invalidations (kind, target, created_at) VALUES ('key', ?, ?)",
+                (key, time.time())
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def invalidate(self, kind: str, target: Optional[str] = None) -> int:
+        """
+        항목 삭제 + 무효화 로그 기록
+
+        Args:
+            kind: "key" | "video" | "all"
+            target: 키 또는 video_id
+
+        Returns:
+            기록된 무효화 로그 seq
+        """
+        with self._lock:
+            if kind == "key":
+                self._conn.execute("DELETE FROM cache_entries WHERE key = ?", (target,))
+            elif kind == "video":
+                self._conn.execute("DELETE FROM cache_entries WHERE video_id = ?", (target,))
+            else:
+                self._conn.execute("DELETE FROM cache_entries")
+
+            cursor = self._conn.execute(
+                "INSERT INTO cache_invalidations (kind, target, created_at) VALUES (?, ?, ?)",
+                (kind, target, time.time())
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+
+    def last_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM cache_invalidations").fetchone()
+        return row[0] or 0
+
+    def invalidations_since(self, seq: int) -> List[Tuple[int, str, Optional[str]]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, kind, target FROM cache_invalidations WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+
+    def purge(self, log_retention: float) -> None:
+        """만료된 항목과 오래된 무효화 로그 정리"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now,))
+            self._conn.execute("DELETE FROM cache_invalidations WHERE created_at < ?", (now - log_retention,))
+            self._conn.commit()
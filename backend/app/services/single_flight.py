@@ -0,0 +1,104 @@
+"""
+동일 작업 동시 요청 병합 (single-flight)
+- 같은 키(video_id, analysis_id + perspective 등)로 동시에 들어온 요청은
+  먼저 들어온 요청(leader)의 결과를 함께 기다림
+- 워커 프로세스 간(gunicorn)에는 키별 파일 락(flock)으로 직렬화
+  다른 워커가 작업을 끝낼 때까지 기다린 경우 waited=True로 알려서
+  호출 측이 DB에 저장된 결과를 재사용할 수 있게 함
+- fcntl이 없는 환경(Windows 개발 환경)에서는 프로세스 내 병합만 동작
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict
+from ..config import get_settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 진행 중인 작업 (키 → leader Task)
+_inflight: Dict[str, asyncio.Task] = {}
+
+# 락 획득 재시도 간격(초)
+LOCK_POLL_INTERVAL = 0.2
+
+
+def get_lock_path(key: str) -> str:
+    """키별 락 파일 경로"""
+    settings = get_settings()
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(settings.single_flight_lock_dir, f"{digest}.lock")
+
+
+@asynccontextmanager
+async def worker_lock(key: str):
+    """
+    워커 프로세스 간 키별 배타 락
+
+    Yields:
+        waited: 다른 워커가 락을 잡고 있어서 기다렸으면 True
+    """
+    if fcntl is None:
+        yield False
+        return
+
+    settings = get_settings()
+    os.makedirs(settings.single_flight_lock_dir, exist_ok=True)
+    fd = os.open(get_lock_path(key), os.O_RDWR | os.O_CREAT, 0o644)
+    waited = False
+    locked = False
+    deadline = time.monotonic() + settings.single_flight_wait_timeout
+
+    try:
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                locked = True
+                break
+            except BlockingIOError:
+                waited = True
+                if time.monotonic() >= deadline:
+                    print(f"[SingleFlight] {key} 락 대기 시간 초과, 락 없이 진행", flush=True)
+                    break
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+        yield waited
+    finally:
+        if locked:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+async def single_flight(key: str, func: Callable[[bool], Awaitable[Any]], cross_worker: bool = True) -> Any:
+    """
+    같은 키의 동시 요청을 하나의 실행으로 병합
+
+    Args:
+        key: 병합 키 (예: "analyze:{video_id}")
+        func: 실제 작업. 다른 워커의 작업 완료를 기다렸는지(waited)를 인자로 받음
+        cross_worker: False면 워커 간 락 없이 프로세스 내에서만 병합 (DB 조회 등 가벼운 작업)
+
+    Returns:
+        leader 작업의 결과 (follower도 같은 결과를 받음)
+    """
+    task = _inflight.get(key)
+    if task is not None and not task.done():
+        print(f"[SingleFlight] {key} 진행 중인 작업에 합류", flush=True)
+        return await asyncio.shield(task)
+
+    async def run():
+        if not cross_worker:
+            return await func(False)
+        async with worker_lock(key) as waited:
+            return await func(waited)
+
+    task = asyncio.create_task(run())
+    _inflight[key] = task
+    task.add_done_callback(lambda t: _inflight.pop(key, None) if _inflight.get(key) is t else None)
+    # 요청이 취소되어도 leader 작업은 계속 진행 (follower가 기다리고 있을 수 있음)
+    return await asyncio.shield(task)
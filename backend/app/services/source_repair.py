@@ -0,0 +1,201 @@
+"""
+출처 URL 백그라운드 보정 서비스
+- GET /api/result 조회 시 URL이 없거나 Google 검색 폴백인 출처를 발견하면
+  응답은 즉시 반환하고, Tavily 재검증은 백그라운드 작업으로 실행
+- analysis_id 단위로 중복 실행 방지
+- 검증 기록(source_verification)의 백오프 기간이 지난 항목만 보정 대상
+- 작업 완료 시 바뀐 경로(source_url, verified, link 등)만 DB에 부분 수정
+  (문서 전체를 덮어쓰지 않으므로 그 사이 저장된 다른 분석 결과를 지우지 않음)
+"""
+
+import asyncio
+import copy
+from typing import Dict, List, Optional, Set
+from .cache import set_cached_analysis
+from .source_verification import needs_verification, interview_clip_needs_search, is_retry_due
+
+# 진행 중인 보정 작업 (analysis_id → Task)
+_repair_tasks: Dict[str, asyncio.Task] = {}
+
+
+def source_tracking_needs_repair(source_tracking) -> bool:
+    """source_tracking 중 URL 보정이 필요한 항목이 있는지 확인"""
+    for s in source_tracking or []:
+        if isinstance(s, dict) and s.get('source_title') and needs_verification(s, 'source_url'):
+            return True
+    return False
+
+
+def critical_needs_repair(critical_analysis) -> bool:
+    """hidden_premises 중 하나라도 source_url이 없거나 Google URL이면 보정 필요 (백오프 기간 제외)"""
+    if not critical_analysis:
+        return False
+    for hp in critical_analysis.get('hidden_premises', []):
+        if isinstance(hp, dict) and hp.get('source') and needs_verification(hp, 'source_url'):
+            return True
+    return False
+
+
+def additional_needs_repair(additional_analysis) -> bool:
+    """interview_clips / evidence_sources / bonus_tip 중 URL 보정이 필요한 항목이 있는지 확인"""
+    if not additional_analysis:
+        return False
+
+    video_sources = additional_analysis.get('video_sources', {})
+    if video_sources:
+        for clip in video_sources.get('interview_clips', []):
+            if isinstance(clip, dict) and interview_clip_needs_search(clip) and is_retry_due(clip, 'link'):
+                return True
+
+        for ev in video_sources.get('evidence_sources', []):
+            if isinstance(ev, dict) and needs_verification(ev, 'link'):
+                return True
+
+    bonus_tip = additional_analysis.get('bonus_tip', {})
+    if isinstance(bonus_tip, dict) and bonus_tip.get('source') and needs_verification(bonus_tip, 'source_url'):
+        return True
+
+    return False
+
+
+def sections_needing_repair(row: Dict) -> Set[str]:
+    """URL 보정이 필요한 컬럼 목록"""
+    sections = set()
+    if source_tracking_needs_repair(row.get('source_tracking')):
+        sections.add('source_tracking')
+    if critical_needs_repair(row.get('critical_analysis')):
+        sections.add('critical_analysis')
+    if additional_needs_repair(row.get('additional_analysis')):
+        sections.add('additional_analysis')
+    return sections
+
+
+def json_patches(old, new, path: tuple = ()) -> List[Dict]:
+    """
+    두 JSON 값의 차이를 경로 단위 수정 목록으로 변환
+
+    Returns:
+        [{"path": [...], "value": ...}, ...] (삭제된 키는 무시, 길이가 다른 배열은 통째로 교체)
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        patches = []
+        for key, value in new.items():
+            if key not in old:
+                patches.append({"path": [*path, str(key)], "value": value})
+            else:
+                patches.extend(json_patches(old[key], value, (*path, str(key))))
+        return patches
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        patches = []
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            patches.extend(json_patches(old_item, new_item, (*path, str(i))))
+        return patches
+
+    if old != new:
+        return [{"path": list(path), "value": new}]
+    return []
+
+
+async def repair_section(analysis_id: str, row: Dict, section: str) -> Optional[Dict]:
+    """
+    섹션 하나의 출처를 재검증하고 바뀐 경로만 DB에 반영
+
+    Returns:
+        보정된 섹션 (바뀐 내용이 없거나 저장되지 않았으면 None)
+    """
+    from .claude import verify_sources, verify_critical_sources, verify_additional_sources
+    from ..database import patch_analysis_json, update_analysis
+
+    # 검증 함수는 항목을 직접 수정하므로 원본과 비교할 수 있게 복사본 사용
+    original = row[section]
+    if section == 'source_tracking':
+        # verify_sources는 1단계 분석 응답 구조(video_analysis.source_tracking)를 받음
+        wrapped = {"video_analysis": {"source_tracking": copy.deepcopy(original)}}
+        await verify_sources(wrapped)
+        repaired = wrapped["video_analysis"]["source_tracking"]
+    elif section == 'critical_analysis':
+        repaired = await verify_critical_sources(copy.deepcopy(original))
+    else:
+        repaired = await verify_additional_sources(copy.deepcopy(original))
+
+    patches = json_patches(original, repaired)
+    if not patches:
+        return None
+
+    # 문서 전체가 바뀐 경우(최상위 경로)만 통째로 저장
+    if any(not patch["path"] for patch in patches):
+        updated = await update_analysis(analysis_id, {section: repaired})
+        return repaired if updated else None
+
+    perspective = row.get('perspective') if section != 'source_tracking' else None
+    patched = await patch_analysis_json(analysis_id, section, patches, perspective)
+    if not patched:
+        print(f"[Repair] {analysis_id} {section} 수정 건너뜀 (행 없음 또는 관점 변경)", flush=True)
+        return None
+    return repaired
+
+
+async def repair_sources(analysis_id: str) -> Dict:
+    """
+    분석 결과의 출처 URL을 Tavily로 재검증하고 바뀐 경로만 DB에 반영
+
+    조회 응답에 사용된 행이 아니라 작업 시작 시점의 최신 행을 다시 읽어서 보정한다.
+
+    Returns:
+        보정된 섹션 {컬럼: 보정된 값} (변경사항이 없으면 빈 dict)
+    """
+    from ..database import get_analysis_by_id
+
+    row = await get_analysis_by_id(analysis_id)
+    if not row:
+        return {}
+
+    sections = sorted(sections_needing_repair(row))
+    if not sections:
+        return {}
+
+    print(f"[Repair] {analysis_id} 출처 보정 시작: {sections}", flush=True)
+    results = await asyncio.gather(*(repair_section(analysis_id, row, section) for section in sections))
+    repaired = {section: result for section, result in zip(sections, results) if result is not None}
+
+    # 관점별 결과 캐시도 보정된 출처로 갱신
+    perspective = row.get('perspective')
+    if perspective and 'critical_analysis' in repaired:
+        set_cached_analysis(row['video_id'], f"stage2:{perspective}", repaired['critical_analysis'])
+    if perspective and 'additional_analysis' in repaired:
+        set_cached_analysis(row['video_id'], f"stage3:{perspective}", repaired['additional_analysis'])
+    print(f"[Repair] {analysis_id} 출처 보정 완료: {list(repaired.keys())}", flush=True)
+    return repaired
+
+
+def schedule_source_repair(analysis_id: str) -> None:
+    """출처 보정 백그라운드 작업 등록 (analysis_id 단위 중복 방지)"""
+    if is_repair_pending(analysis_id):
+        return
+
+    async def run():
+        try:
+            await repair_sources(analysis_id)
+        except Exception as e:
+            print(f"[Repair] {analysis_id} 출처 보정 오류: {e}", flush=True)
+
+    task = asyncio.create_task(run())
+    _repair_tasks[analysis_id] = task
+    task.add_done_callback(lambda t: _repair_tasks.pop(analysis_id, None) if _repair_tasks.get(analysis_id) is t else None)
+
+
+def is_repair_pending(analysis_id: str) -> bool:
+    """보정 작업 진행 여부"""
+    task = _repair_tasks.get(analysis_id)
+    return bool(task and not task.done())
+
+
+async def cancel_source_repairs() -> None:
+    """앱 종료 시 진행 중인 보정 작업 취소"""
+    tasks = list(_repair_tasks.values())
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+    _repair_tasks.clear()
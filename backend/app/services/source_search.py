@@ -9,6 +9,9 @@ import re
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
+from .llm_client import create_message
+from .json_utils import parse_json_response
+from .excerpts import select_excerpts
 
 
 class SourceType(Enum):
@@ -116,17 +119,20 @@ def generate_search_keywords(quote: str, speaker: str = "") -> List[str]:
     return keywords
 
 
-async def search_source_with_claude(quotes: List[str], transcript: str, client) -> List[Dict]:
+async def search_source_with_claude(quotes: List[str], transcript: str, client=None) -> List[Dict]:
     """
     Claude를 사용하여 출처 검색
     Claude가 학습 데이터에서 출처를 추론하거나 검색 키워드를 제안
     """
+    # 인용문과 관련된 구간만 발췌 (BM25 점수 계산은 워커 스레드에서)
+    excerpt = await asyncio.to_thread(select_excerpts, transcript, quotes)
+
     prompt = f"""당신은 투자 콘텐츠 출처 검증 전문가입니다.
 
 아래 유튜브 영상 자막에서 인용된 문장들의 원본 출처를 찾아주세요.
 
-[영상 자막 요약]
-{transcript[:5000]}
+[영상 자막 발췌 (인용문 관련 구간)]
+{excerpt}
 
 [인용 문장들]
 {chr(10).join([f'{i+1}. "{q}"' for i, q in enumerate(quotes)])}
@@ -155,26 +161,16 @@ async def search_source_with_claude(quotes: List[str], transcript: str, client)
 """
 
     try:
-        message = client.messages.create(
+        message = await create_message(
+            prompt,
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}]
+            label="source_search",
+            validate=parse_json_response,
+            client=client
         )
 
-        response_text = message.content[0].text
-
-        # JSON 파싱
-        import json
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-
-        result = json.loads(response_text)
+        result = parse_json_response(message.content[0].text)
         return result.get("sources", [])
 
     except Exception as e:
@@ -197,11 +193,14 @@ async def analyze_contradictions_with_sources(
     critical_points: List[str],
     transcript: str,
     perspective_name: str,
-    client
+    client=None
 ) -> List[Dict]:
     """
     비판적 분석 포인트에 대한 출처 기반 모순 분석
     """
+    # 비판 포인트와 관련된 구간만 발췌 (BM25 점수 계산은 워커 스레드에서)
+    excerpt = await asyncio.to_thread(select_excerpts, transcript, critical_points)
+
     prompt = f"""당신은 투자 전략 비판적 분석 전문가입니다.
 
 아래 비판적 분석 포인트들에 대해 출처 기반 모순 분석을 수행해주세요.
@@ -209,8 +208,8 @@ async def analyze_contradictions_with_sources(
 [분석 관점]
 {perspective_name}
 
-[영상 자막 요약]
-{transcript[:5000]}
+[영상 자막 발췌 (비판 포인트 관련 구간)]
+{excerpt}
 
 [비판적 분석 포인트]
 {chr(10).join([f'{i+1}. {p}' for i, p in enumerate(critical_points)])}
@@ -253,26 +252,16 @@ async def analyze_contradictions_with_sources(
 """
 
     try:
-        message = client.messages.create(
+        message = await create_message(
+            prompt,
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}]
+            label="source_contradictions",
+            validate=parse_json_response,
+            client=client
         )
 
-        response_text = message.content[0].text
-
-        # JSON 파싱
-        import json
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            response_text = response_text[json_start:json_end].strip()
-
-        result = json.loads(response_text)
+        result = parse_json_response(message.content[0].text)
         return result.get("contradiction_analyses", [])
 
     except Exception as e:
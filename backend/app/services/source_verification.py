@@ -0,0 +1,103 @@
+"""
+출처 검증 공통 규칙
+- URL 재검색 필요 여부 판단 (null, 검색 폴백 URL 등)
+- 항목별 검증 시도 기록(ledger)과 지수 백오프
+  검색에 실패한 출처가 조회할 때마다 Tavily 검색을 반복하지 않도록,
+  시도 횟수/마지막 시도 시각을 항목에 저장하고 백오프 기간이 지난 항목만 재검증
+"""
+
+import time
+from typing import Dict
+from ..config import get_settings
+
+# 항목 dict에 저장되는 검증 기록 키 ({url_field: {"attempts", "last_attempt_at", "found"}})
+LEDGER_KEY = "verify_log"
+
+# 해외 인물 영어 이름 (이 인물들은 영어로 검색해야 올바른 결과 나옴)
+INTERNATIONAL_FIGURES = {
+    "워렌 버핏": "buffett",
+    "워런 버핏": "buffett",
+    "찰리 멍거": "munger",
+    "일론 머스크": "musk",
+    "제프 베조스": "bezos",
+    "빌 게이츠": "gates",
+    "스티브 잡스": "jobs",
+    "레이 달리오": "dalio",
+    "피터 린치": "lynch",
+    "조지 소로스": "soros",
+}
+
+
+def is_missing_url(url) -> bool:
+    """URL이 없거나 검색 폴백 URL인지 확인"""
+    if not url:
+        return True
+    if isinstance(url, str):
+        url_lower = url.lower().strip()
+        if url_lower in ['null', 'none', '', '-']:
+            return True
+        if url_lower.startswith('검색:'):
+            return True
+        if 'google.com/search' in url_lower:
+            return True
+    return False
+
+
+def interview_clip_needs_search(clip: Dict) -> bool:
+    """인터뷰 클립 링크 재검색 필요 여부 (해외 인물인데 URL에 영어 이름이 없으면 재검색)"""
+    link = clip.get("link")
+    if is_missing_url(link):
+        return True
+
+    eng_name = INTERNATIONAL_FIGURES.get(clip.get("person", ""))
+    return bool(eng_name and isinstance(link, str) and eng_name not in link.lower())
+
+
+def get_attempt(item: Dict, url_field: str) -> Dict:
+    """항목의 url_field 검증 기록 조회"""
+    ledger = item.get(LEDGER_KEY)
+    if not isinstance(ledger, dict):
+        return {}
+    return ledger.get(url_field) or {}
+
+
+def get_backoff_seconds(attempts: int) -> float:
+    """시도 횟수에 따른 재검증 대기 시간 (지수 백오프)"""
+    settings = get_settings()
+    if attempts <= 0:
+        return 0
+    return min(
+        settings.source_verify_backoff_base * (2 ** (attempts - 1)),
+        settings.source_verify_backoff_max
+    )
+
+
+def is_retry_due(item: Dict, url_field: str) -> bool:
+    """백오프 기간이 지나 재검증 가능한지 확인 (최대 시도 횟수 초과 시 False)"""
+    attempt = get_attempt(item, url_field)
+    attempts = attempt.get("attempts", 0)
+    if attempts <= 0:
+        return True
+    if attempts >= get_settings().source_verify_max_attempts:
+        return False
+    return time.time() >= attempt.get("last_attempt_at", 0) + get_backoff_seconds(attempts)
+
+
+def record_attempt(item: Dict, url_field: str, found: bool) -> None:
+    """검증 시도 기록"""
+    ledger = item.get(LEDGER_KEY)
+    if not isinstance(ledger, dict):
+        ledger = {}
+        item[LEDGER_KEY] = ledger
+
+    attempt = ledger.get(url_field) or {}
+    ledger[url_field] = {
+        "attempts": attempt.get("attempts", 0) + 1,
+        "last_attempt_at": int(time.time()),
+        "found": bool(found),
+    }
+
+
+def needs_verification(item: Dict, url_field: str) -> bool:
+    """URL이 없거나 폴백 URL이고, 백오프 기간이 지난 경우에만 재검증"""
+    return is_missing_url(item.get(url_field)) and is_retry_due(item, url_field)
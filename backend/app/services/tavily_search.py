@@ -1,6 +1,10 @@
 import os
-from typing import Optional, Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, Dict, List, Tuple, Callable
 from dotenv import load_dotenv
+from ..config import get_settings
+from .search_cache import get_cached_search, set_cached_search
 
 # .env 파일 로드
 load_dotenv()
@@ -13,6 +17,12 @@ except ImportError:
 
 tavily_client: Optional[TavilyClient] = None
 
+_cascade_executor: Optional[ThreadPoolExecutor] = None
+
+# Tavily HTTP 요청 동시 실행 슬롯 (프로세스 전체, 요청 1건당 1슬롯)
+# 캐스케이드로 퍼진 쿼리와 타임아웃으로 포기한 검색의 요청도 모두 포함 → 실제 동시 요청 수 상한 유지
+_request_slots = threading.BoundedSemaphore(max(1, get_settings().tavily_max_concurrency))
+
 
 def init_tavily() -> Optional[TavilyClient]:
     """Tavily 클라이언트 초기화"""
@@ -27,6 +37,21 @@ def init_tavily() -> Optional[TavilyClient]:
     return tavily_client
 
 
+def tavily_request(query: str, **params) -> Dict:
+    """
+    요청 슬롯을 얻은 뒤 Tavily 검색 요청 (슬롯 대기는 settings.tavily_item_timeout까지)
+
+    Raises:
+        TimeoutError: 대기 시간 안에 슬롯을 얻지 못함
+    """
+    if not _request_slots.acquire(timeout=get_settings().tavily_item_timeout):
+        raise TimeoutError("Tavily 요청 슬롯 대기 시간 초과")
+    try:
+        return tavily_client.search(query=query, **params)
+    finally:
+        _request_slots.release()
+
+
 def search_source(query: str) -> Dict:
     """
     출처 검색해서 실제 URL 반환
@@ -50,33 +75,127 @@ def search_source(query: str) -> Dict:
     if not tavily_client:
         return {"found": False, "url": None, "search_query": query}
 
+    # 디스크 캐시 확인 (검색 실패도 짧은 TTL로 캐시됨)
+    search_params = {"search_depth": "basic", "max_results": 1}
+    cached = get_cached_search(query, search_params)
+    if cached is not None:
+        print(f"[Tavily] Cache hit: {query}")
+        return cached
+
     try:
         print(f"[Tavily] Searching: {query}")
-        response = tavily_client.search(
-            query=query,
-            search_depth="basic",
-            max_results=1
-        )
+        response = tavily_request(query, **search_params)
 
         if response.get("results") and len(response["results"]) > 0:
             result = response["results"][0]
             url = result.get("url", "")
             print(f"[Tavily] Found URL: {url}")
-            return {
+            found = {
                 "found": True,
                 "title": result.get("title", ""),
                 "url": url,
                 "snippet": result.get("content", "")[:200] if result.get("content") else ""
             }
+            set_cached_search(query, search_params, found)
+            return found
         else:
             print(f"[Tavily] No results for: {query}")
-            return {"found": False, "url": None, "search_query": query}
+            not_found = {"found": False, "url": None, "search_query": query}
+            set_cached_search(query, search_params, not_found)
+            return not_found
 
     except Exception as e:
         print(f"Tavily search error: {e}")
         return {"found": False, "url": None, "search_query": query}
 
 
+def is_found(result: Dict) -> bool:
+    """검색 결과가 있으면 채택"""
+    return bool(result.get("found"))
+
+
+def url_contains(*domains: str) -> Callable[[Dict], bool]:
+    """검색 결과 URL이 특정 도메인을 포함할 때만 채택"""
+    def accept(result: Dict) -> bool:
+        url = result.get("url") or ""
+        return bool(result.get("found")) and any(d in url for d in domains)
+    return accept
+
+
+def get_cascade_executor() -> ThreadPoolExecutor:
+    """캐스케이드 검색용 공유 스레드 풀"""
+    global _cascade_executor
+    if _cascade_executor is None:
+        _cascade_executor = ThreadPoolExecutor(
+            max_workers=max(1, get_settings().tavily_cascade_max_workers),
+            thread_name_prefix="tavily-cascade"
+        )
+    return _cascade_executor
+
+
+def search_cascade(
+    candidates: List[Tuple[str, Callable[[Dict], bool]]],
+    width: Optional[int] = None
+) -> Optional[Dict]:
+    """
+    우선순위 순서의 쿼리 후보들을 병렬(hedged)로 검색
+
+    상위 width개 쿼리를 동시에 보내고, 앞선 쿼리들이 모두 실패로 확정된 뒤
+    채택 조건을 만족한 가장 높은 우선순위의 결과를 즉시 반환한다.
+    반환 시점에 아직 시작하지 않은 쿼리는 취소한다.
+
+    Args:
+        candidates: [(검색 쿼리, 채택 조건 함수), ...] - 우선순위 순서
+        width: 동시에 보낼 쿼리 수 (기본값: settings.tavily_cascade_width, 1이면 순차 검색)
+
+    Returns:
+        채택된 검색 결과 또는 None
+    """
+    candidates = [(q, accept) for q, accept in candidates if q]
+    width = width or get_settings().tavily_cascade_width
+
+    # 순차 모드 (기존 동작)
+    if width <= 1 or len(candidates) <= 1:
+        for query, accept in candidates:
+            result = search_source(query)
+            if accept(result):
+                return result
+        return None
+
+    executor = get_cascade_executor()
+    results: Dict[int, Dict] = {}
+    in_flight = {}
+    next_index = 0
+    best = 0  # 아직 결과가 확정되지 않은 가장 높은 우선순위
+
+    try:
+        while best < len(candidates):
+            # 앞선 쿼리 결과를 기다리는 동안 다음 후보들을 미리 발송
+            while next_index < len(candidates) and len(in_flight) < width:
+                future = executor.submit(search_source, candidates[next_index][0])
+                in_flight[future] = next_index
+                next_index += 1
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    print(f"[Tavily] cascade query error: {e}")
+                    results[index] = {"found": False, "url": None}
+
+            # 우선순위 순서대로 확정된 결과 확인
+            while best in results:
+                if candidates[best][1](results[best]):
+                    return results[best]
+                best += 1
+        return None
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
 def search_multiple_sources(queries: List[str]) -> List[Dict]:
     """
     여러 출처 한 번에 검색
@@ -112,28 +231,18 @@ def search_book_source(book_title: str, quote: str = "") -> Dict:
     if ":" in book_title:
         clean_title = book_title.split(":")[-1].strip()
 
-    # 1. 교보문고 직접 검색 시도
-    kyobo_queries = [
-        f"{clean_title} site:kyobobook.co.kr",
-        f"{clean_title} 교보문고",
-    ]
-
-    for query in kyobo_queries:
-        result = search_source(query)
-        if result.get("found") and "kyobobook" in result.get("url", ""):
-            return result
-
-    # 2. 일반 검색 (Yes24, 알라딘 등)
-    book_queries = [
-        f"{clean_title} site:yes24.com",
-        f"{clean_title} site:aladin.co.kr",
-        f"{clean_title} 책",
+    # 1. 교보문고 직접 검색 우선 → 2. 일반 검색 (Yes24, 알라딘 등)
+    candidates = [
+        (f"{clean_title} site:kyobobook.co.kr", url_contains("kyobobook")),
+        (f"{clean_title} 교보문고", url_contains("kyobobook")),
+        (f"{clean_title} site:yes24.com", is_found),
+        (f"{clean_title} site:aladin.co.kr", is_found),
+        (f"{clean_title} 책", is_found),
     ]
 
-    for query in book_queries:
-        result = search_source(query)
-        if result.get("found"):
-            return result
+    result = search_cascade(candidates)
+    if result:
+        return result
 
     # 3. 못 찾으면 교보문고 검색 링크 반환
     return {
@@ -236,24 +345,17 @@ def search_interview_clip(person: str, video_title: str = "", quote: str = "") -
 
     print(f"[Tavily] interview_clip queries: {queries[:3]}", flush=True)
 
-    for query in queries:
-        result = search_source(query)
-        if result.get("found"):
-            url = result.get("url", "")
-            # YouTube URL 우선
-            if "youtube.com" in url or "youtu.be" in url:
-                return result
-
-    # YouTube에서 못 찾으면 뉴스/기사 검색
+    # YouTube URL 우선, 못 찾으면 뉴스/기사 검색
     news_queries = [
         f"{search_person} {search_title} 기사" if video_title else f"{search_person} 인터뷰 기사",
         f"{search_person} 발언",
     ]
+    candidates = [(q, url_contains("youtube.com", "youtu.be")) for q in queries]
+    candidates.extend((q, is_found) for q in news_queries)
 
-    for query in news_queries:
-        result = search_source(query)
-        if result.get("found"):
-            return result
+    result = search_cascade(candidates)
+    if result:
+        return result
 
     # 못 찾으면 YouTube 검색 링크 반환
     search_term = f"{search_person} {search_title}" if video_title else f"{search_person} interview"
@@ -309,10 +411,9 @@ def search_evidence_source(evidence: str, source_type: str = "") -> Dict:
             f"{evidence} 출처",
         ]
 
-    for query in queries:
-        result = search_source(query)
-        if result.get("found"):
-            return result
+    result = search_cascade([(q, is_found) for q in queries])
+    if result:
+        return result
 
     return {
         "found": False,
@@ -381,10 +482,9 @@ def search_source_by_type(source_name: str, source_type: str, context: str = "")
     if context:
         queries.insert(0, f"{source_name} {context[:30]}")
 
-    for query in queries:
-        result = search_source(query)
-        if result.get("found"):
-            return result
+    result = search_cascade([(q, is_found) for q in queries])
+    if result:
+        return result
 
     # 유형별 폴백 URL
     if source_type in ["책", "도서"]:
@@ -439,11 +539,7 @@ def search_individual_cases(strategy_name: str) -> List[Dict]:
     for query in queries[:3]:  # 최대 3개 쿼리
         try:
             print(f"[Tavily] Searching individual cases: {query}")
-            response = tavily_client.search(
-                query=query,
-                search_depth="basic",
-                max_results=2
-            )
+            response = tavily_request(query, search_depth="basic", max_results=2)
 
             if response.get("results") and len(response["results"]) > 0:
                 for result in response["results"]:
@@ -538,11 +634,7 @@ def search_improvement_cases(master_name: str, problems: List[str] = None) -> Li
     for query in query_templates[:6]:  # 최대 6개 쿼리
         try:
             print(f"[Tavily] Searching improvement case: {query}")
-            response = tavily_client.search(
-                query=query,
-                search_depth="basic",
-                max_results=2
-            )
+            response = tavily_request(query, search_depth="basic", max_results=2)
 
             if response.get("results") and len(response["results"]) > 0:
                 for result in response["results"]:
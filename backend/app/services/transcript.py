@@ -1,26 +1,21 @@
-import os
+import asyncio
+import heapq
+import math
 import re
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.proxies import WebshareProxyConfig
-from typing import Optional, Tuple
+import time
+from youtube_transcript_api import YouTubeTranscriptApi, RequestBlocked
+from typing import Dict, List, Optional, Tuple
+from ..config import get_settings
+from .chunking import estimate_tokens, split_sentences, split_words, FILLER_WORDS, word_key, content_words
+from .proxy_pool import get_proxy_pool, is_route_error
+from .transcript_store import TranscriptSegment, encode_transcript
+from .transcript_cache import (
+    get_cached_listing, set_cached_listing, get_cached_transcript, set_cached_transcript
+)
 
 
 def get_transcript_api():
-    """환경변수에 따라 프록시 사용 여부 결정"""
-    use_proxy = os.getenv("USE_PROXY", "false").lower() == "true"
-
-    if use_proxy:
-        proxy_username = os.getenv("WEBSHARE_USERNAME")
-        proxy_password = os.getenv("WEBSHARE_PASSWORD")
-
-        if proxy_username and proxy_password:
-            return YouTubeTranscriptApi(
-                proxy_config=WebshareProxyConfig(
-                    proxy_username=proxy_username,
-                    proxy_password=proxy_password,
-                )
-            )
-
+    """직접 연결용 API (프록시는 proxy_pool에서 관리)"""
     return YouTubeTranscriptApi()
 
 
@@ -42,71 +37,362 @@ def extract_video_id(url: str) -> Optional[str]:
 async def get_transcript(video_id: str) -> Tuple[Optional[str], Optional[str]]:
     """
     YouTube 영상의 자막을 가져옴
-    한국어 → 영어 → 자동생성 자막 순서로 찾음
+    DB에 저장된 전체 자막이 있으면 재사용하고, 없으면 YouTube에서 가져와 압축 저장
+
+    Returns:
+        (전체 자막 텍스트, 에러 메시지)
     """
+    stored = await load_stored_transcript(video_id)
+    if stored is not None:
+        print(f"[Transcript] {video_id} 저장된 자막 사용 ({stored.segment_count}개 구간)", flush=True)
+        return stored.text, None
+
+    fetched, error = await fetch_transcript(video_id)
+    if error:
+        return None, error
+
+    await store_transcript(video_id, fetched)
+    return ' '.join(segment.text for segment in fetched["segments"]), None
+
+
+async def load_stored_transcript(video_id: str):
+    """저장된 전체 자막 조회 (DB 오류 시 None → YouTube에서 다시 가져옴)"""
+    from ..database import get_stored_transcript
+
     try:
-        api = get_transcript_api()
+        return await get_stored_transcript(video_id)
+    except Exception as e:
+        print(f"[Transcript] {video_id} 저장된 자막 조회 오류: {e}", flush=True)
+        return None
 
-        # 사용 가능한 자막 목록 가져오기
-        try:
-            transcript_list = api.list(video_id)
-        except Exception as e:
-            return None, f"자막 목록 조회 실패: {str(e)}"
 
-        try:
-            transcripts = list(transcript_list)
-        except Exception as e:
-            return None, f"자막 목록 변환 실패: {str(e)}"
+async def store_transcript(video_id: str, fetched: Dict) -> None:
+    """전체 자막 압축 저장 (실패해도 분석은 계속 진행)"""
+    from ..database import save_transcript
 
-        if not transcripts:
-            return None, "자막을 찾을 수 없습니다."
+    try:
+        await save_transcript(encode_transcript(
+            video_id,
+            fetched["segments"],
+            language_code=fetched.get("language_code"),
+            is_generated=fetched.get("is_generated", False),
+        ))
+    except Exception as e:
+        print(f"[Transcript] {video_id} 자막 저장 오류: {e}", flush=True)
 
-        target_transcript = None
 
-        # 1. 한국어 자막 찾기 (수동 자막 우선)
-        for transcript in transcripts:
-            if transcript.language_code == 'ko' and not transcript.is_generated:
-                target_transcript = transcript
-                break
+def get_language_preferences() -> List[str]:
+    """자막 언어 우선순위 (설정: transcript_language_preferences, 쉼표 구분)"""
+    settings = get_settings()
+    return [lang.strip() for lang in settings.transcript_language_preferences.split(",") if lang.strip()]
 
-        # 2. 한국어 자동생성 자막 찾기
-        if target_transcript is None:
-            for transcript in transcripts:
-                if transcript.language_code == 'ko' and transcript.is_generated:
-                    target_transcript = transcript
-                    break
-
-        # 3. 영어 자막 찾기 (수동 자막 우선)
-        if target_transcript is None:
-            for transcript in transcripts:
-                if transcript.language_code == 'en' and not transcript.is_generated:
-                    target_transcript = transcript
-                    break
-
-        # 4. 영어 자동생성 자막 찾기
-        if target_transcript is None:
-            for transcript in transcripts:
-                if transcript.language_code == 'en' and transcript.is_generated:
-                    target_transcript = transcript
-                    break
-
-        # 5. 아무 자막이나 가져오기 (자동생성 포함)
-        if target_transcript is None:
-            target_transcript = transcripts[0]
-
-        # 자막 가져오기
-        try:
-            transcript_data = target_transcript.fetch()
-        except Exception as e:
-            return None, f"자막 fetch 실패: {str(e)}"
-
-        # 자막 텍스트 추출
-        try:
-            full_text = ' '.join([item.text for item in transcript_data])
-        except Exception as e:
-            return None, f"텍스트 추출 실패: {str(e)}"
-
-        return full_text, None
+
+def get_track_info(transcript) -> Dict:
+    """youtube_transcript_api 자막 트랙 → 캐시 가능한 dict"""
+    return {
+        "language_code": transcript.language_code,
+        "language": getattr(transcript, "language", ""),
+        "is_generated": bool(transcript.is_generated),
+    }
+
+
+def select_track(tracks: List[Dict], preferences: List[str]) -> Optional[Dict]:
+    """
+    자막 트랙 선택 (목록을 한 번만 순회)
+    우선순위 언어 순서 → 같은 언어면 수동 자막 우선 → 선호 언어가 없으면 첫 번째 트랙
+    """
+    ranks = {lang: i for i, lang in enumerate(preferences)}
+    fallback_rank = len(preferences)
+
+    best, best_rank = None, None
+    for track in tracks:
+        lang_rank = ranks.get(track["language_code"], fallback_rank)
+        rank = (lang_rank, track["is_generated"] if lang_rank < fallback_rank else False)
+        if best_rank is None or rank < best_rank:
+            best, best_rank = track, rank
+    return best
+
+
+async def fetch_transcript(video_id: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    자막 구간 목록을 가져옴 (디스크 캐시 → YouTube)
+    transcript_language_preferences 순서(기본: 한국어 → 영어, 수동 자막 우선)로 트랙 선택
+    (YouTube 요청은 프록시 풀에서 빌린 경로로 워커 스레드에서 실행)
+
+    Returns:
+        ({"segments", "language_code", "is_generated"}, 에러 메시지)
+    """
+    try:
+        # 목록과 선택한 트랙의 자막이 모두 캐시에 있으면 YouTube 호출 없이 반환
+        tracks = get_cached_listing(video_id)
+        if tracks is not None:
+            target = select_track(tracks, get_language_preferences())
+            if target is None:
+                return None, "자막을 찾을 수 없습니다."
+
+            cached = get_cached_transcript(video_id, target["language_code"], target["is_generated"])
+            if cached is not None:
+                print(f"[TranscriptCache] {video_id} {target['language_code']} 자막 캐시 사용", flush=True)
+                return cached, None
+
+        return await run_on_route(lambda api: download_transcript(api, video_id, tracks))
 
     except Exception as e:
         return None, f"자막 추출 중 오류 발생: {str(e)}"
+
+
+async def run_on_route(func):
+    """
+    YouTube 요청 실행 (워커 스레드)
+    프록시 풀이 있으면 프록시를 빌려 실행하고, 차단/연결 실패 시 다른 프록시로 재시도
+
+    Args:
+        func: YouTubeTranscriptApi를 받아 요청을 수행하는 동기 함수
+    """
+    pool = get_proxy_pool()
+    if pool is None:
+        return await asyncio.to_thread(func, get_transcript_api())
+
+    settings = get_settings()
+    last_error = None
+    for attempt in range(1, settings.transcript_proxy_attempts + 1):
+        async with pool.lease() as lease:
+            started = time.monotonic()
+            try:
+                result = await asyncio.to_thread(func, lease.api)
+            except Exception as e:
+                if not is_route_error(e):
+                    raise
+                lease.record_failure(blocked=isinstance(e, RequestBlocked))
+                print(f"[Transcript] {lease.proxy.name} 요청 실패 ({attempt}/{settings.transcript_proxy_attempts}): "
+                      f"{type(e).__name__}", flush=True)
+                last_error = e
+                continue
+
+            lease.record_success(time.monotonic() - started)
+            return result
+
+    raise last_error
+
+
+def download_transcript(api, video_id: str, cached_tracks: Optional[List[Dict]]) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    자막 목록 조회 → 트랙 선택 → 자막 가져오기 (워커 스레드에서 실행)
+    프록시 차단/연결 오류는 예외로 올려서 run_on_route가 다른 프록시로 재시도
+
+    Args:
+        cached_tracks: 캐시에서 읽은 자막 목록 (없으면 None)
+
+    Returns:
+        ({"segments", "language_code", "is_generated"}, 에러 메시지)
+    """
+    transcripts, error = list_transcripts(api, video_id)
+    if error:
+        return None, error
+
+    tracks = [get_track_info(t) for t in transcripts]
+    if tracks != cached_tracks:
+        set_cached_listing(video_id, tracks)
+
+    target = select_track(tracks, get_language_preferences())
+    if target is None:
+        return None, "자막을 찾을 수 없습니다."
+
+    # 캐시에 없던 목록으로 새로 선택한 트랙이면 자막 캐시 확인
+    if tracks != cached_tracks:
+        cached = get_cached_transcript(video_id, target["language_code"], target["is_generated"])
+        if cached is not None:
+            print(f"[TranscriptCache] {video_id} {target['language_code']} 자막 캐시 사용", flush=True)
+            return cached, None
+
+    target_transcript = transcripts[tracks.index(target)]
+
+    # 자막 가져오기
+    try:
+        transcript_data = target_transcript.fetch()
+    except Exception as e:
+        if is_route_error(e):
+            raise
+        return None, f"자막 fetch 실패: {str(e)}"
+
+    # 자막 구간 추출 (텍스트 + 시작 시각/길이)
+    try:
+        segments = [
+            TranscriptSegment(text=item.text, start=item.start, duration=item.duration)
+            for item in transcript_data
+        ]
+    except Exception as e:
+        return None, f"텍스트 추출 실패: {str(e)}"
+
+    fetched = {
+        "segments": segments,
+        "language_code": target_transcript.language_code,
+        "is_generated": target_transcript.is_generated,
+    }
+    set_cached_transcript(video_id, fetched)
+    return fetched, None
+
+
+def list_transcripts(api, video_id: str):
+    """
+    YouTube 자막 목록 조회 (프록시 차단/연결 오류는 그대로 발생)
+
+    Returns:
+        (자막 트랙 리스트, 에러 메시지)
+    """
+    try:
+        transcript_list = api.list(video_id)
+    except Exception as e:
+        if is_route_error(e):
+            raise
+        return None, f"자막 목록 조회 실패: {str(e)}"
+
+    try:
+        return list(transcript_list), None
+    except Exception as e:
+        return None, f"자막 목록 변환 실패: {str(e)}"
+
+
+# ===== LLM 입력 전 자막 전처리 (로컬, 모델 호출 없음) =====
+
+# 자막 주석 태그: [음악], [박수], [웃음] 등
+CAPTION_TAG = re.compile(r'\[[^\]]{1,20}\]')
+
+# 바로 이어서 반복되는 구절을 찾을 최대 단어 수
+REPEAT_MAX_WORDS = 8
+
+# 같은 문장이 다시 나오면 제거할 범위 (직전 문장 수)
+SENTENCE_DEDUPE_WINDOW = 5
+
+# 추출 요약 단위 최대 토큰 수 (구두점 없는 자동 자막은 이 길이로 나눔)
+EXTRACT_UNIT_TOKENS = 60
+
+# TextRank 그래프 크기 제한: 연결에 쓰는 단어의 최대 등장 단위 수, 단위별 최대 이웃 수
+TEXTRANK_MAX_DF = 50
+TEXTRANK_NEIGHBORS = 20
+
+def remove_fillers(text: str) -> List[str]:
+    """자막 태그와 단독 추임새 제거 → 단어 리스트"""
+    return [w for w in CAPTION_TAG.sub(" ", text).split() if word_key(w) not in FILLER_WORDS]
+
+
+def collapse_repeats(words: List[str]) -> List[str]:
+    """바로 이어서 반복되는 구절(최대 REPEAT_MAX_WORDS 단어)을 한 번으로 축약"""
+    result, keys = [], []
+    for word in words:
+        result.append(word)
+        keys.append(word_key(word))
+        for n in range(min(REPEAT_MAX_WORDS, len(keys) // 2), 0, -1):
+            if keys[-n:] == keys[-2 * n:-n]:
+                del result[-n:]
+                del keys[-n:]
+                break
+    return result
+
+
+def dedupe_sentences(text: str) -> List[str]:
+    """직전 SENTENCE_DEDUPE_WINDOW 문장 안에 같은 문장이 있으면 제거"""
+    sentences, recent = [], []
+    for sentence in split_sentences(text):
+        key = word_key(sentence)
+        if key and key in recent:
+            continue
+        sentences.append(sentence)
+        recent = (recent + [key])[-SENTENCE_DEDUPE_WINDOW:]
+    return sentences
+
+
+def textrank_select(units: List[str], target_tokens: int) -> List[str]:
+    """
+    TextRank 방식 추출 요약 - 내용어가 겹치는 단위끼리 연결한 그래프에서
+    중요도가 높은 단위부터 목표 토큰 수까지 선택 (원래 순서 유지, 첫 단위는 후킹 분석용으로 항상 포함)
+    """
+    n = len(units)
+    word_sets = [set(content_words(u)) for u in units]
+
+    # 내용어 → 등장 단위 (너무 흔한 단어는 연결에서 제외)
+    postings: Dict[str, List[int]] = {}
+    for i, words in enumerate(word_sets):
+        for word in words:
+            postings.setdefault(word, []).append(i)
+    max_df = max(5, min(n // 20, TEXTRANK_MAX_DF))
+
+    overlaps: Dict[Tuple[int, int], int] = {}
+    for indexes in postings.values():
+        if len(indexes) > max_df:
+            continue
+        for a in range(len(indexes)):
+            for b in range(a + 1, len(indexes)):
+                pair = (indexes[a], indexes[b])
+                overlaps[pair] = overlaps.get(pair, 0) + 1
+
+    neighbors: List[List[Tuple[float, int]]] = [[] for _ in range(n)]
+    for (i, j), common in overlaps.items():
+        weight = common / (math.log(len(word_sets[i]) + 1) + math.log(len(word_sets[j]) + 1))
+        neighbors[i].append((weight, j))
+        neighbors[j].append((weight, i))
+
+    # 단위별 가중치 상위 이웃만 남겨서 그래프를 희소하게 유지
+    edges: List[List[Tuple[int, float]]] = [
+        [(j, w) for w, j in heapq.nlargest(TEXTRANK_NEIGHBORS, candidates)]
+        for candidates in neighbors
+    ]
+    out_weight = [sum(w for _, w in node_edges) for node_edges in edges]
+
+    damping = 0.85
+    scores = [1.0] * n
+    for _ in range(30):
+        scores = [
+            (1 - damping) + damping * sum(w / out_weight[j] * scores[j] for j, w in edges[i])
+            for i in range(n)
+        ]
+
+    selected, used = {0}, estimate_tokens(units[0])
+    for i in sorted(range(1, n), key=lambda i: scores[i], reverse=True):
+        tokens = estimate_tokens(units[i])
+        if used + tokens > target_tokens:
+            continue
+        selected.add(i)
+        used += tokens
+    return [units[i] for i in sorted(selected)]
+
+
+def compress_transcript(text: str, target_tokens: int = 0) -> str:
+    """
+    LLM 입력용 자막 압축 (CPU만 사용)
+    1. 자막 태그/추임새 제거  2. 바로 반복되는 구절 축약  3. 가까이 반복되는 문장 제거
+    4. target_tokens > 0 이고 그보다 길면 TextRank 추출 요약
+
+    Args:
+        text: 전체 자막 텍스트
+        target_tokens: 추출 요약 목표 토큰 수 (0이면 추출 요약 없음)
+
+    Returns:
+        압축된 자막 텍스트
+    """
+    words = collapse_repeats(remove_fillers(text))
+    sentences = dedupe_sentences(" ".join(words))
+
+    if target_tokens > 0 and estimate_tokens(" ".join(sentences)) > target_tokens:
+        units = []
+        for sentence in sentences:
+            if estimate_tokens(sentence) > EXTRACT_UNIT_TOKENS:
+                units.extend(split_words(sentence, EXTRACT_UNIT_TOKENS))
+            else:
+                units.append(sentence)
+        sentences = textrank_select(units, target_tokens)
+
+    return " ".join(sentences)
+
+
+async def prepare_transcript_for_llm(text: str) -> str:
+    """1단계 분석 전 자막 전처리 (설정으로 끌 수 있음, 워커 스레드에서 실행)"""
+    settings = get_settings()
+    if not settings.transcript_precompress_enabled:
+        return text
+
+    compressed = await asyncio.to_thread(
+        compress_transcript, text, settings.transcript_extractive_target_tokens
+    )
+    print(f"[Transcript] 전처리: 약 {estimate_tokens(text)} → {estimate_tokens(compressed)} 토큰", flush=True)
+    return compressed
@@ -0,0 +1,193 @@
+"""
+자막 디스크 캐시
+- SQLite 파일에 저장 (서버 재시작 후에도 유지, 워커 간 공유)
+- 자막 목록(listing): 영상별 사용 가능한 자막 트랙, TTL 경과 시 다시 조회
+- 자막 본문: video_id + 언어 + 자동생성 여부 해시를 키로 저장 (zstd 압축 JSON)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+from ..config import get_settings
+from .transcript_store import TranscriptSegment, compress, decompress
+
+_connection: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+# 캐시 통계 (프로세스 단위)
+_stats = {
+    "listing_hits": 0,
+    "listing_misses": 0,
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+}
+
+
+def get_transcript_cache_key(video_id: str, language_code: str, is_generated: bool) -> str:
+    """video_id + 언어 + 자동생성 여부로 캐시 키 생성"""
+    raw = f"{video_id}\x00{language_code}\x00{int(bool(is_generated))}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_connection() -> sqlite3.Connection:
+    """SQLite 연결 (최초 호출 시 테이블 생성)"""
+    global _connection
+
+    if _connection is None:
+        settings = get_settings()
+        directory = os.path.dirname(settings.transcript_cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        _connection = sqlite3.connect(settings.transcript_cache_path, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcript_listings (
+                video_id TEXT PRIMARY KEY,
+                tracks TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        _connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS transcripts (
+                key TEXT PRIMARY KEY,
+                video_id TEXT NOT NULL,
+                language_code TEXT NOT NULL,
+                is_generated INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        _connection.commit()
+
+    return _connection
+
+
+def get_cached_listing(video_id: str) -> Optional[List[Dict]]:
+    """
+    캐시된 자막 목록 조회
+
+    Returns:
+        [{"language_code", "language", "is_generated"}, ...] (만료/미존재 시 None, 자막 없음은 빈 리스트)
+    """
+    settings = get_settings()
+    if not settings.transcript_cache_enabled:
+        return None
+
+    try:
+        with _lock:
+            row = get_connection().execute(
+                "SELECT tracks, expires_at FROM transcript_listings WHERE video_id = ?",
+                (video_id,)
+            ).fetchone()
+
+            if row is None or row[1] < time.time():
+                _stats["listing_misses"] += 1
+                return None
+            _stats["listing_hits"] += 1
+        return json.loads(row[0])
+    except sqlite3.Error as e:
+        print(f"[TranscriptCache] 목록 조회 오류: {e}")
+        return None
+
+
+def set_cached_listing(video_id: str, tracks: List[Dict]) -> None:
+    """자막 목록 캐시 저장 (transcript_listing_ttl 동안 유지)"""
+    settings = get_settings()
+    if not settings.transcript_cache_enabled:
+        return
+
+    try:
+        with _lock:
+            conn = get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcript_listings (video_id, tracks, expires_at) VALUES (?, ?, ?)",
+                (video_id, json.dumps(tracks, ensure_ascii=False), time.time() + settings.transcript_listing_ttl)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[TranscriptCache] 목록 저장 오류: {e}")
+
+
+def get_cached_transcript(video_id: str, language_code: str, is_generated: bool) -> Optional[Dict]:
+    """
+    캐시된 자막 본문 조회
+
+    Returns:
+        {"segments", "language_code", "is_generated"} 또는 None
+    """
+    settings = get_settings()
+    if not settings.transcript_cache_enabled:
+        return None
+
+    key = get_transcript_cache_key(video_id, language_code, is_generated)
+    try:
+        with _lock:
+            row = get_connection().execute(
+                "SELECT payload FROM transcripts WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                _stats["misses"] += 1
+                return None
+            _stats["hits"] += 1
+    except sqlite3.Error as e:
+        print(f"[TranscriptCache] 조회 오류: {e}")
+        return None
+
+    segments = [
+        TranscriptSegment(text=text, start=start, duration=duration)
+        for text, start, duration in json.loads(decompress(row[0]))
+    ]
+    return {"segments": segments, "language_code": language_code, "is_generated": is_generated}
+
+
+def set_cached_transcript(video_id: str, fetched: Dict) -> None:
+    """자막 본문 캐시 저장 (fetch_transcript 결과)"""
+    settings = get_settings()
+    if not settings.transcript_cache_enabled:
+        return
+
+    language_code = fetched["language_code"]
+    is_generated = bool(fetched["is_generated"])
+    payload = compress(json.dumps(
+        [[s.text, s.start, s.duration] for s in fetched["segments"]],
+        ensure_ascii=False
+    ).encode("utf-8"))
+
+    try:
+        with _lock:
+            conn = get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO transcripts (key, video_id, language_code, is_generated, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (get_transcript_cache_key(video_id, language_code, is_generated),
+                 video_id, language_code, int(is_generated), payload, time.time())
+            )
+            _stats["writes"] += 1
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[TranscriptCache] 저장 오류: {e}")
+
+
+def get_transcript_cache_stats() -> Dict:
+    """자막 캐시 통계 조회"""
+    with _lock:
+        stats = dict(_stats)
+        try:
+            stats["entries"] = get_connection().execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+        except sqlite3.Error:
+            stats["entries"] = None
+
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+    return stats
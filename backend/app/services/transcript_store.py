@@ -0,0 +1,171 @@
+"""
+전체 자막 압축 저장 형식
+- 구간(segment) 배열을 열 단위로 분리: 시작 시각/길이(ms), 텍스트 내 시작 위치(uint32 배열)
+  증가하는 열(시작 시각, 시작 위치)은 이전 값과의 차이로 저장해서 압축률을 높임
+- 구간 텍스트는 공백으로 이어서 하나의 텍스트로 저장
+- 각 열을 zstd로 따로 압축 → 텍스트만 필요하면 시간 정보는 읽지도, 풀지도 않음
+- DB(bytea)에는 PostgREST 형식의 16진수 문자열("\\x...")로 주고받음
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional
+import zstandard
+
+# zstd 압축 레벨
+ZSTD_LEVEL = 10
+
+# 구간 열 컬럼 (시간 정보가 필요할 때만 조회)
+SEGMENT_COLUMNS = ("starts", "durations", "offsets")
+
+
+@dataclass
+class TranscriptSegment:
+    text: str
+    start: float
+    duration: float
+
+
+def compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+
+
+def decompress(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def pack_uint32(values: List[int]) -> bytes:
+    """uint32 배열 → 리틀 엔디언 바이트"""
+    packed = array("I", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_uint32(data: bytes) -> List[int]:
+    unpacked = array("I")
+    unpacked.frombytes(data)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+def delta_encode(values: List[int]) -> List[int]:
+    """증가하는 배열 → 이전 값과의 차이 배열 (음수는 0으로)"""
+    previous = 0
+    deltas = []
+    for value in values:
+        deltas.append(max(0, value - previous))
+        previous = max(previous, value)
+    return deltas
+
+
+def delta_decode(deltas: List[int]) -> List[int]:
+    values = []
+    total = 0
+    for delta in deltas:
+        total += delta
+        values.append(total)
+    return values
+
+
+def to_bytea(data: bytes) -> str:
+    """bytes → PostgREST bytea 입력 형식"""
+    return "\\x" + data.hex()
+
+
+def from_bytea(value) -> Optional[bytes]:
+    """PostgREST bytea 출력("\\x...") → bytes"""
+    if value is None:
+        return None
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    if value.startswith("\\x"):
+        return bytes.fromhex(value[2:])
+    return value.encode("utf-8")
+
+
+def encode_transcript(video_id: str, segments: List[TranscriptSegment],
+                      language_code: Optional[str] = None, is_generated: bool = False) -> Dict:
+    """
+    자막 구간 목록 → transcripts 테이블 행
+
+    Args:
+        segments: 자막 구간 (text, start, duration - 초 단위)
+
+    Returns:
+        transcripts 테이블에 저장할 dict
+    """
+    texts, offsets = [], []
+    position = 0
+    for segment in segments:
+        offsets.append(position)
+        texts.append(segment.text)
+        position += len(segment.text) + 1  # 구간 사이 공백
+
+    text = " ".join(texts)
+    return {
+        "video_id": video_id,
+        "language_code": language_code,
+        "is_generated": is_generated,
+        "codec": "zstd",
+        "segment_count": len(segments),
+        "text_length": len(text),
+        "starts": to_bytea(compress(pack_uint32(delta_encode([round(s.start * 1000) for s in segments])))),
+        "durations": to_bytea(compress(pack_uint32([round(s.duration * 1000) for s in segments]))),
+        "offsets": to_bytea(compress(pack_uint32(delta_encode(offsets)))),
+        "text_blob": to_bytea(compress(text.encode("utf-8"))),
+    }
+
+
+@dataclass
+class StoredTranscript:
+    """DB에서 읽은 압축 자막 (텍스트/구간은 처음 접근할 때 압축 해제)"""
+    video_id: str
+    language_code: Optional[str]
+    is_generated: bool
+    segment_count: int
+    text_blob: bytes = field(repr=False)
+    starts: Optional[bytes] = field(default=None, repr=False)
+    durations: Optional[bytes] = field(default=None, repr=False)
+    offsets: Optional[bytes] = field(default=None, repr=False)
+
+    @classmethod
+    def from_row(cls, row: Dict) -> "StoredTranscript":
+        return cls(
+            video_id=row["video_id"],
+            language_code=row.get("language_code"),
+            is_generated=bool(row.get("is_generated")),
+            segment_count=row.get("segment_count") or 0,
+            text_blob=from_bytea(row["text_blob"]),
+            starts=from_bytea(row.get("starts")),
+            durations=from_bytea(row.get("durations")),
+            offsets=from_bytea(row.get("offsets")),
+        )
+
+    @cached_property
+    def text(self) -> str:
+        return decompress(self.text_blob).decode("utf-8")
+
+    @cached_property
+    def segments(self) -> List[TranscriptSegment]:
+        """구간 목록 (구간 열을 함께 조회한 경우에만 사용 가능)"""
+        if self.starts is None or self.durations is None or self.offsets is None:
+            raise ValueError("구간 정보를 조회하지 않은 자막입니다.")
+
+        starts = delta_decode(unpack_uint32(decompress(self.starts)))
+        durations = unpack_uint32(decompress(self.durations))
+        offsets = delta_decode(unpack_uint32(decompress(self.offsets)))
+        text = self.text
+
+        segments = []
+        for i, offset in enumerate(offsets):
+            end = offsets[i + 1] - 1 if i + 1 < len(offsets) else len(text)
+            segments.append(TranscriptSegment(
+                text=text[offset:end],
+                start=starts[i] / 1000,
+                duration=durations[i] / 1000,
+            ))
+        return segments
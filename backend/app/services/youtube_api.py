@@ -1,3 +1,4 @@
+import asyncio
 from googleapiclient.discovery import build
 from typing import Optional, Dict
 from ..config import get_settings
@@ -14,19 +15,22 @@ async def get_video_info(video_id: str) -> Optional[Dict]:
     """
     YouTube Data API로 영상 메타 정보 + 성과 데이터 가져오기
 
+    블로킹 HTTP 호출(videos.list, channels.list)은 워커 스레드에서 실행하며,
+    호출 사이에서 취소되면 남은 호출은 보내지 않음
+
     Returns:
         Dict with video_id, title, channel_name, thumbnail_url,
         view_count, like_count, comment_count, subscriber_count, view_sub_ratio, published_at
     """
     try:
-        youtube = get_youtube_client()
+        youtube = await asyncio.to_thread(get_youtube_client)
 
         # snippet + statistics 함께 요청
         request = youtube.videos().list(
             part="snippet,statistics",
             id=video_id
         )
-        response = request.execute()
+        response = await asyncio.to_thread(request.execute)
 
         if not response.get('items'):
             return None
@@ -88,7 +92,7 @@ async def get_channel_subscriber_count(youtube, channel_id: str) -> Optional[int
             part="statistics",
             id=channel_id
         )
-        response = request.execute()
+        response = await asyncio.to_thread(request.execute)
 
         if not response.get('items'):
             return None
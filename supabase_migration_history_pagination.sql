@@ -0,0 +1,81 @@
+-- YouTube Analyzer - 히스토리 커서 페이지네이션 마이그레이션
+-- 기존 테이블이 있는 경우 이 스크립트를 실행하세요
+
+-- (created_at, id) 복합 인덱스 (커서 기반 페이지 조회용, 기존 created_at 단일 인덱스 대체)
+CREATE INDEX IF NOT EXISTS idx_analyses_created_at_id ON analyses(created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_analyses_created_at;
+
+-- 히스토리 총 개수
+-- 행 수가 기준치보다 적으면 정확한 개수, 많으면 통계(reltuples) 기반 추정치 반환
+CREATE OR REPLACE FUNCTION get_history_total(p_exact_threshold INT DEFAULT 10000)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_estimate BIGINT;
+BEGIN
+    SELECT reltuples::BIGINT INTO v_estimate
+    FROM pg_class
+    WHERE oid = 'public.analyses'::regclass;
+
+    -- 통계가 없거나(-1) 작은 테이블은 정확히 센다
+    IF v_estimate IS NULL OR v_estimate < p_exact_threshold THEN
+        RETURN jsonb_build_object('total', (SELECT COUNT(*) FROM analyses), 'estimated', false);
+    END IF;
+
+    RETURN jsonb_build_object('total', v_estimate, 'estimated', true);
+END;
+$$;
+
+-- 히스토리 페이지 조회 (한 번의 RPC로 페이지 + 선택적으로 총 개수)
+-- p_cursor_created_at/p_cursor_id: 이전 페이지 마지막 항목 (NULL이면 첫 페이지, 이때만 p_offset 사용)
+CREATE OR REPLACE FUNCTION get_history_page(
+    p_limit INT DEFAULT 20,
+    p_cursor_created_at TIMESTAMPTZ DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL,
+    p_offset INT DEFAULT 0,
+    p_with_count BOOLEAN DEFAULT FALSE
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    v_items JSONB;
+BEGIN
+    IF p_cursor_created_at IS NULL THEN
+        SELECT COALESCE(jsonb_agg(to_jsonb(page) ORDER BY page.created_at DESC, page.id DESC), '[]'::jsonb)
+        INTO v_items
+        FROM (
+            SELECT id, video_id, video_title, video_url, channel_name, thumbnail_url, created_at
+            FROM analyses
+            ORDER BY created_at DESC, id DESC
+            LIMIT p_limit
+            OFFSET p_offset
+        ) page;
+    ELSE
+        SELECT COALESCE(jsonb_agg(to_jsonb(page) ORDER BY page.created_at DESC, page.id DESC), '[]'::jsonb)
+        INTO v_items
+        FROM (
+            SELECT id, video_id, video_title, video_url, channel_name, thumbnail_url, created_at
+            FROM analyses
+            WHERE (created_at, id) < (p_cursor_created_at, p_cursor_id)
+            ORDER BY created_at DESC, id DESC
+            LIMIT p_limit
+        ) page;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'items', v_items,
+        'count', CASE WHEN p_with_count THEN get_history_total() ELSE NULL END
+    );
+END;
+$$;
+
+-- 함수 실행 권한
+GRANT EXECUTE ON FUNCTION get_history_total(INT) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_history_page(INT, TIMESTAMPTZ, UUID, INT, BOOLEAN) TO anon, authenticated;
+
+-- 확인 메시지
+SELECT '히스토리 커서 페이지네이션 마이그레이션이 완료되었습니다!' as message;
@@ -0,0 +1,81 @@
+-- YouTube Analyzer - JSONB 경로 단위 부분 수정 마이그레이션
+-- 기존 테이블이 있는 경우 이 스크립트를 실행하세요
+-- (supabase_migration_perspective_results.sql 실행 후 실행)
+
+-- 경로 단위 수정 목록 적용
+-- p_patches: [{"path": ["hidden_premises", "0", "source_url"], "value": "https://..."}, ...]
+CREATE OR REPLACE FUNCTION jsonb_apply_patches(p_doc JSONB, p_patches JSONB)
+RETURNS JSONB
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    v_patch JSONB;
+BEGIN
+    FOR v_patch IN SELECT * FROM jsonb_array_elements(p_patches) LOOP
+        p_doc := jsonb_set(
+            p_doc,
+            ARRAY(SELECT jsonb_array_elements_text(v_patch->'path')),
+            v_patch->'value',
+            true
+        );
+    END LOOP;
+    RETURN p_doc;
+END;
+$$;
+
+-- 분석 결과 JSONB 컬럼 부분 수정 (출처 URL 보정용)
+-- 문서 전체를 덮어쓰지 않고 행 잠금 후 현재 값에 경로별 수정만 적용
+-- p_perspective: 지정하면 현재 관점이 같을 때만 수정하고, 관점별 저장 결과(analysis_perspectives)도 함께 수정
+CREATE OR REPLACE FUNCTION patch_analysis_json(
+    p_analysis_id UUID,
+    p_column TEXT,
+    p_patches JSONB,
+    p_perspective TEXT DEFAULT NULL
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_doc JSONB;
+    v_child JSONB;
+BEGIN
+    IF p_column NOT IN ('source_tracking', 'critical_analysis', 'additional_analysis') THEN
+        RAISE EXCEPTION 'patch_analysis_json: 지원하지 않는 컬럼입니다: %', p_column;
+    END IF;
+
+    EXECUTE format(
+        'SELECT %I FROM analyses WHERE id = $1 AND ($2::TEXT IS NULL OR perspective = $2) FOR UPDATE',
+        p_column
+    ) INTO v_doc USING p_analysis_id, p_perspective;
+
+    IF v_doc IS NULL THEN
+        RETURN false;
+    END IF;
+
+    EXECUTE format('UPDATE analyses SET %I = $1 WHERE id = $2', p_column)
+    USING jsonb_apply_patches(v_doc, p_patches), p_analysis_id;
+
+    IF p_perspective IS NOT NULL AND p_column IN ('critical_analysis', 'additional_analysis') THEN
+        EXECUTE format(
+            'SELECT %I FROM analysis_perspectives WHERE analysis_id = $1 AND perspective = $2 FOR UPDATE',
+            p_column
+        ) INTO v_child USING p_analysis_id, p_perspective;
+
+        IF v_child IS NOT NULL THEN
+            EXECUTE format(
+                'UPDATE analysis_perspectives SET %I = $1, updated_at = NOW() WHERE analysis_id = $2 AND perspective = $3',
+                p_column
+            ) USING jsonb_apply_patches(v_child, p_patches), p_analysis_id, p_perspective;
+        END IF;
+    END IF;
+
+    RETURN true;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION jsonb_apply_patches(JSONB, JSONB) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION patch_analysis_json(UUID, TEXT, JSONB, TEXT) TO anon, authenticated;
+
+-- 확인 메시지
+SELECT 'JSONB 부분 수정 마이그레이션이 완료되었습니다!' as message;
@@ -0,0 +1,32 @@
+-- YouTube Analyzer - 관점별 분석 결과 저장 마이그레이션
+-- 기존 테이블이 있는 경우 이 스크립트를 실행하세요
+
+-- analysis_perspectives 테이블 생성 (분석 ID + 관점별 2단계/3단계 결과)
+-- analyses 행의 perspective / critical_analysis / additional_analysis는 현재 선택된 관점의 결과
+CREATE TABLE IF NOT EXISTS analysis_perspectives (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    analysis_id UUID NOT NULL REFERENCES analyses(id) ON DELETE CASCADE,
+    perspective TEXT NOT NULL,
+    -- 2단계: 비판적 분석
+    critical_analysis JSONB DEFAULT NULL,
+    -- 3단계: 추가 분석
+    additional_analysis JSONB DEFAULT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE (analysis_id, perspective)
+);
+
+-- 기존 analyses 행의 관점별 결과 옮기기
+INSERT INTO analysis_perspectives (analysis_id, perspective, critical_analysis, additional_analysis)
+SELECT id, perspective, critical_analysis, additional_analysis
+FROM analyses
+WHERE perspective IS NOT NULL AND critical_analysis IS NOT NULL
+ON CONFLICT (analysis_id, perspective) DO NOTHING;
+
+-- RLS 비활성화 및 권한 설정 (analyses 테이블과 동일)
+ALTER TABLE analysis_perspectives DISABLE ROW LEVEL SECURITY;
+GRANT ALL ON analysis_perspectives TO anon;
+GRANT ALL ON analysis_perspectives TO authenticated;
+
+-- 확인 메시지
+SELECT '관점별 분석 결과 저장 마이그레이션이 완료되었습니다!' as message;
@@ -0,0 +1,26 @@
+-- YouTube Analyzer - 전체 자막 압축 저장 마이그레이션
+-- 기존 테이블이 있는 경우 이 스크립트를 실행하세요
+
+-- transcripts 테이블 생성 (영상별 전체 자막, zstd 압축)
+-- 구간 배열은 열 단위로 저장: 시작 시각/길이(ms), 텍스트 내 시작 위치 + 전체 텍스트 1개
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT PRIMARY KEY,
+    language_code TEXT,
+    is_generated BOOLEAN DEFAULT FALSE,
+    codec TEXT NOT NULL DEFAULT 'zstd',
+    segment_count INT NOT NULL DEFAULT 0,
+    text_length INT NOT NULL DEFAULT 0,
+    starts BYTEA,       -- uint32 배열 (ms, 이전 구간과의 차이)
+    durations BYTEA,    -- uint32 배열 (ms)
+    offsets BYTEA,      -- uint32 배열 (text_blob 내 구간 시작 문자 위치, 이전 구간과의 차이)
+    text_blob BYTEA,    -- 공백으로 이은 전체 자막 텍스트 (UTF-8)
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- RLS 비활성화 및 권한 설정 (analyses 테이블과 동일)
+ALTER TABLE transcripts DISABLE ROW LEVEL SECURITY;
+GRANT ALL ON transcripts TO anon;
+GRANT ALL ON transcripts TO authenticated;
+
+-- 확인 메시지
+SELECT '전체 자막 압축 저장 마이그레이션이 완료되었습니다!' as message;
@@ -0,0 +1,75 @@
+-- YouTube Analyzer - video_id 중복 정리 함수 마이그레이션
+-- 기존 테이블이 있는 경우 이 스크립트를 실행하세요
+-- (supabase_migration_perspective_results.sql 실행 후 실행)
+-- 실행 순서:
+--   1. 이 스크립트 (정리 함수 생성)
+--   2. backend 폴더에서 python -m app.services.compaction (배치마다 따로 커밋하며 중복 정리)
+--   3. supabase_migration_video_id_unique_index.sql (유니크 인덱스 생성)
+
+-- 중복 분석 행 정리 (video_id별로 한 행만 남김, 한 번에 p_batch_size개 영상씩 처리)
+-- 남길 행: 1단계 결과 있음 → 2단계 결과 있음 → 최신 순
+-- 삭제되는 행의 관점별 결과는 남길 행으로 옮김
+CREATE OR REPLACE FUNCTION compact_duplicate_analyses(p_batch_size INT DEFAULT 100)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_video_id TEXT;
+    v_keeper analyses%ROWTYPE;
+    v_dup analyses%ROWTYPE;
+    v_removed INT := 0;
+    v_video_ids TEXT[] := '{}';
+BEGIN
+    FOR v_video_id IN
+        SELECT video_id FROM analyses GROUP BY video_id HAVING COUNT(*) > 1 LIMIT p_batch_size
+    LOOP
+        SELECT * INTO v_keeper
+        FROM analyses
+        WHERE video_id = v_video_id
+        ORDER BY (summary IS NOT NULL AND summary <> '') DESC,
+                 (critical_analysis IS NOT NULL) DESC,
+                 created_at DESC NULLS LAST,
+                 id DESC
+        LIMIT 1;
+
+        FOR v_dup IN SELECT * FROM analyses WHERE video_id = v_video_id AND id <> v_keeper.id LOOP
+            -- 관점별 결과 이동 (남길 행에 같은 관점 결과가 있으면 남길 행 우선)
+            UPDATE analysis_perspectives p
+            SET analysis_id = v_keeper.id
+            WHERE p.analysis_id = v_dup.id
+              AND NOT EXISTS (
+                  SELECT 1 FROM analysis_perspectives k
+                  WHERE k.analysis_id = v_keeper.id AND k.perspective = p.perspective
+              );
+
+            IF v_dup.perspective IS NOT NULL AND v_dup.critical_analysis IS NOT NULL THEN
+                INSERT INTO analysis_perspectives (analysis_id, perspective, critical_analysis, additional_analysis)
+                VALUES (v_keeper.id, v_dup.perspective, v_dup.critical_analysis, v_dup.additional_analysis)
+                ON CONFLICT (analysis_id, perspective) DO NOTHING;
+            END IF;
+
+            -- 남길 행에 2단계 결과가 없으면 중복 행의 결과 사용
+            IF v_keeper.critical_analysis IS NULL AND v_dup.critical_analysis IS NOT NULL THEN
+                UPDATE analyses
+                SET perspective = v_dup.perspective,
+                    critical_analysis = v_dup.critical_analysis,
+                    additional_analysis = v_dup.additional_analysis
+                WHERE id = v_keeper.id;
+                v_keeper.critical_analysis := v_dup.critical_analysis;
+            END IF;
+
+            DELETE FROM analyses WHERE id = v_dup.id;
+            v_removed := v_removed + 1;
+        END LOOP;
+
+        v_video_ids := array_append(v_video_ids, v_video_id);
+    END LOOP;
+
+    RETURN jsonb_build_object('removed', v_removed, 'video_ids', to_jsonb(v_video_ids));
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION compact_duplicate_analyses(INT) TO anon, authenticated;
+
+-- 확인 메시지
+SELECT 'video_id 중복 정리 함수 마이그레이션이 완료되었습니다!' as message;
@@ -0,0 +1,11 @@
+-- YouTube Analyzer - video_id 유니크 인덱스 마이그레이션
+-- supabase_migration_video_id_unique.sql 실행 후
+-- backend 폴더에서 python -m app.services.compaction 으로 중복을 모두 정리한 뒤 실행하세요
+-- (중복이 남아 있으면 인덱스 생성이 실패합니다)
+
+-- video_id 유니크 인덱스 (1단계 저장 upsert 기준, 기존 video_id 단일 인덱스 대체)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_analyses_video_id_unique ON analyses(video_id);
+DROP INDEX IF EXISTS idx_analyses_video_id;
+
+-- 확인 메시지
+SELECT 'video_id 유니크 인덱스 마이그레이션이 완료되었습니다!' as message;